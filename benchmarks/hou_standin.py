@@ -0,0 +1,674 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in for the parts of Houdini's `hou` module we benchmark.
+
+Only node networks, spare parameters and parameter templates, input
+connections and node references are implemented. Any other `hou` attribute
+resolves to a placeholder class, so the AYON Houdini modules can be
+imported, but calling it raises `NotImplementedError`.
+
+Call `install()` before importing any `ayon_houdini` module. It registers
+this module as `hou` and adds empty stand-ins for the Houdini Python
+modules that are imported at module level, like `stateutils`.
+"""
+import sys
+import types
+import copy
+
+# Houdini Python modules without `hou` functionality that are imported by
+# the AYON Houdini modules at import time.
+HOUDINI_MODULES = [
+    "stateutils",
+    "soptoolutils",
+    "loptoolutils",
+    "cop2toolutils",
+]
+
+# Attributes that must not exist, e.g. `hou.ui` only exists with a UI
+MISSING_ATTRIBUTES = {"ui"}
+
+_placeholders = {}
+
+
+class _PlaceholderType(type):
+    """Metaclass for unsupported `hou` classes, enums and functions."""
+
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _get_placeholder(f"{cls.__name__}.{name}")
+
+    def __call__(cls, *args, **kwargs):
+        raise NotImplementedError(
+            f"hou.{cls.__name__} is not supported by the hou stand-in")
+
+
+def _get_placeholder(name):
+    placeholder = _placeholders.get(name)
+    if placeholder is None:
+        placeholder = _PlaceholderType(name, (), {})
+        _placeholders[name] = placeholder
+    return placeholder
+
+
+def __getattr__(name):
+    if name.startswith("__") or name in MISSING_ATTRIBUTES:
+        raise AttributeError(name)
+    return _get_placeholder(name)
+
+
+class Error(Exception):
+    pass
+
+
+class OperationFailed(Error):
+    pass
+
+
+class ObjectWasDeleted(Error):
+    pass
+
+
+class stringParmType:  # noqa: N801
+    Regular = "Regular"
+    FileReference = "FileReference"
+    NodeReference = "NodeReference"
+    NodeReferenceList = "NodeReferenceList"
+
+
+class parmTemplateType:  # noqa: N801
+    Int = "Int"
+    Float = "Float"
+    String = "String"
+    Toggle = "Toggle"
+    Folder = "Folder"
+
+
+class ParmTemplate(object):
+    _type = None
+    _empty_value = None
+
+    def __init__(self, name, label, num_components=1, default_value=()):
+        self._name = name
+        self._label = label
+        self._num_components = num_components
+        self._default_value = tuple(default_value)
+
+    def name(self):
+        return self._name
+
+    def label(self):
+        return self._label
+
+    def type(self):
+        return self._type
+
+    def numComponents(self):
+        return self._num_components
+
+    def defaultValue(self):
+        return self._default_value
+
+    def setDefaultValue(self, default_value):
+        self._default_value = tuple(default_value)
+
+    def clone(self):
+        return copy.copy(self)
+
+    def _get_default(self):
+        if self._default_value:
+            return self._default_value[0]
+        return self._empty_value
+
+
+class StringParmTemplate(ParmTemplate):
+    _type = parmTemplateType.String
+    _empty_value = ""
+
+    def __init__(self, name, label, num_components=1, default_value=(),
+                 string_type=stringParmType.Regular, **kwargs):
+        super().__init__(name, label, num_components, default_value)
+        self._string_type = string_type
+
+    def stringType(self):
+        return self._string_type
+
+
+class IntParmTemplate(ParmTemplate):
+    _type = parmTemplateType.Int
+    _empty_value = 0
+
+    def __init__(self, name, label, num_components=1, default_value=(),
+                 **kwargs):
+        super().__init__(name, label, num_components, default_value)
+
+
+class FloatParmTemplate(ParmTemplate):
+    _type = parmTemplateType.Float
+    _empty_value = 0.0
+
+    def __init__(self, name, label, num_components=1, default_value=(),
+                 **kwargs):
+        super().__init__(name, label, num_components, default_value)
+
+
+class ToggleParmTemplate(ParmTemplate):
+    _type = parmTemplateType.Toggle
+    _empty_value = False
+
+    def __init__(self, name, label, default_value=False, **kwargs):
+        super().__init__(name, label, 1, (default_value,))
+
+    def defaultValue(self):
+        return self._default_value[0]
+
+    def setDefaultValue(self, default_value):
+        self._default_value = (default_value,)
+
+
+class FolderParmTemplate(ParmTemplate):
+    _type = parmTemplateType.Folder
+
+    def __init__(self, name, label, parm_templates=(), **kwargs):
+        super().__init__(name, label, 0, ())
+        self._parm_templates = [
+            template.clone() for template in parm_templates
+        ]
+
+    def clone(self):
+        clone = copy.copy(self)
+        clone._parm_templates = [
+            template.clone() for template in self._parm_templates
+        ]
+        return clone
+
+    def parmTemplates(self):
+        return tuple(self._parm_templates)
+
+    def setParmTemplates(self, parm_templates):
+        self._parm_templates = [
+            template.clone() for template in parm_templates
+        ]
+
+    def addParmTemplate(self, parm_template):
+        self._parm_templates.append(parm_template.clone())
+
+
+def _iter_templates(templates):
+    for template in templates:
+        yield template
+        if isinstance(template, FolderParmTemplate):
+            yield from _iter_templates(template._parm_templates)
+
+
+def _replace_template(templates, name, parm_template):
+    for index, template in enumerate(templates):
+        if template.name() == name:
+            templates[index] = parm_template.clone()
+            return True
+        if isinstance(template, FolderParmTemplate) and _replace_template(
+                template._parm_templates, name, parm_template):
+            return True
+    return False
+
+
+class ParmTemplateGroup(object):
+
+    def __init__(self, parm_templates=()):
+        self._entries = [template.clone() for template in parm_templates]
+
+    def entries(self):
+        return tuple(self._entries)
+
+    def parmTemplates(self):
+        return self.entries()
+
+    def append(self, parm_template):
+        parm_template = parm_template.clone()
+        if isinstance(parm_template, FolderParmTemplate):
+            # Houdini makes folder names unique, e.g. `folder0`, `folder1`
+            names = {template.name() for template in _iter_templates(
+                self._entries)}
+            name = parm_template.name()
+            index = 0
+            while name in names:
+                name = f"{parm_template.name()}{index}"
+                index += 1
+            parm_template._name = name
+        self._entries.append(parm_template)
+
+    def find(self, name):
+        for template in _iter_templates(self._entries):
+            if template.name() == name:
+                return template.clone()
+        return None
+
+    def findFolder(self, label):
+        for template in _iter_templates(self._entries):
+            if (
+                isinstance(template, FolderParmTemplate)
+                and template.label() == label
+            ):
+                return template.clone()
+        return None
+
+    def replace(self, name, parm_template):
+        if not _replace_template(self._entries, name, parm_template):
+            raise OperationFailed(f"Parm template not found: {name}")
+
+
+class Parm(object):
+    __slots__ = ("_node", "_template", "_value")
+
+    def __init__(self, node, template):
+        self._node = node
+        self._template = template
+        self._value = template._get_default()
+
+    def name(self):
+        return self._template.name()
+
+    def path(self):
+        return f"{self._node.path()}/{self.name()}"
+
+    def node(self):
+        return self._node
+
+    def parmTemplate(self):
+        return self._template
+
+    def eval(self):
+        return self._value
+
+    def evalAsString(self):
+        return str(self._value)
+
+    def unexpandedString(self):
+        return self._value
+
+    def rawValue(self):
+        return str(self._value)
+
+    def set(self, value):
+        self._value = value
+
+    def isAtDefault(self):
+        return self._value == self._template._get_default()
+
+    def revertToDefaults(self):
+        self._value = self._template._get_default()
+
+    def __repr__(self):
+        return f"<hou.Parm {self.name()} in {self._node.path()}>"
+
+
+class NodeTypeCategory(object):
+
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class NodeType(object):
+
+    def __init__(self, name, category):
+        self._name = name
+        self._category = category
+
+    def name(self):
+        return self._name
+
+    def category(self):
+        return self._category
+
+    def nameWithCategory(self):
+        return f"{self._category.name()}/{self._name}"
+
+
+_categories = {}
+_node_types = {}
+
+
+def _get_node_type(name, category_name):
+    key = (category_name, name)
+    node_type = _node_types.get(key)
+    if node_type is None:
+        node_type = NodeType(name, _get_category(category_name))
+        _node_types[key] = node_type
+    return node_type
+
+
+# Node type category of the children per network node type
+CHILD_CATEGORIES = {
+    "root": "Manager",
+    "obj": "Object",
+    "out": "Driver",
+    "stage": "Lop",
+    "geo": "Sop",
+    "subnet": None,
+}
+
+
+class Node(object):
+    __slots__ = (
+        "_name", "_parent", "_path", "_type", "_children", "_parms",
+        "_type_parm_names", "_group", "_inputs", "_locked",
+        "__weakref__",
+    )
+
+    def __init__(self, name, node_type, parent=None, parm_templates=()):
+        self._name = name
+        self._parent = parent
+        self._type = node_type
+        if parent is None:
+            self._path = "/"
+        elif parent._parent is None:
+            self._path = f"/{name}"
+        else:
+            self._path = f"{parent._path}/{name}"
+        self._children = {}
+        self._parms = {}
+        self._type_parm_names = set()
+        self._group = None
+        self._inputs = []
+        self._locked = False
+        for template in parm_templates:
+            self._type_parm_names.add(template.name())
+            self._parms[template.name()] = Parm(self, template)
+
+    def __repr__(self):
+        return f"<hou.Node at {self._path}>"
+
+    def name(self):
+        return self._name
+
+    def path(self):
+        return self._path
+
+    def type(self):
+        return self._type
+
+    def parent(self):
+        return self._parent
+
+    def children(self):
+        return tuple(self._children.values())
+
+    def allSubChildren(self, top_down=True, recurse_in_locked_nodes=True):
+        result = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node is not self:
+                result.append(node)
+                if node._locked and not recurse_in_locked_nodes:
+                    continue
+            stack.extend(reversed(node._children.values()))
+        return tuple(result)
+
+    def node(self, path):
+        if path.startswith("/"):
+            return node(path)
+        current = self
+        for name in path.split("/"):
+            if not name or name == ".":
+                continue
+            if name == "..":
+                current = current._parent
+            else:
+                current = current._children.get(name)
+            if current is None:
+                return None
+        return current
+
+    def createNode(self, node_type_name, node_name=None,
+                   parm_templates=()):
+        if node_name is None:
+            index = 1
+            while f"{node_type_name}{index}" in self._children:
+                index += 1
+            node_name = f"{node_type_name}{index}"
+        elif node_name in self._children:
+            raise OperationFailed(f"Node already exists: {node_name}")
+
+        category = CHILD_CATEGORIES.get(self._type.name())
+        if category is None:
+            category = self._type.category().name()
+        child = Node(
+            node_name,
+            _get_node_type(node_type_name, category),
+            parent=self,
+            parm_templates=parm_templates,
+        )
+        self._children[node_name] = child
+        return child
+
+    def destroy(self):
+        self._parent._children.pop(self._name, None)
+
+    def isLockedHDA(self):
+        return self._locked
+
+    def isInsideLockedHDA(self):
+        parent = self._parent
+        while parent is not None:
+            if parent._locked:
+                return True
+            parent = parent._parent
+        return False
+
+    def isEditableInsideLockedHDA(self):
+        return not self.isInsideLockedHDA()
+
+    def isBypassed(self):
+        return False
+
+    # Parameters
+    def parm(self, name):
+        return self._parms.get(name)
+
+    def parms(self):
+        return tuple(self._parms.values())
+
+    def spareParms(self):
+        return tuple(
+            parm for name, parm in self._parms.items()
+            if name not in self._type_parm_names
+        )
+
+    def evalParm(self, name):
+        parm = self._parms.get(name)
+        if parm is None:
+            raise OperationFailed(f"Invalid parameter name: {name}")
+        return parm._value
+
+    def parmTemplateGroup(self):
+        if self._group is not None:
+            return ParmTemplateGroup(self._group._entries)
+        return ParmTemplateGroup(
+            parm._template for parm in self._parms.values()
+        )
+
+    def setParmTemplateGroup(self, parm_template_group):
+        parms = {}
+        for template in _iter_templates(parm_template_group._entries):
+            if isinstance(template, FolderParmTemplate):
+                continue
+            parm = self._parms.get(template.name())
+            if parm is None:
+                parm = Parm(self, template)
+            else:
+                parm._template = template
+            parms[template.name()] = parm
+        # Parameters of the node type can't be removed
+        for name in self._type_parm_names:
+            parms.setdefault(name, self._parms[name])
+        self._parms = parms
+        self._group = ParmTemplateGroup(parm_template_group._entries)
+
+    # Connections
+    def setInput(self, input_index, item_to_become_input):
+        while len(self._inputs) <= input_index:
+            self._inputs.append(None)
+        self._inputs[input_index] = item_to_become_input
+
+    def inputs(self):
+        return tuple(self._inputs)
+
+    def inputAncestors(self, include_ref_inputs=True, follow_subnets=False,
+                       only_used_inputs=False):
+        ancestors = []
+        visited = {self}
+        stack = [node for node in self._inputs if node is not None]
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            ancestors.append(node)
+            stack.extend(
+                input_node for input_node in node._inputs
+                if input_node is not None
+            )
+        return tuple(ancestors)
+
+    def references(self, include_children=True):
+        """Return nodes referenced by node reference string parameters."""
+        references = []
+        for parm in self._parms.values():
+            template = parm._template
+            if (
+                template._type != parmTemplateType.String
+                or template._string_type not in (
+                    stringParmType.NodeReference,
+                    stringParmType.NodeReferenceList)
+                or not parm._value
+            ):
+                continue
+            for path in parm._value.split():
+                referenced_node = self.node(path)
+                if referenced_node is not None:
+                    references.append(referenced_node)
+        return tuple(references)
+
+
+_root = None
+
+
+def _create_root():
+    root = Node("", _get_node_type("root", "Director"))
+    for name in ("obj", "out", "stage"):
+        root._children[name] = Node(
+            name, _get_node_type(name, "Manager"), parent=root)
+    return root
+
+
+def node(path):
+    if not path.startswith("/"):
+        return None
+    current = _root
+    for name in path.split("/"):
+        if not name:
+            continue
+        current = current._children.get(name)
+        if current is None:
+            return None
+    return current
+
+
+def _get_category(name):
+    return _categories.setdefault(name, NodeTypeCategory(name))
+
+
+def nodeTypeCategories():
+    return dict(_categories)
+
+
+def objNodeTypeCategory():
+    return _get_category("Object")
+
+
+def sopNodeTypeCategory():
+    return _get_category("Sop")
+
+
+def lopNodeTypeCategory():
+    return _get_category("Lop")
+
+
+def cop2NodeTypeCategory():
+    return _get_category("Cop2")
+
+
+def ropNodeTypeCategory():
+    return _get_category("Driver")
+
+
+def isUIAvailable():
+    return False
+
+
+def fps():
+    return 24.0
+
+
+def frame():
+    return 1.0
+
+
+def applicationVersion():
+    return (20, 5, 0)
+
+
+def applicationVersionString():
+    return "20.5.0"
+
+
+def expandString(value):
+    return value
+
+
+class _HipFile(object):
+
+    def __init__(self):
+        self._path = "/tmp/untitled.hip"
+
+    def path(self):
+        return self._path
+
+    def basename(self):
+        return self._path.rsplit("/", 1)[-1]
+
+    def clear(self, suppress_save_prompt=True):
+        global _root
+        _root = _create_root()
+
+
+class _Logging(object):
+
+    def createSource(self, name):
+        pass
+
+
+hipFile = _HipFile()
+logging = _Logging()
+text = types.SimpleNamespace(expandString=expandString)
+
+hipFile.clear()
+
+
+class _HoudiniModule(types.ModuleType):
+    """Stand-in for a Houdini Python module with placeholder attributes."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _get_placeholder(f"{self.__name__}.{name}")
+
+
+def install():
+    """Register this module as `hou` and stand-ins for Houdini modules."""
+    sys.modules["hou"] = sys.modules[__name__]
+    for module_name in HOUDINI_MODULES:
+        sys.modules.setdefault(module_name, _HoudiniModule(module_name))
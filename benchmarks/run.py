@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""Benchmark scene-scale AYON Houdini API functions without Houdini.
+
+The functions run against synthetic scenes in an in-memory `hou` stand-in,
+see `hou_standin.py` and `scene.py`. The timings include the overhead of
+the stand-in, so they are only comparable with results of the same
+benchmark suite and not with timings inside Houdini.
+
+Usage:
+    python benchmarks/run.py --sizes 1000 10000 --output results.json
+    python benchmarks/run.py --compare baseline.json --threshold 1.2
+
+The AYON Houdini client dependencies (ayon-core client, ayon-python-api,
+pyblish-base, clique, qtpy, usd-core) must be importable, e.g. by adding
+the ayon-core `client` folder to `PYTHONPATH`.
+"""
+import os
+import sys
+import json
+import time
+import fnmatch
+import argparse
+import platform
+import itertools
+import statistics
+import subprocess
+import importlib.util
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARKS_DIR)
+CLIENT_DIR = os.path.join(REPO_ROOT, "client")
+COLLECT_INPUTS_PATH = os.path.join(
+    CLIENT_DIR, "ayon_houdini", "plugins", "publish", "collect_inputs.py")
+
+sys.path.insert(0, BENCHMARKS_DIR)
+
+import hou_standin  # noqa: E402
+
+hou_standin.install()
+
+import scene as scene_lib  # noqa: E402
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = [1000, 10000, 50000]
+
+# Benchmark name -> setup function returning the function to time
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark setup function.
+
+    The setup function receives the generated scene and the loaded modules
+    and returns a function without arguments which is timed.
+    """
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def load_modules():
+    """Import the modules to benchmark using the `hou` stand-in."""
+    sys.path.insert(0, CLIENT_DIR)
+    try:
+        from ayon_houdini.version import __version__
+        from ayon_houdini.api import lib, pipeline, plugin
+    except ImportError as exc:
+        raise SystemExit(
+            f"Unable to import AYON Houdini: {exc}\n"
+            "Make sure the ayon-core client and its dependencies are "
+            "importable, see the `benchmarks/README.md`."
+        )
+
+    spec = importlib.util.spec_from_file_location(
+        "collect_inputs", COLLECT_INPUTS_PATH)
+    collect_inputs = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(collect_inputs)
+
+    return {
+        "version": __version__,
+        "lib": lib,
+        "pipeline": pipeline,
+        "plugin": plugin,
+        "collect_inputs": collect_inputs,
+    }
+
+
+@benchmark("lib.lsattr")
+def bench_lsattr(scene, modules):
+    lsattr = modules["lib"].lsattr
+    return lambda: lsattr("id")
+
+
+@benchmark("lib.lsattr_value")
+def bench_lsattr_value(scene, modules):
+    lsattr = modules["lib"].lsattr
+    return lambda: lsattr("id", scene_lib.AYON_CONTAINER_ID)
+
+
+@benchmark("lib.lsattrs")
+def bench_lsattrs(scene, modules):
+    lsattrs = modules["lib"].lsattrs
+    return lambda: lsattrs({
+        "id": scene_lib.AYON_INSTANCE_ID,
+        "productType": "pointcache",
+    })
+
+
+@benchmark("lib.read")
+def bench_read(scene, modules):
+    read = modules["lib"].read
+    nodes = scene.containers + scene.instances
+    return lambda: [read(node) for node in nodes]
+
+
+@benchmark("lib.imprint")
+def bench_imprint(scene, modules):
+    imprint = modules["lib"].imprint
+    nodes = scene.instances[:100]
+    counter = itertools.count()
+
+    def run():
+        # Change the values each run so existing parms are replaced
+        index = next(counter)
+        for node in nodes:
+            imprint(node, {
+                "variant": f"Main{index}",
+                "active": bool(index % 2),
+                "creator_attributes": {"farm": bool(index % 2)},
+            }, update=True)
+    return run
+
+
+@benchmark("pipeline.parse_container")
+def bench_parse_container(scene, modules):
+    parse_container = modules["pipeline"].parse_container
+    return lambda: [parse_container(node) for node in scene.containers]
+
+
+@benchmark("pipeline.ls")
+def bench_ls(scene, modules):
+    ls = modules["pipeline"].ls
+    return lambda: list(ls())
+
+
+@benchmark("plugin.cache_instance_data")
+def bench_cache_instance_data(scene, modules):
+    cache_instance_data = (
+        modules["plugin"].HoudiniCreatorBase.cache_instance_data)
+    return lambda: cache_instance_data({})
+
+
+@benchmark("collect_inputs.iter_upstream")
+def bench_iter_upstream(scene, modules):
+    iter_upstream = modules["collect_inputs"].iter_upstream
+    outputs = [
+        instance.node(instance.evalParm("soppath"))
+        for instance in scene.instances
+    ]
+    return lambda: [list(iter_upstream(output)) for output in outputs]
+
+
+@benchmark("collect_inputs.input_containers")
+def bench_input_containers(scene, modules):
+    collect_inputs = modules["collect_inputs"]
+    ls = modules["pipeline"].ls
+    outputs = [
+        instance.node(instance.evalParm("soppath"))
+        for instance in scene.instances
+    ]
+
+    def run():
+        # Like `CollectUpstreamInputs` for all instances of a publish
+        container_index = collect_inputs.ContainerIndex(list(ls()))
+        upstream_cache = collect_inputs.UpstreamCache()
+        for output in outputs:
+            for node in upstream_cache.get_upstream(output):
+                container_index.get_containers(node.path())
+    return run
+
+
+def time_function(func, repeat):
+    """Return durations in seconds of calling `func` `repeat` times."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def get_git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes, names, repeat, seed, log=print):
+    modules = load_modules()
+    results = []
+    for size in sizes:
+        start = time.perf_counter()
+        scene = scene_lib.build_scene(size, seed=seed)
+        scene_data = scene.to_dict()
+        log(
+            f"Built scene with {scene_data['nodes']} nodes in "
+            f"{time.perf_counter() - start:.2f}s")
+
+        for name in names:
+            func = BENCHMARKS[name](scene, modules)
+            durations = time_function(func, repeat)
+            result = {
+                "name": name,
+                "size": size,
+                "scene": scene_data,
+                "repeat": repeat,
+                "durations": durations,
+                "min": min(durations),
+                "median": statistics.median(durations),
+                "mean": statistics.mean(durations),
+            }
+            results.append(result)
+            log(
+                f"{name:<32} {size:>8} nodes  "
+                f"median {result['median'] * 1000:10.3f} ms  "
+                f"min {result['min'] * 1000:10.3f} ms")
+
+    return {
+        "version": RESULTS_VERSION,
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "addon_version": modules["version"],
+            "git_revision": get_git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold, log=print):
+    """Log median ratio per benchmark and return the regressed benchmarks.
+
+    Args:
+        baseline (dict): Results to compare against.
+        current (dict): The new results.
+        threshold (float): Ratio of current to baseline median above which
+            a benchmark is considered a regression.
+
+    Returns:
+        list: Names and sizes of regressed benchmarks.
+
+    """
+    baseline_by_key = {
+        (result["name"], result["size"]): result
+        for result in baseline["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        key = (result["name"], result["size"])
+        baseline_result = baseline_by_key.get(key)
+        if baseline_result is None:
+            continue
+        ratio = result["median"] / max(baseline_result["median"], 1e-9)
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        log(
+            f"{result['name']:<32} {result['size']:>8} nodes  "
+            f"{baseline_result['median'] * 1000:10.3f} ms -> "
+            f"{result['median'] * 1000:10.3f} ms  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+        help="Approximate node counts of the generated scenes.")
+    parser.add_argument(
+        "--benchmark", dest="patterns", nargs="+", default=["*"],
+        help="Names or glob patterns of the benchmarks to run.")
+    parser.add_argument(
+        "--repeat", type=int, default=5,
+        help="Times to run each benchmark.")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Seed for the scene generation.")
+    parser.add_argument(
+        "--output", help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--compare", help="Compare against results in this JSON file.")
+    parser.add_argument(
+        "--threshold", type=float, default=1.2,
+        help="Median ratio above which a comparison fails.")
+    parser.add_argument(
+        "--list", action="store_true", help="List the benchmarks.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    names = [
+        name for name in BENCHMARKS
+        if any(fnmatch.fnmatch(name, pattern) for pattern in args.patterns)
+    ]
+    if not names:
+        parser.error(f"No benchmarks match: {' '.join(args.patterns)}")
+
+    results = run_benchmarks(args.sizes, names, args.repeat, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        if compare_results(baseline, results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
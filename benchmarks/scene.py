@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Generate synthetic AYON Houdini scenes in the `hou` stand-in.
+
+A scene consists of:
+    - Loaded containers under `/obj/AYON_CONTAINERS` with their container
+      spare parms, each containing a file and an output SOP.
+    - SOP networks in `/obj` that object merge the output of one or more
+      containers followed by a chain of SOPs with some merged branches.
+    - Publish instance ROPs in `/out` with their instance spare parms,
+      each pointing to the output of one of the SOP networks.
+
+Generation is deterministic for a given seed so results of runs with the
+same arguments are comparable.
+"""
+import json
+import random
+
+import hou
+
+# Keep in sync with `ayon_core.pipeline` and `ayon_houdini.api.lib`
+AYON_CONTAINER_ID = "ayon.load.container"
+AYON_INSTANCE_ID = "ayon.create.instance"
+JSON_PREFIX = "JSON:::"
+
+CONTAINERS_PATH = "/obj/AYON_CONTAINERS"
+
+# Node types used for the SOP chains
+SOP_TYPES = ["xform", "attribwrangle", "polyreduce", "normal", "blast"]
+
+
+class Scene(object):
+    """Nodes of a generated scene by their role in the AYON pipeline."""
+
+    def __init__(self):
+        self.containers = []
+        self.instances = []
+        self.output_nodes = []
+
+    @property
+    def node_count(self):
+        return len(hou.node("/").allSubChildren())
+
+    def to_dict(self):
+        return {
+            "nodes": self.node_count,
+            "containers": len(self.containers),
+            "instances": len(self.instances),
+        }
+
+
+def get_type_parm_templates():
+    """Return regular parm templates all generated nodes have."""
+    return [
+        hou.FloatParmTemplate("scale", "Scale", 1, default_value=(1.0,)),
+        hou.IntParmTemplate("group", "Group", 1, default_value=(0,)),
+        hou.StringParmTemplate("comment", "Comment", 1),
+    ]
+
+
+def add_spare_parms(node, data, folder="Extra"):
+    """Add spare parms with values like `ayon_houdini.api.lib.imprint`."""
+    templates = []
+    for key, value in data.items():
+        if isinstance(value, bool):
+            template = hou.ToggleParmTemplate(key, key, default_value=value)
+        elif isinstance(value, (dict, list)):
+            template = hou.StringParmTemplate(
+                key, key, 1, default_value=(JSON_PREFIX + json.dumps(value),))
+        else:
+            template = hou.StringParmTemplate(
+                key, key, 1, default_value=(str(value),))
+        templates.append(template)
+
+    group = node.parmTemplateGroup()
+    group.append(hou.FolderParmTemplate("folder", folder, templates))
+    node.setParmTemplateGroup(group)
+
+
+def create_node(parent, node_type, name=None, parm_templates=None):
+    if parm_templates is None:
+        parm_templates = get_type_parm_templates()
+    return parent.createNode(
+        node_type, node_name=name, parm_templates=parm_templates)
+
+
+def create_container(parent, index, rng):
+    name = f"product{index:06d}"
+    container = create_node(parent, "geo", f"{name}_CON")
+    file_node = create_node(container, "file")
+    output = create_node(container, "null", "OUT")
+    output.setInput(0, file_node)
+    add_spare_parms(container, {
+        "schema": "ayon:container-3.0",
+        "id": AYON_CONTAINER_ID,
+        "name": name,
+        "namespace": f"{name}_01",
+        "loader": "FileLoader",
+        "representation": "{:032x}".format(rng.getrandbits(128)),
+        "project_name": "benchmark",
+    })
+    return container
+
+
+def create_sop_network(parent, index, containers, chain_length, rng):
+    """Create SOP network merging container outputs into a SOP chain."""
+    geo = create_node(parent, "geo", f"geo{index:06d}")
+
+    object_merge = create_node(
+        geo,
+        "object_merge",
+        parm_templates=get_type_parm_templates() + [
+            hou.StringParmTemplate(
+                "objpath1",
+                "Object 1",
+                1,
+                string_type=hou.stringParmType.NodeReferenceList
+            )
+        ]
+    )
+    if containers:
+        merged = rng.sample(containers, min(len(containers), 3))
+        object_merge.parm("objpath1").set(" ".join(
+            f"{container.path()}/OUT" for container in merged
+        ))
+
+    previous = object_merge
+    chain = [object_merge]
+    for _ in range(max(chain_length - 2, 0)):
+        sop = create_node(geo, rng.choice(SOP_TYPES))
+        sop.setInput(0, previous)
+        if len(chain) > 4 and rng.random() < 0.1:
+            # Merge in an earlier branch of the chain
+            sop.setInput(1, rng.choice(chain[:-2]))
+        chain.append(sop)
+        previous = sop
+
+    output = create_node(geo, "null", "OUT")
+    output.setInput(0, previous)
+    return output
+
+
+def create_instance(parent, index, output, rng):
+    rop = create_node(
+        parent,
+        "rop_geometry",
+        f"pointcache{index:06d}",
+        parm_templates=get_type_parm_templates() + [
+            hou.StringParmTemplate(
+                "soppath",
+                "SOP Path",
+                1,
+                string_type=hou.stringParmType.NodeReference
+            )
+        ]
+    )
+    rop.parm("soppath").set(output.path())
+    variant = f"Main{index:06d}"
+    add_spare_parms(rop, {
+        "id": AYON_INSTANCE_ID,
+        "productType": "pointcache",
+        "productName": f"pointcache{variant}",
+        "creator_identifier": "io.ayon.creators.houdini.pointcache",
+        "variant": variant,
+        "folderPath": "/shots/sh010",
+        "task": "fx",
+        "active": True,
+        "creator_attributes": {"farm": False, "render_target": "local"},
+        "publish_attributes": {
+            "ValidateMeshIsStatic": {"active": rng.random() < 0.5}
+        },
+    }, folder="AYON")
+    return rop
+
+
+def build_scene(
+        node_count,
+        seed=0,
+        container_ratio=0.02,
+        instance_ratio=0.005,
+        chain_length=25):
+    """Build a scene of approximately `node_count` nodes.
+
+    The current scene of the `hou` stand-in is cleared first.
+
+    Args:
+        node_count (int): Approximate amount of nodes in the scene.
+        seed (int): Seed of the random generator.
+        container_ratio (float): Loaded containers per node.
+        instance_ratio (float): Publish instances per node.
+        chain_length (int): Amount of SOPs per SOP network.
+
+    Returns:
+        Scene: The generated scene.
+
+    """
+    hou.hipFile.clear(suppress_save_prompt=True)
+    rng = random.Random(seed)
+    scene = Scene()
+
+    containers_parent = create_node(
+        hou.node("/obj"), "subnet", CONTAINERS_PATH.rsplit("/", 1)[-1])
+    container_count = max(1, int(node_count * container_ratio))
+    for index in range(container_count):
+        scene.containers.append(
+            create_container(containers_parent, index, rng))
+
+    # Each container has 3 nodes, each SOP network `chain_length` + 1
+    instance_count = max(1, int(node_count * instance_ratio))
+    remaining = node_count - container_count * 3 - instance_count
+    network_count = max(1, remaining // (chain_length + 1))
+    obj = hou.node("/obj")
+    for index in range(network_count):
+        scene.output_nodes.append(create_sop_network(
+            obj, index, scene.containers, chain_length, rng))
+
+    out = hou.node("/out")
+    for index in range(instance_count):
+        output = rng.choice(scene.output_nodes)
+        scene.instances.append(create_instance(out, index, output, rng))
+
+    return scene
@@ -1,20 +1,26 @@
-from .pipeline import (
-    HoudiniHost,
-    ls,
-    containerise
-)
+"""AYON Houdini API.
 
-from .lib import (
-    lsattr,
-    lsattrs,
-    read,
-
-    maintained_selection
-)
+The attributes are imported from their modules on first access, so
+importing the package, e.g. on Houdini startup, does not import the
+modules and their dependencies like Qt or USD until they are used.
+"""
+import importlib
 
 import hou
 hou.logging.createSource("AYON")
 
+# Attribute name -> module it is imported from on first access
+_LAZY_ATTRIBUTES = {
+    "HoudiniHost": ".pipeline",
+    "ls": ".pipeline",
+    "containerise": ".pipeline",
+
+    "lsattr": ".lib",
+    "lsattrs": ".lib",
+    "read": ".lib",
+    "maintained_selection": ".lib",
+}
+
 __all__ = [
     "HoudiniHost",
 
@@ -28,3 +34,20 @@ __all__ = [
 
     "maintained_selection"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    # Store so later access does not go through `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -8,15 +8,25 @@ Houdini integration's `host.install()` method.
 
 """
 import contextlib
-import tempfile
 import logging
+import json
+import glob
 import os
 
 import ayon_api
 
-from ayon_core.pipeline import registered_host
+from ayon_core.pipeline import registered_host, get_current_project_name
 from ayon_core.pipeline.create import CreateContext
 from ayon_core.resources import get_ayon_icon_filepath
+from ayon_core.settings import get_current_project_settings
+from ayon_houdini.api.pipeline import CREATE_PATH
+from ayon_houdini.api.shelves import (
+    MAX_CACHED_SHELVES,
+    get_cache_key,
+    get_shelf_cache_dir,
+    remove_stale_shelf_files,
+)
+from ayon_houdini.version import __version__
 
 import hou
 import stateutils
@@ -159,64 +169,214 @@ def shelves_change_block():
         hou.shelves.endChangeBlock()
 
 
-def install():
-    """Install the Creator plug-ins to show in Houdini's TAB node search menu.
+def get_creator_plugin_paths():
+    """Return all registered creator plug-in paths, including addons'.
 
-    This function is re-entrant and can be called again to reinstall and
-    update the node definitions. For example during development it can be
-    useful to call it manually:
-        >>> from ayon_houdini.api.creator_node_shelves import install
-        >>> install()
+    Falls back to the Houdini creator plug-ins path when the registered
+    paths can't be queried.
+    """
+    try:
+        from ayon_core.pipeline.create import BaseCreator
+        from ayon_core.pipeline.plugin_discover import get_plugin_paths
+    except ImportError:
+        return [CREATE_PATH]
+    return list(get_plugin_paths(BaseCreator)) or [CREATE_PATH]
+
+
+def get_plugin_files(paths):
+    """Return modification time of the python files in the plug-in paths.
 
     Returns:
-        list: List of `hou.Tool` instances
+        List[Tuple[str, float]]: Modification time per filepath.
 
     """
+    plugin_files = []
+    for path in paths:
+        if os.path.isfile(path):
+            filepaths = [path]
+        else:
+            filepaths = glob.glob(
+                os.path.join(path, "**", "*.py"), recursive=True)
+        for filepath in filepaths:
+            try:
+                plugin_files.append(
+                    (os.path.normpath(filepath), os.path.getmtime(filepath)))
+            except OSError:
+                continue
+    return sorted(plugin_files)
 
-    host = registered_host()
 
-    # Store the filepath on the host
-    # TODO: Define a less hacky static shelf path for current houdini session
-    filepath_attr = "_creator_node_shelf_filepath"
-    filepath = getattr(host, filepath_attr, None)
-    if filepath is None:
-        f = tempfile.NamedTemporaryFile(prefix="houdini_creator_nodes_",
-                                        suffix=".shelf",
-                                        delete=False)
-        f.close()
-        filepath = f.name
-        setattr(host, filepath_attr, filepath)
-    elif os.path.exists(filepath):
-        # Remove any existing shelf file so that we can completey regenerate
-        # and update the tools file if creator identifiers change
-        os.remove(filepath)
+def get_source_key(icon, tab_menu_label):
+    """Return hash of everything the creators in the shelf depend on.
+
+    This can be computed without discovering the creator plug-ins, so a
+    cached shelf can be loaded without creating a `CreateContext`. It
+    consists of the addon version and bundle, the files of all registered
+    creator plug-in paths, the project's create settings and the tool icon
+    and menu label.
+
+    Args:
+        icon (str): Filepath to the icon of the tools.
+        tab_menu_label (str): TAB menu submenu to add the tools to.
+
+    Returns:
+        str: The source key.
+
+    """
+    plugin_files = get_plugin_files(get_creator_plugin_paths())
+    project_settings = get_current_project_settings()
+    return get_cache_key({
+        "addon_version": __version__,
+        "bundle": os.getenv("AYON_BUNDLE_NAME"),
+        "project_name": get_current_project_name(),
+        "create_settings": project_settings["houdini"]["create"],
+        "plugin_files": plugin_files,
+        "icon": icon,
+        "tab_menu_label": tab_menu_label,
+    })
+
+
+def get_tools_hash(creators_by_identifier, icon, tab_menu_label):
+    """Return hash of the content of the creator node shelf.
+
+    Args:
+        creators_by_identifier (Dict[str, Tuple[Creator, list]]): Creator
+            and its network categories by creator identifier.
+        icon (str): Filepath to the icon of the tools.
+        tab_menu_label (str): TAB menu submenu to add the tools to.
+
+    Returns:
+        str: The tools hash.
+
+    """
+    return get_cache_key({
+        "addon_version": __version__,
+        "icon": icon,
+        "tab_menu_label": tab_menu_label,
+        "creators": [
+            (
+                identifier,
+                creator.label,
+                sorted(category.name() for category in network_categories)
+            )
+            for identifier, (creator, network_categories) in sorted(
+                creators_by_identifier.items())
+        ],
+    })
+
+
+def _read_cache_manifest(cache_dir):
+    """Return tools hash by source key of the cached shelves."""
+    manifest_path = os.path.join(cache_dir, "manifest.json")
+    if not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as exc:
+        log.debug(f"Unable to read creator node shelf manifest: {exc}")
+        return {}
+
+
+def _write_cache_manifest(cache_dir, manifest):
+    """Write the manifest and remove stale shelves not in the manifest."""
+    # Keep only the most recently used sources
+    keys = list(manifest)[-MAX_CACHED_SHELVES:]
+    manifest = {key: manifest[key] for key in keys}
+    manifest_path = os.path.join(cache_dir, "manifest.json")
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=4)
+        os.replace(tmp_path, manifest_path)
+    except OSError as exc:
+        log.debug(f"Unable to write creator node shelf manifest: {exc}")
+        return
+
+    remove_stale_shelf_files(
+        cache_dir,
+        "creator_nodes_*.shelf",
+        used_filepaths=[
+            get_shelf_filepath(cache_dir, tools_hash)
+            for tools_hash in manifest.values()
+        ]
+    )
 
-    icon = get_ayon_icon_filepath()
-    tab_menu_label = os.environ.get("AYON_MENU_LABEL") or "AYON"
 
+def get_shelf_filepath(cache_dir, tools_hash):
+    return os.path.normpath(
+        os.path.join(cache_dir, f"creator_nodes_{tools_hash}.shelf"))
+
+
+def get_tab_menu_creators(host):
+    """Return creators to show in the TAB menu with their categories.
+
+    Returns:
+        Dict[str, Tuple[Creator, list]]: Creator and its network categories
+            by creator identifier.
+
+    """
     # Create context only to get creator plugins, so we don't reset and only
     # populate what we need to retrieve the list of creator plugins
     create_context = CreateContext(host, reset=False)
     create_context.reset_current_context()
     create_context._reset_creator_plugins()
 
-    log.debug("Writing AYON Creator nodes to shelf: {}".format(filepath))
-    tools = []
+    creators = {}
+    for identifier, creator in create_context.manual_creators.items():
 
-    with shelves_change_block():
-        for identifier, creator in create_context.manual_creators.items():
+        # Allow the creator plug-in itself to override the categories
+        # for where they are shown with `Creator.get_network_categories()`
+        if not hasattr(creator, "get_network_categories"):
+            log.debug("Creator {} has no `get_network_categories` method "
+                      "and will not be added to TAB search.")
+            continue
 
-            # Allow the creator plug-in itself to override the categories
-            # for where they are shown with `Creator.get_network_categories()`
-            if not hasattr(creator, "get_network_categories"):
-                log.debug("Creator {} has no `get_network_categories` method "
-                          "and will not be added to TAB search.")
-                continue
+        network_categories = creator.get_network_categories()
+        if not network_categories:
+            continue
+
+        creators[identifier] = (creator, network_categories)
+    return creators
+
+
+def get_installed_tools():
+    """Return the installed AYON creator tools."""
+    return [
+        tool for name, tool in hou.shelves.tools().items()
+        if name.startswith("ayon_create.")
+    ]
+
+
+def remove_stale_tools(filepath):
+    """Remove installed creator tools that are not from the shelf file.
+
+    Tools of a shelf file installed previously in this session would
+    otherwise remain alongside the tools of the newly loaded shelf file.
+
+    Args:
+        filepath (str): The shelf file whose tools to keep.
+
+    """
+    filepath = os.path.normpath(filepath)
+    for tool in get_installed_tools():
+        if os.path.normpath(tool.filePath()) != filepath:
+            tool.destroy()
 
-            network_categories = creator.get_network_categories()
-            if not network_categories:
-                continue
 
+def write_shelf(filepath, creators_by_identifier, icon, tab_menu_label):
+    """Write the creator tools to the shelf file.
+
+    Returns:
+        list: List of `hou.Tool` instances
+
+    """
+    log.debug("Writing AYON Creator nodes to shelf: {}".format(filepath))
+    tools = []
+    with shelves_change_block():
+        remove_stale_tools(filepath)
+        for identifier, (creator, network_categories) in (
+                creators_by_identifier.items()):
             key = "ayon_create.{}".format(identifier)
             log.debug(f"Registering {key}")
             script = CREATE_SCRIPT.format(identifier=identifier)
@@ -249,8 +409,80 @@ def install():
                 )
 
             tools.append(tool)
+    return tools
+
+
+def install(use_cache=True):
+    """Install the Creator plug-ins to show in Houdini's TAB node search menu.
+
+    This function is re-entrant and can be called again to reinstall and
+    update the node definitions. For example during development it can be
+    useful to call it manually:
+        >>> from ayon_houdini.api.creator_node_shelves import install
+        >>> install(use_cache=False)
+
+    The generated shelf is cached per user by a hash of the creator
+    identifiers, labels and network categories. On launch a key of the
+    sources of the creators, see `get_source_key`, is looked up first and
+    when it was seen before the cached shelf is loaded without discovering
+    the creator plug-ins.
+
+    Args:
+        use_cache (bool): Load the shelf from the cache when up to date.
+
+    Returns:
+        list: List of `hou.Tool` instances
+
+    """
+    host = registered_host()
+
+    icon = get_ayon_icon_filepath()
+    tab_menu_label = os.environ.get("AYON_MENU_LABEL") or "AYON"
+
+    cache_dir = get_shelf_cache_dir("creator_node_shelves")
+    manifest = _read_cache_manifest(cache_dir)
+    source_key = get_source_key(icon, tab_menu_label)
+
+    tools_hash = manifest.get(source_key)
+    if use_cache and tools_hash:
+        filepath = get_shelf_filepath(cache_dir, tools_hash)
+        if os.path.exists(filepath):
+            log.debug(
+                "Loading cached AYON Creator nodes shelf: {}".format(filepath))
+            remove_stale_tools(filepath)
+            hou.shelves.loadFile(filepath)
+            return get_installed_tools()
+
+    creators_by_identifier = get_tab_menu_creators(host)
+    tools_hash = get_tools_hash(
+        creators_by_identifier, icon, tab_menu_label)
+    filepath = get_shelf_filepath(cache_dir, tools_hash)
+    if use_cache and os.path.exists(filepath):
+        # Creators are unchanged, only their sources changed
+        tools = None
+    else:
+        if os.path.exists(filepath):
+            # Remove any existing shelf file so that we can completely
+            # regenerate and update the tools file
+            os.remove(filepath)
+        try:
+            tools = write_shelf(
+                filepath, creators_by_identifier, icon, tab_menu_label)
+        except Exception:
+            # Do not leave an incomplete shelf in the cache
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            raise
+
+    # Move the source key to the end as most recently used
+    manifest.pop(source_key, None)
+    manifest[source_key] = tools_hash
+    _write_cache_manifest(cache_dir, manifest)
 
     # Ensure the shelf is reloaded
+    remove_stale_tools(filepath)
     hou.shelves.loadFile(filepath)
 
+    if tools is None:
+        tools = get_installed_tools()
     return tools
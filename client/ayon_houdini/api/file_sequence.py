@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Compact, lazily expanded sequences of per-frame file paths."""
+import os
+import re
+from collections.abc import Sequence
+from typing import Iterable, List, Optional, Union
+
+import clique
+
+FRAME_TOKEN_REGEX = re.compile(r"%(0?)(\d*)d")
+
+
+class FileSequence(Sequence):
+    """Sequence of file paths, one per frame, expanded on access.
+
+    Only the printf-style path pattern and the frames are stored, so the
+    memory used does not grow with the amount of frames. It behaves like a
+    read-only list of file paths, e.g. it can be iterated, indexed and
+    sliced, and supports fast membership tests by parsing the frame number
+    from a path instead of comparing against all paths.
+
+    Args:
+        pattern (str): Path with a printf-style frame token like `%04d`.
+        frames (Iterable[int]): The frames of the sequence.
+
+    Raises:
+        ValueError: When the path has no frame token or a space padded
+            frame token like `%4d`.
+
+    Example:
+        >>> sequence = FileSequence("/out/beauty.%04d.exr", range(1, 101))
+        >>> sequence[0]
+        '/out/beauty.0001.exr'
+        >>> "/out/beauty.0050.exr" in sequence
+        True
+
+    """
+
+    def __init__(self, pattern: str, frames: Iterable[int]):
+        pattern = pattern.replace("\\", "/")
+        matches = list(FRAME_TOKEN_REGEX.finditer(pattern))
+        if not matches:
+            raise ValueError(f"Path has no frame token: {pattern}")
+
+        # Only the last frame token defines the frame
+        match = matches[-1]
+        if match.group(2) and not match.group(1):
+            # Frame numbers padded with spaces, like `%4d`, are not
+            # supported as file sequences
+            raise ValueError(
+                f"Space padded frame token is not supported: {pattern}")
+        self.pattern = pattern
+        self.head = pattern[:match.start()].replace("%%", "%")
+        self.tail = pattern[match.end():].replace("%%", "%")
+        self.padding = int(match.group(2) or 0)
+        if not isinstance(frames, range):
+            frames = tuple(sorted(set(frames)))
+        self.frames = frames
+        self._frame_set = None
+
+    @classmethod
+    def from_path(
+            cls,
+            path: str,
+            frames: Iterable[int]) -> Union["FileSequence", str]:
+        """Return file sequence for a path with `#` or `%04d` frame token.
+
+        Args:
+            path (str): Path with a frame token. A sequence of `#` defines
+                the frame padding, e.g. `####` becomes `0001` for frame 1.
+            frames (Iterable[int]): The frames of the sequence.
+
+        Returns:
+            Union[FileSequence, str]: The sequence, or the path itself when
+                it has no frame token and thus is a single file.
+
+        """
+        folder, filename = os.path.split(path)
+        if "#" in filename:
+            def replace(match):
+                return "%0{}d".format(len(match.group()))
+
+            filename = re.sub("#+", replace, filename)
+
+        if not FRAME_TOKEN_REGEX.search(filename):
+            # Not a sequence, single file
+            return path
+
+        return cls(os.path.join(folder, filename), frames)
+
+    @classmethod
+    def from_collection(cls, collection: clique.Collection) -> "FileSequence":
+        """Return file sequence for a `clique.Collection`."""
+        pattern = (
+            collection.head.replace("%", "%%")
+            + collection.format("{padding}")
+            + collection.tail.replace("%", "%%")
+        )
+        return cls(pattern, collection.indexes)
+
+    def to_collection(self) -> clique.Collection:
+        """Return the file sequence as a `clique.Collection`."""
+        return clique.Collection(
+            self.head, self.tail, self.padding, indexes=set(self.frames))
+
+    def path(self, frame: int) -> str:
+        """Return the file path for a frame."""
+        return "{}{}{}".format(
+            self.head, str(frame).zfill(self.padding), self.tail)
+
+    def frame(self, path: str) -> Optional[int]:
+        """Return the frame of a path in the sequence, None if not in it."""
+        path = path.replace("\\", "/")
+        if not (path.startswith(self.head) and path.endswith(self.tail)):
+            return None
+        token = path[len(self.head):len(path) - len(self.tail)]
+        try:
+            frame = int(token)
+        except ValueError:
+            return None
+        if frame not in self.frame_set or self.path(frame) != path:
+            return None
+        return frame
+
+    @property
+    def frame_set(self) -> "set[int]":
+        if self._frame_set is None:
+            self._frame_set = set(self.frames)
+        return self._frame_set
+
+    def missing_frames(self) -> List[int]:
+        """Return the frames whose file does not exist.
+
+        The folder is listed once instead of checking each file on disk.
+        """
+        folder, filename_head = os.path.split(self.head)
+        try:
+            filenames = set(os.listdir(folder or "."))
+        except OSError:
+            return list(self.frames)
+        return [
+            frame for frame in self.frames
+            if "{}{}{}".format(
+                filename_head, str(frame).zfill(self.padding), self.tail
+            ) not in filenames
+        ]
+
+    def exists(self) -> bool:
+        """Return whether the files of all frames exist."""
+        return not self.missing_frames()
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FileSequence(self.pattern, self.frames[index])
+        return self.path(self.frames[index])
+
+    def __iter__(self):
+        for frame in self.frames:
+            yield self.path(frame)
+
+    def __contains__(self, path):
+        if not isinstance(path, str):
+            return False
+        return self.frame(path) is not None
+
+    def __eq__(self, other):
+        if isinstance(other, FileSequence):
+            return (
+                self.pattern == other.pattern
+                and list(self.frames) == list(other.frames)
+            )
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return "<FileSequence {}>".format(self.to_collection().format())
+
+
+def generate_expected_files(
+        instance,
+        path: str) -> Union[FileSequence, List[str], str]:
+    """Return expected files for the frame range of the instance.
+
+    The filepath should have '#' token as placeholder for frame numbers or
+    should have %04d or %d placeholders. The `#` characters indicate frame
+    number and padding, e.g. #### becomes 0001 for frame 1.
+
+    Instances rendered on the farm get a plain list of file paths, since
+    the farm submission and publish job plug-ins expect lists.
+
+    Args:
+        instance (pyblish.api.Instance): The publish instance.
+        path (str): The filepath to generate the output files for.
+
+    Returns:
+        Union[FileSequence, List[str], str]: Filepath per frame, or the
+            filepath itself when it is a single file.
+
+    """
+    frames = range(int(instance.data["frameStartHandle"]),
+                   int(instance.data["frameEndHandle"]) + 1)
+    expected_files = FileSequence.from_path(path, frames)
+    if isinstance(expected_files, FileSequence) and instance.data.get("farm"):
+        return list(expected_files)
+    return expected_files
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""Vectorized inspection of `hou.Geometry` attributes using NumPy.
+
+Iterating over per-primitive tuples in Python gets very slow on geometry
+with millions of primitives. These helpers read the attribute values into
+NumPy arrays once, using the `hou` buffer APIs for numeric attributes, and
+do the checks in NumPy instead.
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+import hou
+
+# NumPy dtype per `hou.numericData` type of numeric attribute buffers. The
+# values are read with 64-bit precision so 64-bit attributes are not
+# truncated, lower precisions are converted without loss.
+NUMERIC_DTYPES = {
+    hou.attribData.Float: (hou.numericData.Float64, np.float64),
+    hou.attribData.Int: (hou.numericData.Int64, np.int64),
+}
+
+
+def get_prim_count(geo: hou.Geometry) -> int:
+    """Return amount of primitives without creating `hou.Prim` objects."""
+    return geo.intrinsicValue("primitivecount")
+
+
+def get_prim_attrib_array(geo: hou.Geometry, name: str) -> np.ndarray:
+    """Return the values of a primitive attribute as a NumPy array.
+
+    Numeric attributes are read from the raw attribute buffer and have one
+    row per primitive with a column per component when the attribute has
+    more than one component. String attributes are returned as an array of
+    Python strings.
+
+    Args:
+        geo (hou.Geometry): The geometry to read from.
+        name (str): Name of the primitive attribute.
+
+    Returns:
+        np.ndarray: The values per primitive.
+
+    Raises:
+        ValueError: When the attribute does not exist.
+
+    """
+    attrib = geo.findPrimAttrib(name)
+    if attrib is None:
+        raise ValueError(f"Primitive attribute does not exist: {name}")
+
+    data_type = attrib.dataType()
+    if data_type == hou.attribData.String:
+        return np.array(geo.primStringAttribValues(name), dtype=object)
+
+    numeric_type, dtype = NUMERIC_DTYPES[data_type]
+    if data_type == hou.attribData.Float:
+        buffer = geo.primFloatAttribValuesAsString(
+            name, float_type=numeric_type)
+    else:
+        buffer = geo.primIntAttribValuesAsString(
+            name, int_type=numeric_type)
+    values = np.frombuffer(buffer, dtype=dtype)
+    if attrib.size() > 1:
+        values = values.reshape(-1, attrib.size())
+    return values
+
+
+def find_empty_string_prims(geo: hou.Geometry, name: str) -> np.ndarray:
+    """Return primitive numbers with an empty value for string attribute.
+
+    Args:
+        geo (hou.Geometry): The geometry to check.
+        name (str): Name of the primitive string attribute.
+
+    Returns:
+        np.ndarray: Primitive numbers with an empty string value.
+
+    """
+    attrib = geo.findPrimAttrib(name)
+    if attrib is None:
+        raise ValueError(f"Primitive attribute does not exist: {name}")
+
+    values = geo.primStringAttribValues(name)
+    # Avoid building the array when no value is empty
+    if "" not in values:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.array(values, dtype=object) == "")
+
+
+def factorize_prim_attrib(
+        geo: hou.Geometry, name: str) -> Tuple[list, np.ndarray]:
+    """Return unique values of a primitive attribute and a code per prim.
+
+    String attributes are factorized through the attribute's string table
+    instead of sorting the Python strings. Numeric attributes with more
+    than one component are factorized per tuple of components.
+
+    Args:
+        geo (hou.Geometry): The geometry to read from.
+        name (str): Name of the primitive attribute.
+
+    Returns:
+        Tuple[list, np.ndarray]: Unique values and the index into them
+            per primitive.
+
+    Raises:
+        ValueError: When the attribute does not exist.
+
+    """
+    attrib = geo.findPrimAttrib(name)
+    if attrib is None:
+        raise ValueError(f"Primitive attribute does not exist: {name}")
+
+    if attrib.dataType() == hou.attribData.String:
+        codes_by_value = {
+            value: code for code, value in enumerate(attrib.strings())
+        }
+        values = geo.primStringAttribValues(name)
+        # Values not in the string table, like empty strings, are added
+        codes = np.fromiter(
+            (
+                codes_by_value.setdefault(value, len(codes_by_value))
+                for value in values
+            ),
+            dtype=np.int64,
+            count=len(values)
+        )
+        return list(codes_by_value), codes
+
+    values = get_prim_attrib_array(geo, name)
+    if values.ndim > 1:
+        unique, codes = np.unique(values, axis=0, return_inverse=True)
+        return [tuple(row) for row in unique.tolist()], codes.reshape(-1)
+    unique, codes = np.unique(values, return_inverse=True)
+    return unique.tolist(), codes
+
+
+def find_inconsistent_values(
+        geo: hou.Geometry,
+        key_attrib: str,
+        value_attrib: str,
+        key_codes: Optional[Tuple[list, np.ndarray]] = None
+) -> Dict[str, list]:
+    """Return key values whose primitives have more than one value.
+
+    For example with `path` as key and `material` as value attribute this
+    returns all paths that have primitives with different materials.
+
+    Args:
+        geo (hou.Geometry): The geometry to check.
+        key_attrib (str): Name of primitive attribute to group by.
+        value_attrib (str): Name of primitive attribute that should be
+            unique within each group.
+        key_codes (Optional[Tuple[list, np.ndarray]]): The key attribute
+            factorized with `factorize_prim_attrib`, to only read it once
+            when checking multiple value attributes.
+
+    Returns:
+        Dict[str, list]: Unique values per inconsistent key.
+
+    """
+    if key_codes is None:
+        key_codes = factorize_prim_attrib(geo, key_attrib)
+    keys, key_codes = key_codes
+    values, value_codes = factorize_prim_attrib(geo, value_attrib)
+
+    # Unique combinations of key and value
+    pairs = np.unique(
+        key_codes.astype(np.int64) * len(values) + value_codes)
+    pair_key_codes = pairs // len(values)
+    counts = np.bincount(pair_key_codes, minlength=len(keys))
+
+    inconsistent = {}
+    for key_code in np.flatnonzero(counts > 1):
+        value_codes = pairs[pair_key_codes == key_code] % len(values)
+        inconsistent[keys[key_code]] = [
+            values[code] for code in value_codes.tolist()
+        ]
+    return inconsistent
+
+
+def find_prims_not_of_type(
+        geo: hou.Geometry,
+        prim_type: hou.primType) -> np.ndarray:
+    """Return primitive numbers of all primitives not of the given type.
+
+    Only the primitives of the given type are turned into `hou.Prim`
+    objects, so this is fast when most primitives are of another type or
+    when there are only few primitives of the given type, like VDBs.
+
+    Args:
+        geo (hou.Geometry): The geometry to check.
+        prim_type (hou.primType): The allowed primitive type.
+
+    Returns:
+        np.ndarray: Sorted primitive numbers not of the given type.
+
+    """
+    num_prims = get_prim_count(geo)
+    if geo.countPrimType(prim_type) == num_prims:
+        return np.empty(0, dtype=np.int64)
+
+    of_type = np.fromiter(
+        (prim.number() for prim in geo.primsOfType(prim_type)),
+        dtype=np.int64)
+    return np.setdiff1d(np.arange(num_prims), of_type, assume_unique=True)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""Report the time spent importing each Python module.
+
+Used to measure the import overhead of AYON on Houdini startup on artist
+workstations and in farm hython sessions. Set the environment variable
+`AYON_HOUDINI_IMPORT_REPORT` to enable it on startup:
+    - `1` prints the slowest imports.
+    - A path to a `.json` file also writes all import times to that file.
+
+This module only depends on the standard library so it can be imported
+before anything else is imported.
+"""
+import os
+import sys
+import json
+import time
+import importlib.abc
+from contextlib import contextmanager
+
+IMPORT_REPORT_ENV = "AYON_HOUDINI_IMPORT_REPORT"
+
+
+class ImportRecord(object):
+    """Import time of a single module.
+
+    Attributes:
+        name (str): Full name of the module.
+        depth (int): Amount of imports it was nested in.
+        start (float): Start time relative to the start of recording.
+        cumulative (float): Seconds spent executing the module, including
+            the imports it triggered.
+        self_time (float): Seconds spent executing the module, excluding
+            the imports it triggered.
+
+    """
+
+    def __init__(self, name, depth, start):
+        self.name = name
+        self.depth = depth
+        self.start = start
+        self.cumulative = 0.0
+        self.self_time = 0.0
+        self.child_time = 0.0
+
+    def to_dict(self):
+        return {
+            "module": self.name,
+            "depth": self.depth,
+            "start_ms": self.start * 1000.0,
+            "self_ms": self.self_time * 1000.0,
+            "cumulative_ms": self.cumulative * 1000.0,
+        }
+
+
+class _TimedLoader(object):
+    """Loader wrapper timing the execution of the module."""
+
+    def __init__(self, loader, recorder):
+        self._loader = loader
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._recorder.record(module.__name__):
+            self._loader.exec_module(module)
+
+
+class ImportRecorder(importlib.abc.MetaPathFinder):
+    """Record the import time of all modules imported while installed.
+
+    The recorder is added at the front of `sys.meta_path` and wraps the
+    loader of every module spec found by the other finders to time the
+    execution of the module.
+
+    Example:
+        >>> with ImportRecorder() as recorder:
+        ...     import ayon_houdini.api.pipeline
+        >>> print(recorder.format_report())
+
+    """
+
+    def __init__(self):
+        self.records = []
+        self._stack = []
+        self._start = None
+        self._finding = set()
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        sys.meta_path.insert(0, self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        # Avoid recursion when finders import modules themselves
+        if fullname in self._finding:
+            return None
+
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self:
+                    continue
+                find_spec = getattr(finder, "find_spec", None)
+                if find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding.discard(fullname)
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    @contextmanager
+    def record(self, name):
+        """Record the time spent in the context as import of module."""
+        start = time.perf_counter()
+        record = ImportRecord(name, len(self._stack), start - self._start)
+        self.records.append(record)
+        self._stack.append(record)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            record.cumulative = time.perf_counter() - start
+            record.self_time = record.cumulative - record.child_time
+            if self._stack:
+                self._stack[-1].child_time += record.cumulative
+
+    @property
+    def total(self):
+        """Seconds spent importing top level modules."""
+        return sum(
+            record.cumulative for record in self.records
+            if record.depth == 0
+        )
+
+    def format_report(self, limit=30):
+        """Return report of the modules with the highest self time."""
+        records = sorted(
+            self.records, key=lambda record: record.self_time, reverse=True)
+        lines = [
+            f"Imported {len(self.records)} modules in "
+            f"{self.total * 1000.0:.1f} ms",
+            f"{'self ms':>10} {'cumul. ms':>10}  module",
+        ]
+        for record in records[:limit]:
+            lines.append(
+                f"{record.self_time * 1000.0:10.1f} "
+                f"{record.cumulative * 1000.0:10.1f}  {record.name}"
+            )
+        return "\n".join(lines)
+
+    def write(self, path):
+        """Write the import times as JSON file in import order."""
+        with open(path, "w") as f:
+            json.dump({
+                "total_ms": self.total * 1000.0,
+                "imports": [record.to_dict() for record in self.records],
+            }, f, indent=4)
+
+
+@contextmanager
+def report_imports(label="AYON startup"):
+    """Report imports in the context if enabled by the environment.
+
+    See the module docstring for `AYON_HOUDINI_IMPORT_REPORT` values.
+    """
+    value = os.getenv(IMPORT_REPORT_ENV, "").strip()
+    if not value or value.lower() in {"0", "false", "no", "off"}:
+        yield None
+        return
+
+    with ImportRecorder() as recorder:
+        yield recorder
+
+    print(f"{label} import report:\n{recorder.format_report()}")
+    if value.lower().endswith(".json"):
+        try:
+            recorder.write(value)
+        except OSError as exc:
+            print(f"Unable to write import report to {value}: {exc}")
@@ -5,7 +5,9 @@ import errno
 import re
 import logging
 import json
+import time
 import clique
+import contextlib
 from functools import lru_cache
 from contextlib import contextmanager
 
@@ -27,8 +29,8 @@ from ayon_core.pipeline.context_tools import get_current_task_entity
 from ayon_core.pipeline.workfile.workfile_template_builder import (
     TemplateProfileNotFound
 )
-from ayon_core.tools.utils import PopupUpdateKeys, SimplePopup
-from ayon_core.tools.utils.host_tools import get_tool_by_name
+
+from .file_sequence import FileSequence
 
 
 self = sys.modules[__name__]
@@ -239,6 +241,8 @@ def validate_fps():
         if parent is None:
             pass
         else:
+            from ayon_core.tools.utils import PopupUpdateKeys
+
             dialog = PopupUpdateKeys(parent=parent)
             dialog.setModal(True)
             dialog.setWindowTitle("Houdini scene does not match project FPS")
@@ -256,7 +260,431 @@ def validate_fps():
     return True
 
 
-def render_rop(ropnode, frame_range=None):
+class RenderManifest(object):
+    """Per-frame record of the output a ROP node completed rendering.
+
+    Frames are appended as JSON lines to the manifest file once Houdini
+    reports them as completed, so a partially written frame of a cancelled
+    render is never part of the manifest. The first line is a header that
+    identifies the saved workfile the frames were rendered from, so that a
+    manifest is only reused when the workfile did not change since. A
+    completion record is appended once a render finished, so only the
+    manifest of an interrupted render is resumed.
+
+    Args:
+        path (str): Path to the manifest file.
+        source (dict): Identifies what the frames were rendered from.
+        filepaths_by_frame (Optional[dict[int, list[str]]]): Expected
+            output files per frame, e.g. of all AOVs, to record for each
+            completed frame. Defaults to the file of the ROP's output
+            parameter.
+
+    """
+
+    def __init__(self, path, source, filepaths_by_frame=None):
+        self.path = path
+        self.source = source
+        self.filepaths_by_frame = filepaths_by_frame
+        # frame -> {"files": {path: size}, "time": timestamp}
+        self.frames = {}
+        # Normalized paths of all recorded files for fast lookups
+        self._files = set()
+        # Whether the last render recorded to the manifest finished
+        self.complete = False
+        self._initialized = False
+
+    @staticmethod
+    def get_source(rop_node):
+        """Return data identifying the saved workfile state for a ROP."""
+        hip_path = hou.hipFile.path()
+        mtime = None
+        if os.path.exists(hip_path):
+            mtime = os.path.getmtime(hip_path)
+        return {
+            "workfile": hip_path,
+            "mtime": mtime,
+            "rop": rop_node.path(),
+        }
+
+    @staticmethod
+    def normalize(path):
+        return os.path.normpath(path).replace("\\", "/")
+
+    @classmethod
+    def load(cls, path, rop_node, filepaths_by_frame=None):
+        """Load the manifest for a ROP node from file.
+
+        Records of a previous render are only kept when they were rendered
+        from the same saved workfile, otherwise an empty manifest is
+        returned that overwrites the file on the first recorded frame.
+
+        Args:
+            path (str): Path to the manifest file.
+            rop_node (hou.RopNode): The ROP node the manifest is for.
+            filepaths_by_frame (Optional[dict[int, list[str]]]): Expected
+                output files per frame to record for completed frames.
+
+        Returns:
+            RenderManifest: The manifest.
+
+        """
+        manifest = cls(path,
+                       source=cls.get_source(rop_node),
+                       filepaths_by_frame=filepaths_by_frame)
+        if not os.path.isfile(path):
+            return manifest
+
+        try:
+            with open(path, "r") as f:
+                header = json.loads(f.readline())
+                if header.get("source") != manifest.source:
+                    return manifest
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if record.get("complete"):
+                        manifest.complete = True
+                        continue
+                    manifest._add_record(record)
+                    manifest.complete = False
+        except (OSError, ValueError, KeyError) as exc:
+            log.debug(f"Ignoring invalid render manifest {path}: {exc}")
+            manifest.frames.clear()
+            manifest._files.clear()
+            manifest.complete = False
+            return manifest
+
+        manifest._initialized = True
+        return manifest
+
+    def _write(self, data, mode):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, mode) as f:
+            f.write(json.dumps(data) + "\n")
+
+    def reset(self):
+        """Clear all recorded frames."""
+        self.frames.clear()
+        self._files.clear()
+        self.complete = False
+        self._write({"source": self.source}, "w")
+        self._initialized = True
+
+    def add_frame(self, frame, filepaths):
+        """Record a completed frame with its output files.
+
+        Args:
+            frame (float): The completed frame.
+            filepaths (list[str]): Output files written for the frame.
+
+        """
+        if not self._initialized:
+            self.reset()
+
+        files = {}
+        for filepath in filepaths:
+            filepath = self.normalize(filepath)
+            try:
+                files[filepath] = os.path.getsize(filepath)
+            except OSError:
+                continue
+
+        record = {"frame": frame, "files": files, "time": time.time()}
+        self._add_record(record)
+        self.complete = False
+        self._write(record, "a")
+
+    def _add_record(self, record):
+        previous = self.frames.get(record["frame"])
+        if previous is not None:
+            self._files.difference_update(previous["files"])
+        self.frames[record["frame"]] = record
+        self._files.update(record["files"])
+
+    def mark_complete(self):
+        """Record that the render finished without being interrupted."""
+        if not self._initialized:
+            self.reset()
+        self.complete = True
+        self._write({"complete": True, "time": time.time()}, "a")
+
+    def completed_frames(self, verify=False):
+        """Return the recorded frames.
+
+        Args:
+            verify (bool): When enabled only return frames whose output
+                files still exist with the recorded file size.
+
+        Returns:
+            set[float]: The completed frames.
+
+        """
+        if not verify:
+            return set(self.frames)
+
+        completed = set()
+        for frame, record in self.frames.items():
+            for filepath, size in record["files"].items():
+                try:
+                    if os.path.getsize(filepath) != size:
+                        break
+                except OSError:
+                    break
+            else:
+                completed.add(frame)
+        return completed
+
+    def has_file(self, filepath):
+        """Return whether the file was recorded as completely written."""
+        return self.normalize(filepath) in self._files
+
+
+def _get_rop_sidecar_path(ropnode, prefix, ext):
+    """Return path of a hidden file next to the ROP node's output files."""
+    try:
+        output_parm = get_output_parameter(ropnode)
+    except TypeError:
+        return None
+    if output_parm is None:
+        return None
+
+    # Do not write next to relative or missing outputs, which would end
+    # up in the current working directory
+    output_dir = os.path.dirname(output_parm.eval())
+    if not output_dir or not os.path.isabs(output_dir):
+        return None
+
+    name = ropnode.path().strip("/").replace("/", "_")
+    return os.path.join(output_dir, f".{prefix}.{name}{ext}")
+
+
+def get_render_manifest_path(ropnode):
+    """Return the render manifest file path for a ROP node.
+
+    The manifest is stored next to the ROP's output files.
+
+    Args:
+        ropnode (hou.RopNode): The ROP node.
+
+    Returns:
+        Optional[str]: The manifest path or None if the ROP node has no
+            supported output parameter or its output path is not absolute.
+
+    """
+    return _get_rop_sidecar_path(ropnode, "ayon_render_manifest", ".jsonl")
+
+
+def get_render_telemetry_path(ropnode):
+    """Return the render telemetry sidecar file path for a ROP node.
+
+    The telemetry is stored next to the ROP's output files.
+
+    Args:
+        ropnode (hou.RopNode): The ROP node.
+
+    Returns:
+        Optional[str]: The telemetry path or None if the ROP node has no
+            supported output parameter or its output path is not absolute.
+
+    """
+    return _get_rop_sidecar_path(ropnode, "ayon_render_telemetry", ".json")
+
+
+@contextmanager
+def render_manifest_callback(ropnode, manifest):
+    """Record each frame the ROP node completes rendering in the manifest.
+
+    This installs a temporary render event callback on the ROP node that
+    is removed again when the context exits.
+
+    Args:
+        ropnode (hou.RopNode): The ROP node to render.
+        manifest (RenderManifest): The manifest to record the frames to.
+
+    """
+    try:
+        output_parm = get_output_parameter(ropnode)
+    except TypeError:
+        output_parm = None
+
+    def on_render_event(rop_node, event_type, render_time):
+        if event_type != hou.ropRenderEventType.PostFrame:
+            return
+        frame = hou.timeToFrame(render_time)
+        if manifest.filepaths_by_frame is not None:
+            filepaths = manifest.filepaths_by_frame.get(frame, [])
+        elif output_parm is not None:
+            filepaths = [output_parm.evalAtFrame(frame)]
+        else:
+            filepaths = []
+        manifest.add_frame(frame, filepaths)
+
+    ropnode.addRenderEventCallback(on_render_event)
+    try:
+        yield
+    finally:
+        ropnode.removeRenderEventCallback(on_render_event)
+
+
+class RenderTelemetry(object):
+    """Timing and resource usage collected while rendering a ROP node.
+
+    Each rendered frame range is recorded with its wall time, the time
+    between the pre-frame and post-frame events of each frame, the bytes
+    written to the output files and the peak resident memory sampled at
+    the end of each frame.
+
+    Args:
+        rop_path (str): Path of the ROP node that is rendered.
+        filepaths_by_frame (Optional[dict[int, list[str]]]): Expected
+            output files per frame, e.g. of all AOVs, to sum the bytes
+            written. Defaults to the file of the ROP's output parameter.
+
+    """
+
+    def __init__(self, rop_path, filepaths_by_frame=None):
+        self.rop_path = rop_path
+        self.filepaths_by_frame = filepaths_by_frame
+        self.ranges = []
+
+    def add_range(self, frame_range, duration, frames=None,
+                  output_bytes=0, peak_rss=None, method="local"):
+        """Record a rendered frame range.
+
+        Args:
+            frame_range (tuple): Start, end and (optional) step rendered.
+                Empty when the ROP node's own frame range was rendered.
+            duration (float): Wall time of the render in seconds.
+            frames (Optional[dict]): Render time in seconds per frame.
+            output_bytes (int): Bytes written to the output files.
+            peak_rss (Optional[int]): Peak resident memory in bytes.
+            method (str): How the range was rendered, e.g. `local` or
+                `hython_workers`.
+
+        Returns:
+            dict: The recorded range.
+
+        """
+        record = {
+            "frame_range": list(frame_range),
+            "method": method,
+            "duration": duration,
+            "frames": frames or {},
+            "output_bytes": output_bytes,
+            "peak_rss": peak_rss,
+        }
+        self.ranges.append(record)
+        return record
+
+    @contextmanager
+    def record(self, ropnode, frame_range=()):
+        """Record a frame range rendered by the ROP node within the context.
+
+        Args:
+            ropnode (hou.RopNode): The ROP node that is rendered.
+            frame_range (tuple): Start, end and (optional) step rendered.
+
+        """
+        output_parm = None
+        if self.filepaths_by_frame is None:
+            try:
+                output_parm = get_output_parameter(ropnode)
+            except TypeError:
+                pass
+
+        frames = {}
+        frame_start_times = {}
+        state = {"output_bytes": 0, "peak_rss": get_process_memory_usage()}
+
+        def on_render_event(rop_node, event_type, render_time):
+            frame = hou.timeToFrame(render_time)
+            if event_type == hou.ropRenderEventType.PreFrame:
+                frame_start_times[frame] = time.time()
+                return
+            if event_type != hou.ropRenderEventType.PostFrame:
+                return
+
+            start_time = frame_start_times.pop(frame, None)
+            if start_time is not None:
+                frames[frame] = time.time() - start_time
+
+            if self.filepaths_by_frame is not None:
+                filepaths = self.filepaths_by_frame.get(frame, [])
+            elif output_parm is not None:
+                filepaths = [output_parm.evalAtFrame(frame)]
+            else:
+                filepaths = []
+            for filepath in filepaths:
+                try:
+                    state["output_bytes"] += os.path.getsize(filepath)
+                except OSError:
+                    pass
+
+            rss = get_process_memory_usage()
+            if rss is not None and (
+                state["peak_rss"] is None or rss > state["peak_rss"]
+            ):
+                state["peak_rss"] = rss
+
+        start = time.time()
+        ropnode.addRenderEventCallback(on_render_event)
+        try:
+            yield
+        finally:
+            ropnode.removeRenderEventCallback(on_render_event)
+            self.add_range(
+                frame_range,
+                duration=time.time() - start,
+                frames=frames,
+                output_bytes=state["output_bytes"],
+                peak_rss=state["peak_rss"],
+            )
+
+    def to_dict(self):
+        """Return the telemetry with totals as JSON serializable dict."""
+        frame_times = [
+            frame_time
+            for record in self.ranges
+            for frame_time in record["frames"].values()
+        ]
+        peak_rss_values = [
+            record["peak_rss"] for record in self.ranges
+            if record["peak_rss"] is not None
+        ]
+        return {
+            "rop": self.rop_path,
+            "duration": sum(record["duration"] for record in self.ranges),
+            "frame_count": len(frame_times),
+            "frame_time_mean": (
+                sum(frame_times) / len(frame_times) if frame_times else None
+            ),
+            "frame_time_max": max(frame_times) if frame_times else None,
+            "output_bytes": sum(
+                record["output_bytes"] for record in self.ranges),
+            "peak_rss": max(peak_rss_values) if peak_rss_values else None,
+            # JSON requires string keys
+            "ranges": [
+                dict(record, frames={
+                    str(frame): frame_time
+                    for frame, frame_time in record["frames"].items()
+                })
+                for record in self.ranges
+            ],
+        }
+
+    def write(self, path):
+        """Write the telemetry to a JSON file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+
+def render_rop(ropnode, frame_range=None, manifest=None, telemetry=None):
     """Render ROP node utility for Publishing.
 
     This renders a ROP node with the settings we want during Publishing.
@@ -271,6 +699,10 @@ def render_rop(ropnode, frame_range=None):
             doesn't specify a frame increment, then a value of 1 will be
             used. If no frame range is given, and the ROP node doesn't
             specify a frame range, then the current frame will be rendered.
+        manifest (Optional[RenderManifest]): When provided each completed
+            frame is recorded to the manifest.
+        telemetry (Optional[RenderTelemetry]): When provided the render
+            time, output size and memory usage are recorded to it.
     """
 
     if frame_range is None:
@@ -281,13 +713,20 @@ def render_rop(ropnode, frame_range=None):
 
     # Render
     try:
-        ropnode.render(verbose=verbose,
-                       # Allow Deadline to capture completion percentage
-                       output_progress=verbose,
-                       # Render only this node
-                       # (do not render any of its dependencies)
-                       ignore_inputs=True,
-                       frame_range=frame_range)
+        with contextlib.ExitStack() as stack:
+            if manifest is not None:
+                stack.enter_context(
+                    render_manifest_callback(ropnode, manifest))
+            if telemetry is not None:
+                stack.enter_context(
+                    telemetry.record(ropnode, frame_range))
+            ropnode.render(verbose=verbose,
+                           # Allow Deadline to capture completion percentage
+                           output_progress=verbose,
+                           # Render only this node
+                           # (do not render any of its dependencies)
+                           ignore_inputs=True,
+                           frame_range=frame_range)
     except hou.Error as exc:
         # The hou.Error is not inherited from a Python Exception class,
         # so we explicitly capture the houdini error, otherwise pyblish
@@ -297,6 +736,54 @@ def render_rop(ropnode, frame_range=None):
         raise RuntimeError("Render failed: {0}".format(exc))
 
 
+def get_process_memory_usage():
+    """Return the resident memory usage of the current process in bytes.
+
+    Uses `psutil` when available and falls back to `/proc/self/statm` on
+    Linux. Returns None when the memory usage can't be queried.
+
+    Returns:
+        Optional[int]: Resident set size in bytes.
+
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def log_memory_usage(label, logger=None):
+    """Log the current process memory usage with a label for the phase.
+
+    Args:
+        label (str): Label of the phase to log the memory usage for.
+        logger (Optional[logging.Logger]): Logger to log to.
+
+    Returns:
+        Optional[int]: Resident set size in bytes.
+
+    """
+    if logger is None:
+        logger = log
+
+    memory = get_process_memory_usage()
+    if memory is None:
+        logger.debug(f"Memory usage ({label}): unknown")
+    else:
+        logger.debug(f"Memory usage ({label}): {memory / 1024 ** 2:.1f} MB")
+    return memory
+
+
 def imprint(node, data, update=False, folder="Extra", prefix=""):
     """Store attributes with value on a node
 
@@ -502,6 +989,26 @@ def maintained_selection():
                 node.setSelected(on=True)
 
 
+@contextmanager
+def manual_update_mode():
+    """Pause cooking and viewport updates on changes during the context.
+
+    Houdini updates once when the previous update mode is restored on exit.
+
+    Example:
+        >>> with manual_update_mode():
+        ...     for node in nodes:
+        ...         node.setParms({"file": path})
+
+    """
+    previous_mode = hou.updateModeSetting()
+    hou.setUpdateMode(hou.updateMode.Manual)
+    try:
+        yield
+    finally:
+        hou.setUpdateMode(previous_mode)
+
+
 @contextmanager
 def parm_values(overrides):
     """Override Parameter values during the context.
@@ -1063,6 +1570,8 @@ def update_houdini_vars_context_dialog():
         for var, (old, new, _is_directory) in update_vars.items()
     )
 
+    from ayon_core.tools.utils import SimplePopup
+
     # TODO: Use better UI!
     parent = hou.ui.mainQtWindow()
     dialog = SimplePopup(parent=parent)
@@ -1083,6 +1592,7 @@ def publisher_show_and_publish(comment=None):
     Args:
         comment (Optional[str]): Comment to set in publisher window.
     """
+    from ayon_core.tools.utils.host_tools import get_tool_by_name
 
     main_window = get_main_window()
     publisher_window = get_tool_by_name(
@@ -1667,6 +2177,57 @@ def format_as_collections(
     return result
 
 
+def get_missing_frames(
+    expected_files: "dict[str, FileSequence | list[str] | str]",
+    frames: "list[int]"
+) -> "set[int]":
+    """Return frames for which any of the expected files does not exist.
+
+    Each folder is listed only once instead of checking each expected file
+    on disk separately.
+
+    Arguments:
+        expected_files (dict[str, FileSequence | list[str] | str]): Expected
+            files per AOV. Lists of files must be in the same frame order as
+            `frames`.
+            A single file is considered to contain all frames.
+        frames (list[int]): The frames of the frame range.
+
+    Returns:
+        set[int]: Frames with missing files.
+
+    """
+    listed_dirs: "dict[str, set[str]]" = {}
+
+    def exists(filepath: str) -> bool:
+        directory, filename = os.path.split(filepath)
+        if directory not in listed_dirs:
+            try:
+                listed_dirs[directory] = set(os.listdir(directory or "."))
+            except OSError:
+                listed_dirs[directory] = set()
+        return filename in listed_dirs[directory]
+
+    missing = set()
+    for files in expected_files.values():
+        if isinstance(files, FileSequence):
+            missing.update(
+                set(files.missing_frames()).intersection(frames))
+            continue
+
+        if isinstance(files, str) or len(files) != len(frames):
+            files = [files] if isinstance(files, str) else files
+            if not all(exists(filepath) for filepath in files):
+                return set(frames)
+            continue
+
+        for frame, filepath in zip(frames, files):
+            if frame not in missing and not exists(filepath):
+                missing.add(frame)
+
+    return missing
+
+
 def save_slapcomp_to_file(
         slapcomp_out: hou.CopNode,
         filepath: str
@@ -1770,3 +2331,136 @@ def disconnect_node(node: hou.Node, inputs: bool=True, outputs: bool=True):
     if outputs:
         for conn in reversed(node.outputConnections()):
             disconnect_connection(conn)
+
+
+class GeometryCookCache(object):
+    """Cache of cooked SOP geometry shared by publish plug-ins.
+
+    Validators that inspect the output geometry of the same SOP node at the
+    same frame get the same read-only `hou.Geometry`, so that the node is
+    only cooked once per publish. Cached geometry is only reused as long as
+    the node did not cook again since, e.g. because of a parameter change
+    or because it was cooked at another frame.
+
+    """
+
+    def __init__(self):
+        # (node session id, frame) -> (cook count, geometry)
+        self._geometry = {}
+        self.cooks = 0
+        self.hits = 0
+
+    def get(self, sop_node, frame, force=False):
+        """Return the read-only geometry of the SOP node at the frame.
+
+        Args:
+            sop_node (hou.SopNode): The node to get the geometry for.
+            frame (float): The frame to cook the node at.
+            force (bool): Force the node to cook, even if Houdini considers
+                it to not be dirty. Geometry cached for the frame is still
+                reused.
+
+        Returns:
+            Optional[hou.Geometry]: The geometry or None if the node is not
+                a SOP node.
+
+        """
+        if not hasattr(sop_node, "geometry"):
+            return None
+
+        key = (sop_node.sessionId(), float(frame))
+        cached = self._geometry.get(key)
+        if cached is not None and cached[0] == sop_node.cookCount():
+            self.hits += 1
+            return cached[1]
+
+        if force:
+            with update_mode_context(hou.updateMode.AutoUpdate):
+                sop_node.cook(force=True, frame_range=(frame, frame))
+        geometry = sop_node.geometryAtFrame(frame)
+        self.cooks += 1
+        self._geometry[key] = (sop_node.cookCount(), geometry)
+        return geometry
+
+    def get_samples(self, sop_node, frames, force=False):
+        """Return the read-only geometry of the SOP node per frame.
+
+        Args:
+            sop_node (hou.SopNode): The node to get the geometry for.
+            frames (list[float]): The frames to cook the node at.
+            force (bool): Force the node to cook the frames.
+
+        Returns:
+            dict[float, Optional[hou.Geometry]]: Geometry per frame.
+
+        """
+        return {
+            frame: self.get(sop_node, frame, force=force)
+            for frame in frames
+        }
+
+    def clear(self):
+        """Release all cached geometry."""
+        self._geometry.clear()
+
+
+def get_geometry_cook_cache(context):
+    """Return the geometry cook cache of the publish context.
+
+    Args:
+        context (pyblish.api.Context): The publish context.
+
+    Returns:
+        GeometryCookCache: The cache shared by all plug-ins of the publish.
+
+    """
+    cache = context.data.get("houdiniGeometryCookCache")
+    if cache is None:
+        cache = GeometryCookCache()
+        context.data["houdiniGeometryCookCache"] = cache
+    return cache
+
+
+def get_sample_frames(instance, samples=("first",)):
+    """Return the frames of the instance to sample the output geometry at.
+
+    Args:
+        instance (pyblish.api.Instance): The publish instance.
+        samples (Iterable[str]): Any of `first`, `middle` and `last`.
+
+    Returns:
+        list[float]: The unique frames in frame order.
+
+    """
+    start = instance.data.get("frameStart", 0)
+    end = instance.data.get("frameEnd", start)
+    frames_by_sample = {
+        "first": start,
+        "middle": start + int((end - start) / 2),
+        "last": end,
+    }
+    return sorted({frames_by_sample[sample] for sample in samples})
+
+
+def iter_dependency_nodes(node):
+    """Yield all nodes the given node cooks from, including itself.
+
+    This includes input ancestors, nodes referenced by parameters and the
+    children of any subnetwork along the way.
+    """
+    processed = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        path = node.path()
+        if path in processed:
+            continue
+        processed.add(path)
+        yield node
+
+        stack.extend(node.inputs())
+        stack.extend(node.references(include_children=False))
+        if node.isNetwork() and not node.isLockedHDA():
+            stack.extend(node.children())
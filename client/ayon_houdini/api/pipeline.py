@@ -4,12 +4,12 @@ import os
 import json
 import logging
 import warnings
-from typing import Optional
+import contextlib
+from typing import Dict, List, Optional
 
 import hou  # noqa
 
 from ayon_core.host import HostBase, IWorkfileHost, ILoadHost, IPublishHost
-from ayon_core.tools.utils import host_tools
 import pyblish.api
 
 from ayon_core.pipeline import (
@@ -22,7 +22,6 @@ from ayon_core.pipeline import (
 )
 from ayon_core.pipeline.load import any_outdated_containers
 from ayon_houdini import HOUDINI_HOST_DIR
-from ayon_houdini.api import lib, shelves, creator_node_shelves
 
 from ayon_core.lib import (
     register_event_callback,
@@ -30,7 +29,6 @@ from ayon_core.lib import (
     env_value_to_bool,
 )
 
-from .lib import JSON_PREFIX
 
 
 log = logging.getLogger("ayon_houdini")
@@ -44,6 +42,12 @@ LEGACY_CONTEXT_CONTAINER = "/obj/OpenPypeContext"
 
 IS_HEADLESS = not hasattr(hou, "ui")
 
+# Environment variable to force the install profile of the host, either
+# "full" or "farm". Defaults to "farm" when the Houdini UI is not available.
+INSTALL_PROFILE_ENV = "AYON_HOUDINI_INSTALL_PROFILE"
+INSTALL_PROFILE_FULL = "full"
+INSTALL_PROFILE_FARM = "farm"
+
 PLUGINS_DIR = os.path.join(HOUDINI_HOST_DIR, "plugins")
 PUBLISH_PATH = os.path.join(PLUGINS_DIR, "publish")
 LOAD_PATH = os.path.join(PLUGINS_DIR, "load")
@@ -51,9 +55,15 @@ CREATE_PATH = os.path.join(PLUGINS_DIR, "create")
 INVENTORY_PATH = os.path.join(PLUGINS_DIR, "inventory")
 WORKFILE_BUILD_PATH = os.path.join(PLUGINS_DIR, "workfile_build")
 
+# Network editor units between a batch of containers and existing ones
+CONTAINER_BATCH_SPACING = 1.0
+
 # Track whether the workfile tool is about to save
 _about_to_save = False
 
+# Batch of containers to parent in bulk, see `batch_containerise`
+_container_batch = None
+
 
 class HoudiniHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
     name = "houdini"
@@ -62,6 +72,7 @@ class HoudiniHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         super(HoudiniHost, self).__init__()
         self._op_events = {}
         self._has_been_setup = False
+        self.install_profile = None
 
     def get_app_information(self):
         from ayon_core.host import ApplicationInformation
@@ -88,6 +99,8 @@ class HoudiniHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         )
 
     def install(self):
+        self.install_profile = get_install_profile()
+
         pyblish.api.register_host("houdini")
         pyblish.api.register_host("hython")
         pyblish.api.register_host("hpython")
@@ -95,6 +108,14 @@ class HoudiniHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         pyblish.api.register_plugin_path(PUBLISH_PATH)
         register_loader_plugin_path(LOAD_PATH)
         register_creator_plugin_path(CREATE_PATH)
+
+        if self.install_profile == INSTALL_PROFILE_FARM:
+            # Batch jobs only publish and render the scene they open, so skip
+            # the scene callbacks, context settings, menus and shelves
+            log.info("Installed farm profile, skipping callbacks and UI.")
+            self._has_been_setup = True
+            return
+
         register_inventory_action_path(INVENTORY_PATH)
         register_workfile_build_plugin_path(WORKFILE_BUILD_PATH)
 
@@ -119,15 +140,12 @@ class HoudiniHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
             import hdefereval  # noqa, hdefereval is only available in ui mode
             # Defer generation of shelves due to issue on Windows where shelf
             # initialization during start up delays Houdini UI by minutes
-            # making it extremely slow to launch.
-            hdefereval.executeDeferred(shelves.generate_shelves)
-            hdefereval.executeDeferred(creator_node_shelves.install)
+            # making it extremely slow to launch. This also defers importing
+            # the UI only modules they need.
+            hdefereval.executeDeferred(_generate_shelves)
+            hdefereval.executeDeferred(_install_creator_node_shelves)
             if env_value_to_bool("AYON_WORKFILE_TOOL_ON_START"):
-                hdefereval.executeDeferred(
-                    lambda: host_tools.show_workfiles(
-                        parent=hou.qt.mainWindow()
-                    )
-                )
+                hdefereval.executeDeferred(_show_workfiles)
 
     def workfile_has_unsaved_changes(self):
         return hou.hipFile.hasUnsavedChanges()
@@ -216,17 +234,73 @@ class HoudiniHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         )
 
     def update_context_data(self, data, changes):
+        from ayon_houdini.api import lib
+
         context_node = self.get_context_node() or self.create_context_node()
         lib.imprint(context_node, data, update=True)
 
     def get_context_data(self) -> dict:
+        from ayon_houdini.api import lib
+
         context_node = self.get_context_node()
         if not context_node:
             return {}
         return lib.read(context_node)
 
 
+def get_install_profile():
+    """Return the profile to install the host with.
+
+    The "farm" profile only registers what publishing and rendering need:
+    the pyblish hosts and the publish, load and create plug-in paths. The
+    "full" profile also installs scene callbacks, applies the context
+    settings to new scenes and installs the shelves in the UI.
+
+    Returns:
+        str: Either `INSTALL_PROFILE_FULL` or `INSTALL_PROFILE_FARM`.
+
+    """
+    profile = os.getenv(INSTALL_PROFILE_ENV, "").strip().lower()
+    if profile in {INSTALL_PROFILE_FULL, INSTALL_PROFILE_FARM}:
+        return profile
+
+    if profile:
+        log.warning(
+            f"Unknown {INSTALL_PROFILE_ENV} value '{profile}', expected "
+            f"'{INSTALL_PROFILE_FULL}' or '{INSTALL_PROFILE_FARM}'."
+        )
+
+    if hou.isUIAvailable():
+        return INSTALL_PROFILE_FULL
+    return INSTALL_PROFILE_FARM
+
+
+def _generate_shelves():
+    from ayon_houdini.api import shelves
+
+    shelves.generate_shelves()
+
+
+def _install_creator_node_shelves():
+    from ayon_houdini.api import creator_node_shelves
+
+    creator_node_shelves.install()
+
+
+def _show_workfiles():
+    from ayon_core.tools.utils import host_tools
+
+    host_tools.show_workfiles(parent=hou.qt.mainWindow())
+
+
 def on_file_event_callback(event):
+    if event in (
+        hou.hipFileEventType.AfterLoad,
+        hou.hipFileEventType.AfterClear
+    ):
+        from ayon_houdini.api import validation_cache
+        validation_cache.clear()
+
     if event == hou.hipFileEventType.AfterLoad:
         emit_event("open")
     elif event == hou.hipFileEventType.AfterSave:
@@ -260,6 +334,7 @@ def containerise(name,
         container (hou.Node): Name of container assembly
 
     """
+    from ayon_houdini.api import lib
 
     # Get AYON Containers subnet
     subnet = get_or_create_ayon_container()
@@ -281,6 +356,11 @@ def containerise(name,
 
     lib.imprint(container, data)
 
+    if _container_batch is not None:
+        # Parented under the container network when the batch ends
+        _container_batch.add(container)
+        return container
+
     # "Parent" the container under the container network
     container = hou.moveNodesTo([container], subnet)[0]
     container.moveToGoodPosition()
@@ -288,6 +368,114 @@ def containerise(name,
     return container
 
 
+class ContainerBatch(object):
+    """Containers created by `containerise` inside `batch_containerise`.
+
+    Attributes:
+        containers (Dict[str, hou.Node]): The container nodes parented under
+            the container network by their path before they were moved.
+            Only filled once the batch ends.
+
+    """
+
+    def __init__(self):
+        self.containers: Dict[str, hou.Node] = {}
+        self._nodes: List[hou.Node] = []
+
+    def add(self, node: hou.Node):
+        self._nodes.append(node)
+
+    def get_container(self, path: str) -> Optional[hou.Node]:
+        """Return the parented container node by its path before moving.
+
+        Containers not created in the batch are returned as they are.
+        """
+        return self.containers.get(path) or hou.node(path)
+
+    def parent_containers(self):
+        """Move all containers to the container network at once.
+
+        The moved nodes are laid out in one pass, instead of finding a good
+        position for each container which gets slower with every container
+        in the network, and placed below the existing containers.
+        """
+        nodes, paths = [], []
+        for node in self._nodes:
+            try:
+                paths.append(node.path())
+            except hou.ObjectWasDeleted:
+                continue
+            nodes.append(node)
+        self._nodes = []
+        if not nodes:
+            return
+
+        subnet = get_or_create_ayon_container()
+        existing = subnet.children()
+        moved = hou.moveNodesTo(nodes, subnet)
+        subnet.layoutChildren(items=moved)
+        if existing:
+            # Offset the laid out batch so it does not overlap the
+            # existing containers
+            existing_min = _get_items_bounds(existing)[0]
+            moved_min, moved_max = _get_items_bounds(moved)
+            offset = hou.Vector2(
+                existing_min[0] - moved_min[0],
+                existing_min[1] - moved_max[1] - CONTAINER_BATCH_SPACING
+            )
+            for node in moved:
+                node.move(offset)
+        self.containers.update(zip(paths, moved))
+
+
+def _get_items_bounds(items):
+    """Return the lower left and upper right corner of network items."""
+    min_x = min_y = float("inf")
+    max_x = max_y = float("-inf")
+    for item in items:
+        position = item.position()
+        size = item.size()
+        min_x = min(min_x, position[0])
+        min_y = min(min_y, position[1])
+        max_x = max(max_x, position[0] + size[0])
+        max_y = max(max_y, position[1] + size[1])
+    return (min_x, min_y), (max_x, max_y)
+
+
+@contextlib.contextmanager
+def batch_containerise():
+    """Parent all containers created in the context in bulk.
+
+    Within the context `containerise` imprints the container but leaves it
+    where the loader created it and returns it unmoved. When the context
+    ends all containers are moved to the container network at once, after
+    which the moved nodes are available through `ContainerBatch`.
+
+    Nested contexts are part of the outer batch.
+
+    Example:
+        >>> with batch_containerise() as batch:
+        ...     node = load_with_repre_context(loader, repre_context)
+        ...     path = node.path()
+        >>> container = batch.get_container(path)
+
+    Yields:
+        ContainerBatch: The batch of containers.
+
+    """
+    global _container_batch
+    if _container_batch is not None:
+        yield _container_batch
+        return
+
+    batch = _container_batch = ContainerBatch()
+    try:
+        yield batch
+    finally:
+        _container_batch = None
+        batch.parent_containers()
+
+
 def parse_container(container):
     """Return the container node's full container data.
 
@@ -298,6 +486,8 @@ def parse_container(container):
         dict: The container schema data for this container node.
 
     """
+    from ayon_houdini.api.lib import JSON_PREFIX
+
     # Read only relevant parms
     # TODO: Clean up this hack replacing `lib.read(container)`
 
@@ -336,6 +526,8 @@ def parse_container(container):
 
 
 def ls():
+    from ayon_houdini.api import lib
+
     containers = []
     for identifier in (
         AYON_CONTAINER_ID,
@@ -360,6 +552,8 @@ def before_workfile_save(event):
 
 
 def before_save():
+    from ayon_houdini.api import lib
+
     return lib.validate_fps()
 
 
@@ -369,6 +563,7 @@ def on_save():
         return
 
     log.info("Running callback on save..")
+    from ayon_houdini.api import lib
 
     # update houdini vars
     lib.update_houdini_vars_context_dialog()
@@ -382,10 +577,14 @@ def on_task_changed():
     global _about_to_save
     if not IS_HEADLESS and _about_to_save:
         # Let's prompt the user to update the context settings or not
+        from ayon_houdini.api import lib
+
         lib.prompt_reset_context()
 
 
 def _show_outdated_content_popup():
+    from ayon_houdini.api import lib
+
     # Get main window
     parent = lib.get_main_window()
     if parent is None:
@@ -415,6 +614,7 @@ def on_open():
         return
 
     log.info("Running callback on open..")
+    from ayon_houdini.api import lib
 
     # update houdini vars
     lib.update_houdini_vars_context_dialog()
@@ -460,6 +660,8 @@ def on_new():
 
     if hou.isUIAvailable():
         import hdefereval
+        from ayon_houdini.api import lib
+
         hdefereval.executeDeferred(lib.start_workfile_template_builder)
         hdefereval.executeDeferred(_enforce_start_frame)
     else:
@@ -509,6 +711,7 @@ def _set_context_settings():
     Returns:
         None
     """
+    from ayon_houdini.api import lib
 
     lib.reset_framerange()
     lib.update_houdini_vars_context()
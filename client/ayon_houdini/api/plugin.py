@@ -2,7 +2,7 @@
 """Houdini specific AYON/Pyblish plugin definitions."""
 import os
 import re
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import hou
 
@@ -14,18 +14,29 @@ from ayon_core.pipeline import (
     CreatedInstance,
     AYON_INSTANCE_ID,
     AVALON_INSTANCE_ID,
+    Anatomy,
     load,
     publish,
 )
+from ayon_core.pipeline.load import (
+    InvalidRepresentationContext,
+    get_representation_path_with_anatomy,
+)
 from ayon_core.lib import BoolDef
 from ayon_core.pipeline.staging_dir import StagingDir
 
 from .lib import (
     imprint, read, lsattr, render_rop,
+    manual_update_mode,
     add_self_publish_button,
     expand_houdini_string,
+    get_output_parameter,
+    get_render_manifest_path,
+    RenderManifest,
+    RenderTelemetry,
 )
 from .usd import get_ayon_entity_uri_from_representation_context
+from . import profiling, validation_cache
 
 
 SETTINGS_CATEGORY = "houdini"
@@ -532,7 +543,10 @@ class HoudiniLoader(load.LoaderPlugin):
         if cls.use_ayon_entity_uri:
             return get_ayon_entity_uri_from_representation_context(context)
 
-        path = super().filepath_from_context(context)
+        # Filepath resolved up front by `update_containers`
+        path = context.get("representation_path")
+        if path is None:
+            path = super().filepath_from_context(context)
 
         # Remap project roots to the collapsible path variables
         if cls.collapse_paths_to_root_vars:
@@ -547,6 +561,68 @@ class HoudiniLoader(load.LoaderPlugin):
 
         return path
 
+    @classmethod
+    def resolve_filepaths(cls, contexts: List[dict]) -> Dict[str, str]:
+        """Resolve the filepaths of many representations in one pass.
+
+        The Anatomy is created once per project and shared by all
+        representations, instead of per representation.
+
+        Args:
+            contexts (List[dict]): Representation contexts.
+
+        Returns:
+            Dict[str, str]: Filepaths by representation id. Representations
+                whose path can't be resolved are excluded, so they resolve
+                through `filepath_from_context`.
+
+        """
+        anatomies: Dict[str, Anatomy] = {}
+        filepaths: Dict[str, str] = {}
+        for context in contexts:
+            repre_entity = context["representation"]
+            project_entity = context["project"]
+            project_name = project_entity["name"]
+            anatomy = anatomies.get(project_name)
+            if anatomy is None:
+                anatomy = Anatomy(project_name, project_entity=project_entity)
+                anatomies[project_name] = anatomy
+
+            try:
+                path = get_representation_path_with_anatomy(
+                    repre_entity, anatomy
+                )
+            except InvalidRepresentationContext:
+                continue
+            filepaths[repre_entity["id"]] = os.path.normpath(str(path))
+        return filepaths
+
+    def update_containers(self, containers: List[Tuple[dict, dict]]):
+        """Update many containers of this loader at once.
+
+        The filepaths of all representations are resolved up front in one
+        pass and passed to `update` as `representation_path` in the
+        context. All `update` calls run with undo recording disabled and
+        Houdini only cooks and refreshes the viewport once at the end.
+
+        Args:
+            containers (List[Tuple[dict, dict]]): The containers with the
+                representation context to update each of them to.
+
+        """
+        filepaths = {}
+        if not self.use_ayon_entity_uri:
+            filepaths = self.resolve_filepaths(
+                [context for _, context in containers]
+            )
+
+        with hou.undos.disabler(), manual_update_mode():
+            for container, context in containers:
+                path = filepaths.get(context["representation"]["id"])
+                if path is not None:
+                    context = dict(context, representation_path=path)
+                self.update(container, context)
+
     @staticmethod
     def replace_with_frame_token(filepath):
         """Replace with frame token
@@ -594,21 +670,88 @@ class HoudiniLoader(load.LoaderPlugin):
         path = path.replace("\\", "/")
         return path
 
-class HoudiniInstancePlugin(pyblish.api.InstancePlugin):
+class HoudiniProfilingMixin(object):
+    """Record wall, CPU and Houdini cook time of `process` per plug-in.
+
+    The `process` method of each subclass is wrapped so that, when
+    "Publish Profiling" is enabled in the project settings, every call is
+    recorded per plug-in and instance. The events are written to a Chrome
+    trace JSON file next to the workfile to compare publishes over time.
+    See `ayon_houdini.api.profiling`.
+
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        process = cls.__dict__.get("process")
+        if process is not None and not getattr(process, "_profiled", False):
+            cls.process = profiling.profiled(process)
+
+
+class HoudiniInstancePlugin(
+        HoudiniProfilingMixin, pyblish.api.InstancePlugin):
     """Base class for Houdini instance publish plugins."""
 
     hosts = ["houdini"]
     settings_category = SETTINGS_CATEGORY
 
 
-class HoudiniContextPlugin(pyblish.api.ContextPlugin):
+class HoudiniContextPlugin(
+        HoudiniProfilingMixin, pyblish.api.ContextPlugin):
     """Base class for Houdini context publish plugins."""
 
     hosts = ["houdini"]
     settings_category = SETTINGS_CATEGORY
 
 
-class HoudiniExtractorPlugin(publish.Extractor):
+class HoudiniCachedValidatorMixin(object):
+    """Skip validating an instance again if it is unchanged since it passed.
+
+    Validators call `is_validation_cached` before doing any expensive work
+    and `set_validation_passed` once the instance is valid. This is only
+    active when "Validation Result Cache" is enabled in the project
+    settings.
+
+    Example:
+        >>> def process(self, instance):
+        ...     if self.is_validation_cached(instance):
+        ...         return
+        ...     # Validate, raising on invalid results
+        ...     self.set_validation_passed(instance)
+
+    """
+
+    def is_validation_cached(self, instance: pyblish.api.Instance) -> bool:
+        """Return whether the instance passed before and is unchanged."""
+        if not validation_cache.is_validation_cache_enabled(
+                instance.context):
+            return False
+        if not validation_cache.has_passed(self, instance):
+            return False
+        self.log.debug(
+            "Skipping validation, instance is unchanged since it last "
+            "passed.")
+        return True
+
+    def set_validation_passed(self, instance: pyblish.api.Instance):
+        """Remember the instance passed with its current fingerprint."""
+        if validation_cache.is_validation_cache_enabled(instance.context):
+            validation_cache.set_passed(self, instance)
+
+
+def is_render_telemetry_enabled(context: pyblish.api.Context) -> bool:
+    """Return whether the "Extract Render Telemetry" plug-in is enabled."""
+    project_settings = context.data.get("project_settings") or {}
+    plugin_settings = (
+        project_settings
+        .get(SETTINGS_CATEGORY, {})
+        .get("publish", {})
+        .get("ExtractRenderTelemetry", {})
+    )
+    return bool(plugin_settings.get("enabled", False))
+
+
+class HoudiniExtractorPlugin(HoudiniProfilingMixin, publish.Extractor):
     """Base class for Houdini extract plugins.
 
     Note:
@@ -622,23 +765,99 @@ class HoudiniExtractorPlugin(publish.Extractor):
     hosts = ["houdini"]
     settings_category = SETTINGS_CATEGORY
 
-    def render_rop(self, instance: pyblish.api.Instance):
+    def render_rop(
+            self,
+            instance: pyblish.api.Instance,
+            frames: Optional[Iterable[int]] = None):
         """Render the ROP node of the instance.
 
         If `instance.data["frames_to_fix"]` is set and is not empty it will
         be interpreted as a set of frames that will be rendered instead of the
         full rop nodes frame range.
 
+        If `frames` is provided only those frames are rendered, in as few
+        contiguous frame ranges as possible. This takes precedence over
+        `instance.data["frames_to_fix"]`.
+
+        Each completed frame is recorded in a render manifest next to the
+        output files, available as `instance.data["renderManifest"]`. When a
+        previous render of the same saved workfile was cancelled, only the
+        frames it did not complete are rendered.
+
+        When the "Extract Render Telemetry" plug-in is enabled, render time
+        per frame range and per frame, output bytes and peak memory usage
+        are recorded in `instance.data["renderTelemetry"]`.
+
         Only `instance.data["instance_node"]` is required.
         """
         # Log the start of the render
         rop_node = hou.node(instance.data["instance_node"])
         self.log.debug(f"Rendering {rop_node.path()}")
+        telemetry = self.get_render_telemetry(instance)
+
+        manifest = None
+        manifest_path = get_render_manifest_path(rop_node)
+        if manifest_path:
+            manifest = RenderManifest.load(
+                manifest_path,
+                rop_node,
+                self._get_expected_filepaths_by_frame(instance)
+            )
+            instance.data["renderManifest"] = manifest
+
+        self._render_rop_frames(
+            instance, rop_node, frames, manifest, telemetry)
+        if manifest is not None and self._is_render_complete(
+                instance, manifest):
+            manifest.mark_complete()
+
+    def _render_rop_frames(
+            self,
+            instance: pyblish.api.Instance,
+            rop_node: hou.RopNode,
+            frames: Optional[Iterable[int]],
+            manifest: Optional[RenderManifest],
+            telemetry: Optional[RenderTelemetry]):
+        """Render the frames of the ROP node for `render_rop`."""
+        if frames is not None:
+            for first_frame, last_frame in self._iter_frame_ranges(frames):
+                self.log.debug(
+                    f"Rendering frames [{first_frame}, {last_frame}]"
+                )
+                render_rop(rop_node,
+                           frame_range=(first_frame, last_frame, 1),
+                           manifest=manifest,
+                           telemetry=telemetry)
+            return
 
         frames_to_fix = clique.parse(instance.data.get("frames_to_fix", ""),
                                      "{ranges}")
         if len(set(frames_to_fix)) < 2:
-            render_rop(rop_node)
+            remaining_frames = self._get_remaining_frames(
+                instance, rop_node, manifest)
+            if remaining_frames is None:
+                if manifest is not None:
+                    manifest.reset()
+                render_rop(rop_node, manifest=manifest, telemetry=telemetry)
+                return
+
+            if not remaining_frames:
+                self.log.info(
+                    "All frames were completed by a previous render.")
+                return
+
+            # Resume a cancelled render
+            step = int(instance.data.get("byFrameStep", 1))
+            for first_frame, last_frame in self._iter_frame_ranges(
+                    remaining_frames, step):
+                self.log.debug(
+                    "Rendering frames not completed by previous render "
+                    f"[{first_frame}, {last_frame}]"
+                )
+                render_rop(rop_node,
+                           frame_range=(first_frame, last_frame, step),
+                           manifest=manifest,
+                           telemetry=telemetry)
             return
 
         # Render only frames to fix
@@ -651,4 +870,148 @@ class HoudiniExtractorPlugin(publish.Extractor):
             )
             # for step to be 1 since clique doesn't support steps.
             frame_range = (first_frame, last_frame, 1)
-            render_rop(rop_node, frame_range=frame_range)
+            render_rop(rop_node,
+                       frame_range=frame_range,
+                       manifest=manifest,
+                       telemetry=telemetry)
+
+    def get_render_telemetry(
+            self,
+            instance: pyblish.api.Instance) -> Optional[RenderTelemetry]:
+        """Return the render telemetry of the instance, create if missing.
+
+        Returns None when the "Extract Render Telemetry" plug-in is
+        disabled, so no telemetry is recorded while rendering.
+        """
+        telemetry = instance.data.get("renderTelemetry")
+        if telemetry is None:
+            if not is_render_telemetry_enabled(instance.context):
+                return None
+            telemetry = RenderTelemetry(
+                instance.data["instance_node"],
+                self._get_expected_filepaths_by_frame(instance)
+            )
+            instance.data["renderTelemetry"] = telemetry
+        return telemetry
+
+    def _get_expected_filepaths_by_frame(
+            self,
+            instance: pyblish.api.Instance
+    ) -> Optional[Dict[int, List[str]]]:
+        """Return the expected output files of all AOVs per frame.
+
+        Uses `expectedFiles` of render instances or `frames` in the
+        staging directory otherwise. Returns None when the files can't be
+        related to frames.
+        """
+        frames = self._get_frame_range_frames(instance)
+        if not frames:
+            return None
+        frames = sorted(frames)
+
+        expected_files = instance.data.get("expectedFiles")
+        if expected_files:
+            sequences = list(expected_files[0].values())
+        else:
+            filenames = instance.data.get("frames")
+            staging_dir = instance.data.get("stagingDir")
+            if not filenames or not staging_dir:
+                return None
+            if isinstance(filenames, str):
+                filenames = [filenames]
+            sequences = [[
+                os.path.join(staging_dir, filename) for filename in filenames
+            ]]
+
+        filepaths_by_frame = {frame: [] for frame in frames}
+        for filepaths in sequences:
+            # Single files are not written per frame
+            if isinstance(filepaths, str) or len(filepaths) != len(frames):
+                continue
+            # Expected files are listed per frame in frame order
+            for frame, filepath in zip(frames, filepaths):
+                filepaths_by_frame[frame].append(filepath)
+
+        if not any(filepaths_by_frame.values()):
+            return None
+        return filepaths_by_frame
+
+    @staticmethod
+    def _get_frame_range_frames(
+            instance: pyblish.api.Instance) -> Optional[Set[int]]:
+        """Return the frames of the instance's frame range.
+
+        Returns None when the instance has no frame range or its step is
+        not a positive integer.
+        """
+        if "frameStartHandle" not in instance.data:
+            return None
+
+        start = int(instance.data["frameStartHandle"])
+        end = int(instance.data["frameEndHandle"])
+        step = instance.data.get("byFrameStep", 1)
+        if step < 1 or int(step) != step:
+            return None
+        return set(range(start, end + 1, int(step)))
+
+    def _is_render_complete(
+            self,
+            instance: pyblish.api.Instance,
+            manifest: RenderManifest) -> bool:
+        """Return whether all frames of the instance were recorded.
+
+        A render cancelled by the user returns without an error, so the
+        recorded frames are compared to the instance's frame range.
+        """
+        frames = self._get_frame_range_frames(instance)
+        if frames is None:
+            return True
+        return not frames - manifest.completed_frames()
+
+    def _get_remaining_frames(
+            self,
+            instance: pyblish.api.Instance,
+            rop_node: hou.RopNode,
+            manifest: Optional[RenderManifest]) -> Optional[Set[int]]:
+        """Return frames of the instance not completed by a previous render.
+
+        Only a render that was interrupted is resumed. Returns None when
+        the full frame range should be rendered, e.g. when the previous
+        render finished, no frames were completed or when the ROP writes a
+        single file for all frames which can't be partially rendered.
+        """
+        if manifest is None or manifest.complete or not manifest.frames:
+            return None
+
+        frames = self._get_frame_range_frames(instance)
+        if not frames:
+            return None
+
+        start = min(frames)
+        end = max(frames)
+        output_parm = get_output_parameter(rop_node)
+        if (
+            start != end
+            and output_parm.evalAtFrame(start) == output_parm.evalAtFrame(end)
+        ):
+            # Single file output
+            return None
+
+        remaining = frames - manifest.completed_frames(verify=True)
+        if remaining == frames:
+            return None
+        return remaining
+
+    @staticmethod
+    def _iter_frame_ranges(frames, step=1):
+        """Yield (first, last) frame of each run of frames `step` apart."""
+        frames = sorted(frames)
+        if not frames:
+            return
+        first = previous = frames[0]
+        for frame in frames[1:]:
+            if frame - previous != step:
+                yield first, previous
+                first = frame
+            previous = frame
+        yield first, previous
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Opt-in profiling of publish plug-ins with Chrome trace export.
+
+When "Publish Profiling" is enabled in the project settings the `process`
+of each Houdini publish plug-in records its wall time, CPU time and
+optionally the time Houdini spent cooking nodes while it ran. The events
+can be written as a Chrome trace JSON file next to the workfile, which can
+be opened in `chrome://tracing` or https://ui.perfetto.dev. The trace is
+written once the publish finished, or when a plug-in fails since the
+publish may stop there.
+"""
+import os
+import json
+import time
+import inspect
+import logging
+import functools
+from contextlib import contextmanager
+
+import hou
+
+log = logging.getLogger(__name__)
+
+# Trace thread per plug-in order: collect, validate, extract, integrate
+PHASES = ["Collect", "Validate", "Extract", "Integrate"]
+
+
+def get_phase_index(order: float) -> int:
+    """Return index in `PHASES` for a pyblish plug-in order."""
+    return max(0, min(len(PHASES) - 1, int(order + 0.5)))
+
+
+def _get_cook_time(perf_profile):
+    """Return total self cook time in seconds of a perfMon profile.
+
+    Returns None when the statistics contain no cook times.
+    """
+    try:
+        stats = json.loads(perf_profile.stats())
+    except (hou.Error, TypeError, ValueError):
+        return None
+
+    def _sum_self_times(data):
+        if isinstance(data, dict):
+            total = 0.0
+            found = False
+            for key, value in data.items():
+                if key.lower() == "selftime" and isinstance(
+                        value, (int, float)):
+                    total += value
+                    found = True
+                else:
+                    sub_total = _sum_self_times(value)
+                    if sub_total is not None:
+                        total += sub_total
+                        found = True
+            return total if found else None
+        if isinstance(data, list):
+            times = [_sum_self_times(item) for item in data]
+            times = [value for value in times if value is not None]
+            return sum(times) if times else None
+        return None
+
+    # Profile times are in milliseconds
+    cook_time = _sum_self_times(stats.get("cookStats"))
+    if cook_time is None:
+        return None
+    return cook_time / 1000.0
+
+
+class PublishProfile(object):
+    """Profile events recorded for a single publish.
+
+    Args:
+        trace_path (Optional[str]): Chrome trace file to write the events
+            to with `write`, None to only record in memory.
+        record_cook_time (bool): Record Houdini cook time per plug-in using
+            a performance monitor profile.
+
+    """
+
+    def __init__(self, trace_path=None, record_cook_time=False):
+        self.trace_path = trace_path
+        self.record_cook_time = record_cook_time
+        self.events = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def record(self, plugin, instance=None):
+        """Record the time spent in the context for a plug-in."""
+        perf_profile = None
+        if self.record_cook_time:
+            perf_profile = hou.perfMon.startProfile(
+                f"AYON Publish: {plugin.__class__.__name__}",
+                hou.PerfMonRecordOptions(
+                    cook_stats=True,
+                    solve_stats=False,
+                    draw_stats=False,
+                    gpu_draw_stats=False,
+                    viewport_stats=False,
+                    script_stats=False,
+                    render_stats=False,
+                    thread_stats=False,
+                    frame_stats=False,
+                    memory_stats=False,
+                    errors=False,
+                )
+            )
+
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.process_time() - cpu_start
+            cook_time = None
+            if perf_profile is not None:
+                perf_profile.stop()
+                cook_time = _get_cook_time(perf_profile)
+
+            self.events.append({
+                "plugin": plugin.__class__.__name__,
+                "label": getattr(plugin, "label", None)
+                or plugin.__class__.__name__,
+                "order": plugin.order,
+                "instance": str(instance) if instance is not None else None,
+                "start": start - self._start,
+                "wall": wall,
+                "cpu": cpu,
+                "cook": cook_time,
+            })
+            if failed:
+                # The publish may stop after a failed plug-in
+                self.write()
+
+    def write(self):
+        """Write the Chrome trace file, if a trace path is set."""
+        if not self.trace_path:
+            return
+        try:
+            self.write_trace(self.trace_path)
+        except OSError as exc:
+            log.warning(f"Unable to write publish trace: {exc}")
+
+    def to_chrome_trace(self) -> dict:
+        """Return the events in Chrome trace event format."""
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": index,
+                "args": {"name": phase},
+            }
+            for index, phase in enumerate(PHASES)
+        ]
+        for event in self.events:
+            name = event["label"]
+            if event["instance"]:
+                name = f"{name} ({event['instance']})"
+            trace_events.append({
+                "name": name,
+                "cat": PHASES[get_phase_index(event["order"])].lower(),
+                "ph": "X",
+                "pid": pid,
+                "tid": get_phase_index(event["order"]),
+                # Microseconds
+                "ts": event["start"] * 1e6,
+                "dur": event["wall"] * 1e6,
+                "args": {
+                    "plugin": event["plugin"],
+                    "instance": event["instance"],
+                    "order": event["order"],
+                    "cpu_ms": event["cpu"] * 1e3,
+                    "cook_ms": (
+                        event["cook"] * 1e3
+                        if event["cook"] is not None else None
+                    ),
+                },
+            })
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {"workfile": hou.hipFile.path()},
+        }
+
+    def write_trace(self, path):
+        """Write the events as Chrome trace JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+def get_trace_path() -> str:
+    """Return a new Chrome trace file path next to the current workfile."""
+    hip_path = hou.hipFile.path()
+    root, _ = os.path.splitext(hip_path)
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    return f"{root}.publish_trace.{timestamp}.json"
+
+
+def get_publish_profile(context):
+    """Return the publish profile of the context, None if not enabled.
+
+    Args:
+        context (pyblish.api.Context): The publish context.
+
+    Returns:
+        Optional[PublishProfile]: The profile to record plug-ins to.
+
+    """
+    profile = context.data.get("houdiniPublishProfile")
+    if profile is not None:
+        return profile or None
+
+    settings = (
+        context.data.get("project_settings", {})
+        .get("houdini", {})
+        .get("publish", {})
+        .get("PublishProfiling", {})
+    )
+    if not settings.get("enabled"):
+        # Store to avoid looking up the settings for each plug-in
+        context.data["houdiniPublishProfile"] = False
+        return None
+
+    trace_path = None
+    if settings.get("write_trace", True):
+        trace_path = get_trace_path()
+    profile = PublishProfile(
+        trace_path=trace_path,
+        record_cook_time=settings.get("record_cook_time", False)
+    )
+    context.data["houdiniPublishProfile"] = profile
+    return profile
+
+
+def profiled(process):
+    """Wrap a plug-in's `process` to record it to the publish profile.
+
+    The signature of `process` is kept, because pyblish inspects it to
+    decide whether to pass the instance or the context.
+    """
+    signature = inspect.signature(process)
+
+    @functools.wraps(process)
+    def wrapper(self, *args, **kwargs):
+        # Skip nested calls, e.g. a subclass calling `super().process()`
+        if getattr(self, "_profiling", False):
+            return process(self, *args, **kwargs)
+
+        bound = signature.bind_partial(self, *args, **kwargs).arguments
+        instance = bound.get("instance")
+        context = bound.get("context")
+        if context is None and instance is not None:
+            context = instance.context
+
+        profile = get_publish_profile(context) if context else None
+        if profile is None:
+            return process(self, *args, **kwargs)
+
+        self._profiling = True
+        try:
+            with profile.record(self, instance):
+                return process(self, *args, **kwargs)
+        finally:
+            self._profiling = False
+
+    wrapper.__signature__ = signature
+    wrapper._profiled = True
+    return wrapper
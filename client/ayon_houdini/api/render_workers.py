@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""Render ROP nodes in background `hython` worker processes."""
+import os
+import time
+import logging
+import platform
+import tempfile
+import subprocess
+from typing import Dict, List, Optional, Set, Tuple
+
+import hou
+
+from .lib import iter_dependency_nodes
+
+log = logging.getLogger(__name__)
+
+# Script run by each `hython` worker: load the saved workfile and render
+# the ROP node over the given frame range. Arguments are passed through
+# `sys.argv` as: hip path, ROP path, start frame, end frame, frame step.
+WORKER_SCRIPT = """
+import sys
+import hou
+
+hip_path, rop_path, start, end, step = sys.argv[1:6]
+hou.hipFile.load(hip_path,
+                 suppress_save_prompt=True,
+                 ignore_load_warnings=True)
+rop = hou.node(rop_path)
+if rop is None:
+    sys.exit("ROP node not found: " + rop_path)
+try:
+    rop.render(frame_range=(float(start), float(end), float(step)),
+               verbose=True,
+               ignore_inputs=True)
+except hou.Error as exc:
+    sys.exit("Render failed: {0}".format(exc))
+"""
+
+# Node types that carry state from one frame to the next, so rendering a
+# frame in isolation gives a different result than rendering the full range
+SIMULATION_NODE_TYPES = {
+    "dopnet",
+    "dopimport",
+    "dopimportfield",
+    "dopimportrecords",
+    "dopio",
+    "popnet",
+    "solver",
+    "feedback",
+    "vellumsolver",
+    "vellumio",
+    "rbdbulletsolver",
+    "flipsolver",
+    "pyrosolver",
+    "ripplesolver",
+    "crowdsolver",
+}
+
+
+def get_hython_executable() -> str:
+    """Return path to the `hython` executable of the running Houdini."""
+    executable = "hython"
+    if platform.system() == "Windows":
+        executable += ".exe"
+    return os.path.join(hou.text.expandString("$HB"), executable)
+
+
+def split_frame_range(
+        start: int,
+        end: int,
+        step: int = 1,
+        chunks: int = 1) -> List[Tuple[int, int, int]]:
+    """Split a frame range into contiguous chunks of near equal size.
+
+    Args:
+        start (int): First frame.
+        end (int): Last frame.
+        step (int): Frame increment.
+        chunks (int): Maximum amount of chunks to split into.
+
+    Returns:
+        List[Tuple[int, int, int]]: Start, end and step per chunk.
+
+    """
+    frames = list(range(start, end + 1, step))
+    chunks = max(1, min(chunks, len(frames)))
+    size, remainder = divmod(len(frames), chunks)
+
+    result = []
+    index = 0
+    for chunk in range(chunks):
+        chunk_size = size + (1 if chunk < remainder else 0)
+        chunk_frames = frames[index:index + chunk_size]
+        index += chunk_size
+        result.append((chunk_frames[0], chunk_frames[-1], step))
+    return result
+
+
+def get_parallel_render_blockers(rop_node) -> List[str]:
+    """Return reasons why the ROP can't be rendered in parallel chunks.
+
+    Rendering a frame range in separate processes is only valid when each
+    frame can be computed on its own. Simulations, solvers and feedback
+    loops require all previous frames to be cooked in the same session.
+
+    Args:
+        rop_node (hou.RopNode): The ROP node to check.
+
+    Returns:
+        List[str]: Human-readable reasons, empty if there are none.
+
+    """
+    reasons = []
+    initsim = rop_node.parm("initsim")
+    if initsim is not None and initsim.eval():
+        reasons.append(
+            f"{rop_node.path()} has 'Initialize Simulation OPs' enabled"
+        )
+
+    start_nodes = []
+    for parm_name in ("soppath", "loppath", "coppath"):
+        parm = rop_node.parm(parm_name)
+        if parm is None:
+            continue
+        node = rop_node.node(parm.eval())
+        if node is not None:
+            start_nodes.append(node)
+
+    for start_node in start_nodes:
+        for node in iter_dependency_nodes(start_node):
+            node_type = node.type()
+            if (
+                node_type.name().split("::")[0] in SIMULATION_NODE_TYPES
+                or node_type.category() == hou.dopNodeTypeCategory()
+            ):
+                reasons.append(
+                    f"{node.path()} is a simulation or feedback node "
+                    f"({node_type.name()})"
+                )
+    return reasons
+
+
+class RenderWorker(object):
+    """Background `hython` process rendering a frame range of a ROP node.
+
+    The process output is written to a temporary file instead of a pipe so
+    that a worker with a lot of verbose output never blocks on a full pipe
+    buffer.
+
+    Args:
+        hip_path (str): Workfile to load in the worker.
+        rop_path (str): Path of the ROP node to render.
+        frame_range (Tuple[int, int, int]): Start, end and step to render.
+
+    """
+
+    def __init__(self, hip_path, rop_path, frame_range):
+        self.rop_path = rop_path
+        self.frame_range = frame_range
+        self.start_time = time.time()
+        self.end_time = None
+
+        start, end, step = frame_range
+        args = [
+            get_hython_executable(), "-c", WORKER_SCRIPT,
+            hip_path, rop_path, str(start), str(end), str(step)
+        ]
+        self._output_file = tempfile.TemporaryFile(mode="w+")
+        self._process = subprocess.Popen(
+            args,
+            stdout=self._output_file,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        )
+
+    def __repr__(self):
+        start, end, _ = self.frame_range
+        return f"<RenderWorker {self.rop_path} [{start}, {end}]>"
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code or None if the worker is still running."""
+        returncode = self._process.poll()
+        if returncode is not None and self.end_time is None:
+            self.end_time = time.time()
+        return returncode
+
+    def wait(self) -> int:
+        """Wait for the worker to finish and return its exit code."""
+        self._process.wait()
+        return self.poll()
+
+    def kill(self):
+        """Kill the worker if it is still running."""
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+
+    @property
+    def succeeded(self) -> bool:
+        return self.poll() == 0
+
+    @property
+    def duration(self) -> float:
+        return (self.end_time or time.time()) - self.start_time
+
+    def output(self) -> str:
+        """Return everything the worker wrote to stdout and stderr."""
+        self._output_file.seek(0)
+        return self._output_file.read()
+
+    def close(self):
+        """Kill the worker if needed and release its output file."""
+        self.kill()
+        self._output_file.close()
+
+
+def render_rop_in_workers(
+        rop_node,
+        frame_range: Tuple[int, int, int],
+        workers: int,
+        hip_path: Optional[str] = None,
+        logger: Optional[logging.Logger] = None):
+    """Render ROP node frame range split across `hython` worker processes.
+
+    Each worker loads the saved workfile and renders a contiguous chunk of
+    the frame range. The workfile must be saved, because the workers do not
+    see any unsaved changes of the current session.
+
+    Args:
+        rop_node (hou.RopNode): ROP node to render.
+        frame_range (Tuple[int, int, int]): Start, end and step to render.
+        workers (int): Amount of worker processes to use.
+        hip_path (Optional[str]): Workfile to load in the workers.
+            Defaults to the current workfile.
+        logger (Optional[logging.Logger]): Logger to log to.
+
+    Raises:
+        RuntimeError: When any of the workers failed to render.
+
+    """
+    if logger is None:
+        logger = log
+    if hip_path is None:
+        hip_path = hou.hipFile.path()
+
+    render_workers = []
+    try:
+        for chunk in split_frame_range(*frame_range, chunks=workers):
+            logger.debug(f"Starting hython worker for frames {chunk}")
+            render_workers.append(
+                RenderWorker(hip_path, rop_node.path(), chunk))
+
+        for worker in render_workers:
+            worker.wait()
+
+        failed = [
+            worker for worker in render_workers if not worker.succeeded
+        ]
+        for worker in failed:
+            logger.error(f"{worker} failed:\n{worker.output()}")
+    finally:
+        # Make sure no worker is left running if we got interrupted
+        for worker in render_workers:
+            worker.close()
+
+    if failed:
+        raise RuntimeError(
+            "Render failed in {} of {} hython workers.".format(
+                len(failed), len(render_workers))
+        )
+
+
+def render_rops_in_workers(
+        frame_ranges: Dict[str, Tuple[int, int, int]],
+        dependencies: Dict[str, Set[str]],
+        max_workers: int,
+        hip_path: Optional[str] = None,
+        poll_interval: float = 0.5,
+        logger: Optional[logging.Logger] = None
+) -> Dict[str, dict]:
+    """Render multiple ROP nodes concurrently in a pool of `hython` workers.
+
+    A ROP node is only started once all ROP nodes it depends on have
+    rendered successfully. If any of its dependencies failed it is not
+    rendered at all.
+
+    Args:
+        frame_ranges (Dict[str, Tuple[int, int, int]]): Frame range to
+            render per ROP node path.
+        dependencies (Dict[str, Set[str]]): ROP node paths each ROP node
+            path depends on. Only paths that are in `frame_ranges` are
+            considered.
+        max_workers (int): Maximum amount of concurrent worker processes.
+        hip_path (Optional[str]): Workfile to load in the workers.
+            Defaults to the current workfile.
+        poll_interval (float): Seconds between checks for finished workers.
+        logger (Optional[logging.Logger]): Logger to log to.
+
+    Returns:
+        Dict[str, dict]: Result per ROP node path with `success`,
+            `duration` and `output` keys. `output` is only set on failure.
+
+    """
+    if logger is None:
+        logger = log
+    if hip_path is None:
+        hip_path = hou.hipFile.path()
+
+    pending = {
+        rop_path: {
+            dependency for dependency in dependencies.get(rop_path, set())
+            if dependency in frame_ranges and dependency != rop_path
+        }
+        for rop_path in frame_ranges
+    }
+    results = {}
+    running: Dict[str, RenderWorker] = {}
+    try:
+        while pending or running:
+            # Collect finished workers
+            for rop_path, worker in list(running.items()):
+                if worker.poll() is None:
+                    continue
+                result = {
+                    "success": worker.succeeded,
+                    "duration": worker.duration,
+                }
+                if worker.succeeded:
+                    logger.debug(
+                        f"Rendered {rop_path} in {worker.duration:.1f}s")
+                else:
+                    result["output"] = worker.output()
+                    logger.error(f"{worker} failed:\n{result['output']}")
+                results[rop_path] = result
+                worker.close()
+                del running[rop_path]
+
+            # Skip ROPs whose dependencies failed
+            for rop_path, rop_dependencies in list(pending.items()):
+                failed = [
+                    dependency for dependency in rop_dependencies
+                    if dependency in results
+                    and not results[dependency]["success"]
+                ]
+                if failed:
+                    results[rop_path] = {
+                        "success": False,
+                        "duration": 0.0,
+                        "output": "Dependencies failed to render: {}".format(
+                            ", ".join(failed))
+                    }
+                    del pending[rop_path]
+
+            # Start ROPs that have all dependencies rendered
+            for rop_path, rop_dependencies in list(pending.items()):
+                if len(running) >= max_workers:
+                    break
+                if not all(dependency in results
+                           for dependency in rop_dependencies):
+                    continue
+                logger.debug(f"Starting hython worker for {rop_path}")
+                running[rop_path] = RenderWorker(
+                    hip_path, rop_path, frame_ranges[rop_path])
+                del pending[rop_path]
+
+            if running:
+                time.sleep(poll_interval)
+            elif pending:
+                # Nothing is running and nothing can start, which means the
+                # remaining ROPs depend on each other in a cycle
+                for rop_path in pending:
+                    results[rop_path] = {
+                        "success": False,
+                        "duration": 0.0,
+                        "output": "Cyclic ROP dependencies."
+                    }
+                pending.clear()
+    finally:
+        # Make sure no worker is left running if we got interrupted
+        for worker in running.values():
+            worker.close()
+
+    return results
+
+
+def get_default_worker_count() -> int:
+    """Return default amount of local render workers: half the CPU cores."""
+    return max(1, (os.cpu_count() or 2) // 2)
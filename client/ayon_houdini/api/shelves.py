@@ -1,23 +1,138 @@
 import os
 import re
+import json
+import glob
+import hashlib
 import logging
 import platform
 
 from ayon_core.settings import get_project_settings
 from ayon_core.pipeline import get_current_project_name
 
-from ayon_core.lib import StringTemplate
+from ayon_core.lib import StringTemplate, get_launcher_local_dir
 
 import hou
 
+from ayon_houdini.version import __version__
+
 from .lib import get_current_context_template_data_with_entity_attrs
 
 log = logging.getLogger("ayon_houdini.shelves")
 
+# Compiled shelf files to keep in the cache, e.g. for multiple projects
+MAX_CACHED_SHELVES = 20
+
+EMPTY_SHELF_DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<shelfDocument>
+</shelfDocument>
+"""
+
+
+def get_shelf_cache_dir(name):
+    """Return per user folder to cache generated shelf files in.
+
+    Args:
+        name (str): Name of the cache folder.
+
+    Returns:
+        str: The existing cache folder.
+
+    """
+    cache_dir = get_launcher_local_dir("houdini", name)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def get_cache_key(data):
+    """Return hash of JSON serializable data to use as cache key."""
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def remove_stale_shelf_files(
+        cache_dir, pattern, keep=MAX_CACHED_SHELVES, used_filepaths=None):
+    """Remove all but the most recently modified shelf files.
+
+    Args:
+        cache_dir (str): The cache folder.
+        pattern (str): Glob pattern of the shelf files in the folder.
+        keep (int): Amount of most recent files to keep.
+        used_filepaths (Optional[Iterable[str]]): Files that are still
+            used and are kept first, before the most recent other files.
+
+    """
+    used_filepaths = {
+        os.path.normpath(filepath) for filepath in used_filepaths or []
+    }
+    filepaths = sorted(
+        glob.glob(os.path.join(cache_dir, pattern)),
+        key=lambda filepath: (
+            os.path.normpath(filepath) in used_filepaths,
+            os.path.getmtime(filepath)
+        ),
+        reverse=True
+    )
+    for filepath in filepaths[keep:]:
+        try:
+            os.remove(filepath)
+        except OSError:
+            # Might be in use by another session
+            pass
+
+
+def _uses_template_data(data):
+    """Return whether any string in the settings is a template."""
+    if isinstance(data, str):
+        return "{" in data
+    if isinstance(data, dict):
+        return any(_uses_template_data(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_uses_template_data(value) for value in data)
+    return False
+
+
+def get_shelf_source_files(shelves_configs, template_data):
+    """Return modification time of script and icon files of the tools.
+
+    Tools embed their script, so the compiled shelves must be regenerated
+    when a script changes.
 
-def generate_shelves():
+    Returns:
+        List[Tuple[str, Optional[float]]]: Modification time per filepath,
+            None if the file does not exist.
+
+    """
+    source_files = []
+    for config in shelves_configs:
+        shelf_set_config = config[config["options"]]
+        for shelf_definition in shelf_set_config.get("shelf_definition", []):
+            for tool_definition in shelf_definition.get("tools_list", []):
+                for key in ("script", "icon"):
+                    path = tool_definition.get(key)
+                    if not path:
+                        continue
+                    path = get_path_using_template_data(path, template_data)
+                    mtime = None
+                    if os.path.exists(path):
+                        mtime = os.path.getmtime(path)
+                    source_files.append((path, mtime))
+    return source_files
+
+
+def generate_shelves(use_cache=True):
     """This function generates complete shelves from shelf set to tools
     in Houdini from AYON project settings houdini shelf definition.
+
+    Newly created shelf sets, shelves and tools are compiled into a single
+    shelf file in a per user cache, keyed by a hash of the shelves
+    settings, template data and the tools' script files. When that file
+    exists the shelves are loaded from it instead.
+
+    Args:
+        use_cache (bool): Load the compiled shelves from the cache when up
+            to date.
+
     """
     current_os = platform.system().lower()
 
@@ -30,8 +145,27 @@ def generate_shelves():
         log.debug("No custom shelves found in project settings.")
         return
 
-    # Get Template data
-    template_data = get_current_context_template_data_with_entity_attrs()
+    # Get Template data, only query it when the settings use templates
+    template_data = {}
+    if _uses_template_data(shelves_configs):
+        template_data = get_current_context_template_data_with_entity_attrs()
+
+    cache_dir = get_shelf_cache_dir("shelves")
+    cache_key = get_cache_key({
+        "addon_version": __version__,
+        "project_name": project_name,
+        "platform": current_os,
+        "shelves": shelves_configs,
+        "template_data": template_data,
+        "source_files": get_shelf_source_files(
+            shelves_configs, template_data),
+    })
+    compiled_filepath = os.path.join(cache_dir, f"shelves_{cache_key}.shelf")
+    use_compiled = use_cache and os.path.exists(compiled_filepath)
+    if use_compiled:
+        log.debug(f"Loading cached shelves: {compiled_filepath}")
+    elif os.path.exists(compiled_filepath):
+        os.remove(compiled_filepath)
 
     for config in shelves_configs:
         selected_option = config["options"]
@@ -52,6 +186,9 @@ def generate_shelves():
                 hou.shelves.loadFile(shelf_set_os_filepath)
                 continue
 
+        if use_compiled:
+            continue
+
         shelf_set_name = shelf_set_config.get('shelf_set_name')
         if not shelf_set_name:
             log.warning("No name found in shelf set definition.")
@@ -66,14 +203,16 @@ def generate_shelves():
             )
             continue
 
-        shelf_set = get_or_create_shelf_set(shelf_set_name)
+        shelf_set = get_or_create_shelf_set(
+            shelf_set_name, file_path=compiled_filepath)
         for shelf_definition in shelves_definition:
             shelf_name = shelf_definition.get('shelf_name')
             if not shelf_name:
                 log.warning("No name found in shelf definition.")
                 continue
 
-            shelf = get_or_create_shelf(shelf_name)
+            shelf = get_or_create_shelf(
+                shelf_name, file_path=compiled_filepath)
 
             if not shelf_definition.get('tools_list'):
                 log.debug(
@@ -96,7 +235,10 @@ def generate_shelves():
                     continue
 
                 tool = get_or_create_tool(
-                    tool_definition, shelf, template_data
+                    tool_definition,
+                    shelf,
+                    template_data,
+                    file_path=compiled_filepath
                 )
 
                 if not tool:
@@ -110,13 +252,28 @@ def generate_shelves():
             if shelf not in shelf_set.shelves():
                 shelf_set.setShelves(shelf_set.shelves() + (shelf,))
 
+    if use_compiled:
+        hou.shelves.loadFile(compiled_filepath)
+        # Mark as recently used
+        os.utime(compiled_filepath)
+        return
+
+    if not os.path.exists(compiled_filepath):
+        # All shelf elements existed already, cache that nothing needs to
+        # be created
+        with open(compiled_filepath, "w") as f:
+            f.write(EMPTY_SHELF_DOCUMENT)
+    remove_stale_shelf_files(cache_dir, "shelves_*.shelf")
+
 
-def get_or_create_shelf_set(shelf_set_label):
+def get_or_create_shelf_set(shelf_set_label, file_path=None):
     """This function verifies if the shelf set label exists. If not,
     creates a new shelf set.
 
     Arguments:
         shelf_set_label (str): The label of the shelf set
+        file_path (Optional[str]): The shelf file to write a new shelf set
+            to. Defaults to the user's default shelf file.
 
     Returns:
         hou.ShelfSet: The shelf set existing or the new one
@@ -130,18 +287,21 @@ def get_or_create_shelf_set(shelf_set_label):
 
     shelf_set_name = shelf_set_label.replace(' ', '_').lower()
     new_shelf_set = hou.shelves.newShelfSet(
+        file_path=file_path,
         name=shelf_set_name,
         label=shelf_set_label
     )
     return new_shelf_set
 
 
-def get_or_create_shelf(shelf_label):
+def get_or_create_shelf(shelf_label, file_path=None):
     """This function verifies if the shelf label exists. If not, creates
     a new shelf.
 
     Arguments:
         shelf_label (str): The label of the shelf
+        file_path (Optional[str]): The shelf file to write a new shelf to.
+            Defaults to the user's default shelf file.
 
     Returns:
         hou.Shelf: The shelf existing or the new one
@@ -154,23 +314,28 @@ def get_or_create_shelf(shelf_label):
 
     shelf_name = shelf_label.replace(' ', '_').lower()
     new_shelf = hou.shelves.newShelf(
+        file_path=file_path,
         name=shelf_name,
         label=shelf_label
     )
     return new_shelf
 
 
-def get_or_create_tool(tool_definition, shelf, template_data):
+def get_or_create_tool(tool_definition, shelf, template_data, file_path=None):
     """This function verifies if the tool exists and updates it. If not,
     creates a new one.
 
     Arguments:
         tool_definition (dict): Dict with label, script, icon and help
         shelf (hou.Shelf): The parent shelf of the tool
+        file_path (Optional[str]): The shelf file to write a new tool to.
+            Defaults to the user's default shelf file.
 
     Returns:
         hou.Tool: The tool updated or the new one
     """
+    # Do not modify the settings
+    tool_definition = dict(tool_definition)
 
     tool_label = tool_definition.get("label")
     if not tool_label:
@@ -205,7 +370,8 @@ def get_or_create_tool(tool_definition, shelf, template_data):
         return existing_tool
 
     tool_name = re.sub(r"[^\w\d]+", "_", tool_label).lower()
-    return hou.shelves.newTool(name=tool_name, **tool_definition)
+    return hou.shelves.newTool(
+        file_path=file_path, name=tool_name, **tool_definition)
 
 
 def get_path_using_template_data(path, template_data):
@@ -427,6 +427,76 @@ def get_ayon_entity_uri_from_representation_context(context: dict) -> str:
     return uris[0]["uri"]
 
 
+def get_collected_stage_consumers(instance, plugins=None, after_order=None):
+    """Return publish plug-ins that declare to use the collected USD stage.
+
+    Plug-ins declare they use the in-memory stage and layers collected by
+    "Collect ROP Sdf Layers and USD Stage" by setting the class attribute
+    `uses_collected_stage = True`.
+
+    Args:
+        instance (pyblish.api.Instance): The instance holding the stage.
+        plugins (Optional[list]): Publish plug-ins to check. When not
+            provided the plug-ins of the publish context's create context
+            are used, falling back to pyblish discovery.
+        after_order (Optional[float]): When provided, only plug-ins with an
+            order larger than this value are returned.
+
+    Returns:
+        list: Plug-ins that use the collected stage for the instance.
+
+    """
+    import pyblish.api
+
+    if plugins is None:
+        context = instance.context
+        plugins = context.data.get("houdiniPublishPlugins")
+        if plugins is None:
+            create_context = context.data.get("create_context")
+            plugins = getattr(create_context, "publish_plugins", None)
+            if plugins is None:
+                plugins = pyblish.api.discover()
+            context.data["houdiniPublishPlugins"] = plugins
+
+    consumers = [
+        plugin for plugin in plugins
+        if getattr(plugin, "uses_collected_stage", False)
+        and (after_order is None or plugin.order > after_order)
+    ]
+    return pyblish.api.plugins_by_instance(consumers, instance)
+
+
+def release_collected_stage(instance, logger=None):
+    """Release the in-memory USD stage and layers collected for an instance.
+
+    This removes the `stage` and `layers` from the instance data so that the
+    copied anonymous layers can be freed once nothing else references them.
+
+    Args:
+        instance (pyblish.api.Instance): The instance to release the stage
+            and layers for.
+        logger (Optional[logging.Logger]): Logger to log to.
+
+    Returns:
+        bool: Whether any stage or layers were released.
+
+    """
+    if logger is None:
+        logger = log
+
+    stage = instance.data.pop("stage", None)
+    layers = instance.data.pop("layers", None)
+    if stage is None and layers is None:
+        return False
+
+    num_anonymous = sum(1 for layer in layers or [] if layer.anonymous)
+    logger.debug(
+        f"Releasing collected USD stage and {num_anonymous} "
+        "anonymous layers."
+    )
+    return True
+
+
 def clear_resolver_cache(
         node=None,
         reload_all_files=True,
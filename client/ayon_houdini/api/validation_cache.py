@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""Remember passed validations across publisher re-validations.
+
+Artists often validate multiple times in a row without changing the nodes
+an instance exports. Expensive validators can skip validating again when a
+fingerprint of the instance's ROP node, its output node and all nodes they
+depend on is unchanged since the validator last passed at the same frame
+with the same settings.
+
+The fingerprint is built from node types, input connections, raw parameter
+values and modification times of referenced files. It does not detect
+changes that are not reflected in those, like changes inside a locked HDA
+definition that was reloaded without a version change.
+"""
+import os
+import json
+import hashlib
+import logging
+from typing import Dict, Optional, Tuple
+
+import hou
+
+from .lib import iter_dependency_nodes
+
+log = logging.getLogger(__name__)
+
+# (validator name, ROP node path) -> fingerprint it last passed with
+_passed: Dict[Tuple[str, str], str] = {}
+
+# Instance data that influences the validation results
+FINGERPRINT_INSTANCE_KEYS = [
+    "productName",
+    "productType",
+    "productBaseType",
+    "families",
+    "frameStart",
+    "frameEnd",
+    "frameStartHandle",
+    "frameEndHandle",
+    "byFrameStep",
+    "creator_attributes",
+]
+
+
+def is_validation_cache_enabled(context) -> bool:
+    """Return whether passed validations are cached for the project."""
+    project_settings = context.data.get("project_settings", {})
+    return (
+        project_settings
+        .get("houdini", {})
+        .get("publish", {})
+        .get("ValidationResultCache", {})
+        .get("enabled", False)
+    )
+
+
+def _update_node_hash(node_hash, node: hou.Node):
+    node_hash.update(node.path().encode())
+    node_hash.update(node.type().nameWithCategory().encode())
+    for input_node in node.inputs():
+        node_hash.update(
+            (input_node.path() if input_node else "").encode())
+
+    is_bypassed = getattr(node, "isBypassed", None)
+    if is_bypassed is not None:
+        node_hash.update(str(is_bypassed()).encode())
+
+    for parm in node.parms():
+        node_hash.update(parm.name().encode())
+        try:
+            node_hash.update(str(parm.rawValue()).encode())
+        except hou.Error:
+            node_hash.update(str(parm.eval()).encode())
+
+        template = parm.parmTemplate()
+        if (
+            template.type() == hou.parmTemplateType.String
+            and template.stringType() == hou.stringParmType.FileReference
+        ):
+            # Changes to files on disk change the cooked result
+            path = parm.eval()
+            if path and os.path.isfile(path):
+                node_hash.update(str(os.path.getmtime(path)).encode())
+
+
+def get_instance_fingerprint(instance) -> Optional[str]:
+    """Return fingerprint of everything the instance's validation uses.
+
+    The fingerprint is computed once per publish and stored in
+    `instance.data["validationFingerprint"]`.
+
+    Args:
+        instance (pyblish.api.Instance): The publish instance.
+
+    Returns:
+        Optional[str]: The fingerprint, None if the instance has no ROP.
+
+    """
+    if "validationFingerprint" in instance.data:
+        return instance.data["validationFingerprint"]
+
+    rop_node = hou.node(instance.data.get("instance_node") or "")
+    if rop_node is None:
+        instance.data["validationFingerprint"] = None
+        return None
+
+    start_nodes = [rop_node]
+    output_node = instance.data.get("output_node")
+    if isinstance(output_node, hou.Node):
+        start_nodes.append(output_node)
+    for parm_name in ("soppath", "sop_path", "loppath", "coppath"):
+        parm = rop_node.parm(parm_name)
+        if parm is not None:
+            start_nodes.append(rop_node.node(parm.eval()))
+
+    node_hash = hashlib.sha1()
+    node_hash.update(hou.hipFile.path().encode())
+    node_hash.update(json.dumps(
+        {key: instance.data.get(key) for key in FINGERPRINT_INSTANCE_KEYS},
+        sort_keys=True,
+        default=str
+    ).encode())
+
+    processed = set()
+    for start_node in start_nodes:
+        for node in iter_dependency_nodes(start_node):
+            if node.path() in processed:
+                continue
+            processed.add(node.path())
+            _update_node_hash(node_hash, node)
+
+    fingerprint = node_hash.hexdigest()
+    instance.data["validationFingerprint"] = fingerprint
+    return fingerprint
+
+
+def _get_plugin_settings(plugin, instance) -> dict:
+    """Return the project settings applied to the plug-in's attributes."""
+    category = getattr(plugin, "settings_category", None) or "houdini"
+    project_settings = instance.context.data.get("project_settings", {})
+    return (
+        project_settings
+        .get(category, {})
+        .get("publish", {})
+        .get(plugin.__class__.__name__, {})
+    )
+
+
+def _get_plugin_fingerprint(plugin, instance) -> Optional[str]:
+    """Return the instance fingerprint combined with the plug-in state.
+
+    Validators cook at the current frame and their behavior depends on
+    their settings, so both are part of what a passed validation is
+    remembered for.
+    """
+    fingerprint = get_instance_fingerprint(instance)
+    if fingerprint is None:
+        return None
+
+    plugin_hash = hashlib.sha1(fingerprint.encode())
+    plugin_hash.update(str(hou.intFrame()).encode())
+    plugin_hash.update(json.dumps(
+        _get_plugin_settings(plugin, instance),
+        sort_keys=True,
+        default=str
+    ).encode())
+    return plugin_hash.hexdigest()
+
+
+def _get_key(plugin, instance) -> Tuple[str, str]:
+    return plugin.__class__.__name__, instance.data.get("instance_node", "")
+
+
+def has_passed(plugin, instance) -> bool:
+    """Return whether the plug-in passed before with the same fingerprint."""
+    fingerprint = _get_plugin_fingerprint(plugin, instance)
+    if fingerprint is None:
+        return False
+    return _passed.get(_get_key(plugin, instance)) == fingerprint
+
+
+def set_passed(plugin, instance):
+    """Remember the plug-in passed for the current fingerprint."""
+    fingerprint = _get_plugin_fingerprint(plugin, instance)
+    if fingerprint is not None:
+        _passed[_get_key(plugin, instance)] = fingerprint
+
+
+def clear():
+    """Forget all passed validations.
+
+    Called when a scene is opened or a new scene is started, since node
+    paths of the previous scene no longer refer to the same nodes.
+    """
+    _passed.clear()
@@ -71,6 +71,7 @@ class CreateBGEO(plugin.HoudiniCreator):
     def get_instance_attr_defs(self):
         render_target_items = {
             "local": "Local machine rendering",
+            "local_parallel": "Local parallel rendering (hython workers)",
             "local_no_render": "Use existing frames (local)",
             "farm": "Farm Rendering",
         }
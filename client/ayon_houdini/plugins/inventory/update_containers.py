@@ -0,0 +1,134 @@
+import collections
+
+import ayon_api
+from ayon_core.pipeline import InventoryAction, get_current_project_name
+from ayon_core.pipeline.load import (
+    get_loaders_by_name,
+    get_representation_contexts,
+)
+from ayon_houdini.api.plugin import HoudiniLoader
+
+
+class UpdateToLatestInBulk(InventoryAction):
+    """Update the selected containers to their latest version at once.
+
+    The latest representations are queried together and containers of
+    Houdini loaders are updated per loader through
+    `HoudiniLoader.update_containers`, which resolves all filepaths in one
+    pass and cooks the scene only once.
+    """
+
+    label = "Update to latest (bulk)"
+    icon = "angle-double-up"
+    color = "#888888"
+    order = 98
+
+    @staticmethod
+    def is_compatible(container) -> bool:
+        return bool(
+            container.get("representation") and container.get("loader")
+        )
+
+    def process(self, containers):
+        containers_by_project = collections.defaultdict(list)
+        for container in containers:
+            project_name = (
+                container.get("project_name") or get_current_project_name()
+            )
+            containers_by_project[project_name].append(container)
+
+        loaders_by_name = get_loaders_by_name()
+        for project_name, project_containers in (
+            containers_by_project.items()
+        ):
+            self._update_project_containers(
+                project_name, project_containers, loaders_by_name
+            )
+        return True
+
+    def _get_latest_repre_contexts(self, project_name, containers):
+        """Return the latest representation context per current
+        representation id of the containers."""
+        repre_ids = {container["representation"] for container in containers}
+        repre_entities = list(ayon_api.get_representations(
+            project_name,
+            representation_ids=repre_ids,
+            fields={"id", "name", "versionId"}
+        ))
+        version_ids = {repre["versionId"] for repre in repre_entities}
+        product_id_by_version_id = {
+            version["id"]: version["productId"]
+            for version in ayon_api.get_versions(
+                project_name,
+                version_ids=version_ids,
+                fields={"id", "productId"}
+            )
+        }
+        last_versions = ayon_api.get_last_versions(
+            project_name,
+            set(product_id_by_version_id.values()),
+            fields={"id", "productId"}
+        )
+        last_version_ids = {
+            version["id"] for version in last_versions.values()
+        }
+        latest_repre_by_key = {
+            (repre["versionId"], repre["name"]): repre
+            for repre in ayon_api.get_representations(
+                project_name, version_ids=last_version_ids
+            )
+        }
+        repre_contexts = get_representation_contexts(
+            project_name, list(latest_repre_by_key.values())
+        )
+
+        output = {}
+        for repre in repre_entities:
+            product_id = product_id_by_version_id.get(repre["versionId"])
+            last_version = last_versions.get(product_id)
+            if last_version is None:
+                continue
+            latest_repre = latest_repre_by_key.get(
+                (last_version["id"], repre["name"])
+            )
+            if latest_repre is not None:
+                output[repre["id"]] = repre_contexts[latest_repre["id"]]
+        return output
+
+    def _update_project_containers(
+        self, project_name, containers, loaders_by_name
+    ):
+        latest_repre_contexts = self._get_latest_repre_contexts(
+            project_name, containers
+        )
+
+        containers_by_loader = collections.defaultdict(list)
+        for container in containers:
+            context = latest_repre_contexts.get(container["representation"])
+            if context is None:
+                self.log.warning(
+                    "No latest representation found for container: "
+                    f"{container['objectName']}"
+                )
+                continue
+
+            if context["representation"]["id"] == container["representation"]:
+                # Already up to date
+                continue
+            containers_by_loader[container["loader"]].append(
+                (container, context)
+            )
+
+        for loader_name, loader_containers in containers_by_loader.items():
+            loader_class = loaders_by_name.get(loader_name)
+            if loader_class is None:
+                self.log.warning(f"Loader '{loader_name}' not found.")
+                continue
+
+            loader = loader_class()
+            if isinstance(loader, HoudiniLoader):
+                loader.update_containers(loader_containers)
+                continue
+
+            for container, context in loader_containers:
+                loader.update(container, context)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import json
+import time
 import collections
 from typing import Any, Optional, List
 
@@ -17,6 +18,8 @@ from ayon_core.pipeline.load import (
 import hou
 
 MEMBER_ATTR_NAME = "AYON_layout_members"
+# Name of the geo node instancing the elements in the layout container
+INSTANCER_NODE_NAME = "instances"
 
 # The Extract Layout logic in Maya was built to export transformation matrices
 # that match the matrices in Unreal. We will need to convert that back to
@@ -65,6 +68,7 @@ class LayoutLoader(plugin.HoudiniLoader):
     }
     # Settings
     remove_layout_container_members = False
+    instance_elements = False
 
     def _get_repre_contexts_by_version_id(
         self,
@@ -144,21 +148,27 @@ class LayoutLoader(plugin.HoudiniLoader):
 
         return None
 
-    def _process_element(
+    def _get_element_load_context(
         self,
         element: dict[str, Any],
-        repre_contexts_by_version_id: dict[str, list[dict]]
-    ) -> list[str]:
-        """Load one of the elements from a layout JSON file.
+        repre_contexts_by_version_id: dict[str, list[dict]],
+        loaders_by_name: Optional[dict[str, type]] = None
+    ) -> Optional[tuple[type, dict[str, dict[str, Any]]]]:
+        """Return the loader and representation context to load an element.
 
         Each element will specify a version for which we will load
-        the first representation.
+        the first representation supported by the element's loader.
+
+        Returns:
+            Optional[tuple[type, dict[str, dict[str, Any]]]]: The loader
+                plugin and representation context, None if the element
+                can't be loaded.
         """
         version_id = element.get("version")
         if not version_id:
             self.log.warning(
                 f"No version id found in element: {element}")
-            return []
+            return None
 
         repre_contexts: list[dict] = repre_contexts_by_version_id.get(
             version_id, []
@@ -167,7 +177,7 @@ class LayoutLoader(plugin.HoudiniLoader):
             self.log.error(
                 "No representations found for version id:"
                 f" {version_id}")
-            return []
+            return None
 
         def _sort_by_preferred_order(_repre_context: dict) -> int:
             _repre_name: str = _repre_context["representation"]["name"]
@@ -180,13 +190,14 @@ class LayoutLoader(plugin.HoudiniLoader):
 
         loader_name = self._get_loader_name(element)
         # Find loader plugin
-        # TODO: Cache the loaders by name once
-        loader = get_loaders_by_name().get(loader_name, None)
+        if loaders_by_name is None:
+            loaders_by_name = get_loaders_by_name()
+        loader = loaders_by_name.get(loader_name, None)
         if not loader:
             self.log.error(
                 f"No valid loader '{loader_name}' found for: {element}"
             )
-            return []
+            return None
 
         # Find a matching representation for the loader among
         # the ordered representations of the version
@@ -203,7 +214,24 @@ class LayoutLoader(plugin.HoudiniLoader):
                 f"Loader '{loader_name}' does not support"
                 f" representation contexts: {repre_contexts}"
             )
+            return None
+
+        return loader, supported_repre_context
+
+    def _process_element(
+        self,
+        element: dict[str, Any],
+        repre_contexts_by_version_id: dict[str, list[dict]],
+        loaders_by_name: Optional[dict[str, type]] = None
+    ) -> list[hou.Node]:
+        """Load one of the elements from a layout JSON file."""
+        load_context = self._get_element_load_context(
+            element, repre_contexts_by_version_id, loaders_by_name
+        )
+        if load_context is None:
             return []
+        loader, supported_repre_context = load_context
+        loader_name = loader.__name__
 
         # Load the representation
         # TODO: Currently load API does not enforce a return data structure
@@ -230,6 +258,221 @@ class LayoutLoader(plugin.HoudiniLoader):
             self.set_transformation(container, element)
         return containers
 
+    def _load_instanced_elements(
+        self,
+        elements: list[dict[str, Any]],
+        repre_contexts_by_version_id: dict[str, list[dict]],
+        parent: hou.Node,
+        asset_containers: Optional[dict[str, hou.Node]] = None
+    ) -> list[hou.Node]:
+        """Load each unique representation of the elements only once and
+        instance it on all of its elements.
+
+        The containers of the representations are hidden and a geo node in
+        `parent` copies their geometry as packed instances onto points with
+        the transformations of the elements.
+
+        Args:
+            elements (list[dict[str, Any]]): Elements from a layout JSON.
+            repre_contexts_by_version_id (dict[str, list[dict]]): The
+                representation contexts of the elements' versions.
+            parent (hou.Node): The node to create the instancer in.
+            asset_containers (Optional[dict[str, hou.Node]]): Containers
+                loaded before, by representation id. These are not loaded
+                again.
+
+        Returns:
+            list[hou.Node]: The containers of the instanced representations.
+        """
+        start = time.perf_counter()
+        loaders_by_name = get_loaders_by_name()
+        asset_containers = dict(asset_containers or {})
+        elements_by_repre_id: dict[str, list[dict[str, Any]]] = (
+            collections.defaultdict(list)
+        )
+        load_contexts: dict[str, tuple[type, dict[str, dict[str, Any]]]] = {}
+        for element in elements:
+            load_context = self._get_element_load_context(
+                element, repre_contexts_by_version_id, loaders_by_name
+            )
+            if load_context is None:
+                continue
+            repre_id: str = load_context[1]["representation"]["id"]
+            elements_by_repre_id[repre_id].append(element)
+            load_contexts.setdefault(repre_id, load_context)
+
+        loaded_paths: dict[str, str] = {}
+        with hou.undos.disabler(), pipeline.batch_containerise() as batch:
+            for repre_id, (loader, repre_context) in load_contexts.items():
+                if repre_id in asset_containers:
+                    continue
+
+                result = load_with_repre_context(
+                    loader, repre_context=repre_context
+                )
+                if not isinstance(result, hou.Node):
+                    self.log.warning(
+                        f"Loader {loader} returned invalid container data:"
+                        f" {result}"
+                    )
+                    continue
+
+                # Only show the asset through its instances
+                result.setDisplayFlag(False)
+                loaded_paths[repre_id] = result.path()
+
+        for repre_id, path in loaded_paths.items():
+            asset_containers[repre_id] = batch.get_container(path)
+        loaded = time.perf_counter()
+
+        with hou.undos.disabler():
+            self._build_instancer(
+                parent, asset_containers, elements_by_repre_id
+            )
+        end = time.perf_counter()
+        self.log.info(
+            f"Instanced {len(elements_by_repre_id)} representations on"
+            f" {len(elements)} layout elements in {end - start:.2f}s"
+            f" (loading: {loaded - start:.2f}s, instancing:"
+            f" {end - loaded:.2f}s)"
+        )
+        return [
+            asset_containers[repre_id] for repre_id in elements_by_repre_id
+            if repre_id in asset_containers
+        ]
+
+    def _build_instancer(
+        self,
+        parent: hou.Node,
+        asset_containers: dict[str, hou.Node],
+        elements_by_repre_id: dict[str, list[dict[str, Any]]]
+    ) -> hou.Node:
+        """Create or rebuild the geo node instancing the layout elements.
+
+        The transformations of all elements are stashed as points with the
+        `P` and `transform` attributes, the element's `name` and the
+        `asset_index` of the representation. Per representation the
+        container's geometry is copied onto its points as packed instances.
+
+        Args:
+            parent (hou.Node): The node to create the instancer in.
+            asset_containers (dict[str, hou.Node]): The containers by
+                representation id.
+            elements_by_repre_id (dict[str, list[dict[str, Any]]]): The
+                layout elements to instance per representation id.
+
+        Returns:
+            hou.Node: The instancer geo node.
+        """
+        instancer = parent.node(INSTANCER_NODE_NAME)
+        if instancer is None:
+            instancer = parent.createNode(
+                "geo", node_name=INSTANCER_NODE_NAME)
+        for child in instancer.children():
+            child.destroy()
+
+        positions: list[hou.Vector3] = []
+        transforms: list[float] = []
+        names: list[str] = []
+        asset_indices: list[int] = []
+
+        stash = instancer.createNode("stash", node_name="placements")
+        merge = instancer.createNode("merge", node_name="merge_instances")
+        asset_index = 0
+        for repre_id, elements in elements_by_repre_id.items():
+            container = asset_containers.get(repre_id)
+            if container is None:
+                continue
+
+            for element in elements:
+                matrix = unreal_matrix_to_houdini(element["transform_matrix"])
+                positions.append(matrix.extractTranslates())
+                transforms.extend(
+                    value
+                    for row in matrix.asTupleOfTuples()[:3]
+                    for value in row[:3]
+                )
+                names.append(element["instance_name"])
+                asset_indices.append(asset_index)
+
+            object_merge = instancer.createNode(
+                "object_merge", node_name=f"asset{asset_index}")
+            object_merge.setParms({"objpath1": container.path()})
+
+            points = instancer.createNode(
+                "blast", node_name=f"points{asset_index}")
+            points.setParms({
+                "group": f"@asset_index={asset_index}",
+                "grouptype": "points",
+                "negate": True
+            })
+            points.setInput(0, stash)
+
+            copy_to_points = instancer.createNode(
+                "copytopoints", node_name=f"instances{asset_index}")
+            copy_to_points.setParms({"pack": True})
+            copy_to_points.setInput(0, object_merge)
+            copy_to_points.setInput(1, points)
+            merge.setNextInput(copy_to_points)
+            asset_index += 1
+
+        geometry = hou.Geometry()
+        geometry.addAttrib(
+            hou.attribType.Point, "transform", hou.Matrix3(1).asTuple())
+        geometry.addAttrib(hou.attribType.Point, "name", "")
+        geometry.addAttrib(hou.attribType.Point, "asset_index", -1)
+        geometry.createPoints(positions)
+        geometry.setPointFloatAttribValues("transform", transforms)
+        geometry.setPointStringAttribValues("name", names)
+        geometry.setPointIntAttribValues("asset_index", asset_indices)
+        stash.parm("stash").set(geometry)
+
+        output = instancer.createNode("null", node_name="OUT_instances")
+        output.setInput(0, merge)
+        output.setDisplayFlag(True)
+        output.setRenderFlag(True)
+        instancer.layoutChildren()
+        return instancer
+
+    def _load_elements(
+        self,
+        elements: list[dict[str, Any]],
+        repre_contexts_by_version_id: dict[str, list[dict]]
+    ) -> list[hou.Node]:
+        """Load elements from a layout JSON file in one batch.
+
+        The nodes are created with undo recording disabled and the
+        containers are parented under the container network all at once,
+        instead of once per element.
+
+        Returns:
+            list[hou.Node]: The loaded containers.
+        """
+        start = time.perf_counter()
+        loaders_by_name = get_loaders_by_name()
+        member_paths: list[str] = []
+        with hou.undos.disabler(), pipeline.batch_containerise() as batch:
+            for element in elements:
+                loaded_containers = self._process_element(
+                    element,
+                    repre_contexts_by_version_id,
+                    loaders_by_name
+                )
+                member_paths.extend(node.path() for node in loaded_containers)
+            loaded = time.perf_counter()
+
+        containers: list[hou.Node] = [
+            batch.get_container(path) for path in member_paths
+        ]
+        end = time.perf_counter()
+        self.log.info(
+            f"Loaded {len(containers)} containers for {len(elements)}"
+            f" layout elements in {end - start:.2f}s (loading:"
+            f" {loaded - start:.2f}s, parenting containers:"
+            f" {end - loaded:.2f}s)"
+        )
+        return containers
+
     def set_transformation(
             self, container: hou.Node, element: dict[str, Any]) -> None:
         """Set the transformation of the container root node based on the
@@ -273,13 +516,16 @@ class LayoutLoader(plugin.HoudiniLoader):
         repre_contexts_by_version_id = self._get_repre_contexts_by_version_id(
             data, context
         )
-        container_members: list[hou.Node] = []
-        for element in data:
-            loaded_containers = self._process_element(
-                element,
-                repre_contexts_by_version_id
+        if self.instance_elements:
+            container_members: list[hou.Node] = (
+                self._load_instanced_elements(
+                    data, repre_contexts_by_version_id, subset_node
+                )
+            )
+        else:
+            container_members = self._load_elements(
+                data, repre_contexts_by_version_id
             )
-            container_members.extend(loaded_containers)
 
         self[:] = [subset_node]
 
@@ -306,8 +552,35 @@ class LayoutLoader(plugin.HoudiniLoader):
         repre_contexts_by_version_id = self._get_repre_contexts_by_version_id(
             data, context
         )
-        member_containers = self._get_members(container["node"])
-        updated_containers: list[hou.Node] = []
+        container_node = container["node"]
+        member_containers = self._get_members(container_node)
+        if container_node.node(INSTANCER_NODE_NAME):
+            # Rebuild the instances, loading only new representations
+            asset_containers: dict[str, hou.Node] = {
+                node.evalParm("representation"): node
+                for node in member_containers
+                if node.parm("representation")
+            }
+            updated_containers = self._load_instanced_elements(
+                data,
+                repre_contexts_by_version_id,
+                container_node,
+                asset_containers
+            )
+            self._set_members(container_node, updated_containers)
+
+            # The hidden asset containers only exist to be instanced, so
+            # remove those no longer instanced by the layout
+            updated_paths = {node.path() for node in updated_containers}
+            for node in member_containers:
+                if node.path() not in updated_paths:
+                    node.destroy()
+            container_node.setParms({
+                "representation": str(repre_entity["id"])
+            })
+            return
+
+        new_elements: list[dict[str, Any]] = []
         for element in data:
             # Find a matching container node among the members
             # TODO: Make this lookup more reliable than just
@@ -322,13 +595,12 @@ class LayoutLoader(plugin.HoudiniLoader):
                 for update_container in update_containers:
                     self.set_transformation(update_container, element)
             else:
-                # Load new elements and add them to container
-                loaded_containers: list[hou.Node] = self._process_element(
-                    element, repre_contexts_by_version_id
-                )
-                updated_containers.extend(loaded_containers)
+                new_elements.append(element)
 
-        container_node = container["node"]
+        # Load new elements and add them to container
+        updated_containers: list[hou.Node] = self._load_elements(
+            new_elements, repre_contexts_by_version_id
+        )
         self._set_members(container_node, updated_containers)
         container_node.setParms({
             "representation": str(repre_entity["id"])
@@ -5,6 +5,7 @@ import hou
 import pyblish.api
 
 from ayon_houdini.api import plugin
+from ayon_houdini.api.file_sequence import generate_expected_files
 from ayon_houdini.api.lib import evalParmNoFrame
 
 
@@ -53,7 +54,7 @@ class CollectArnoldROPRenderProducts(plugin.HoudiniInstancePlugin):
         render_products.append(beauty_product)
 
         files_by_aov = {
-            "": self.generate_expected_files(instance, beauty_product)
+            "": generate_expected_files(instance, beauty_product)
         }
 
         # Assume it's a multipartExr Render.
@@ -86,7 +87,7 @@ class CollectArnoldROPRenderProducts(plugin.HoudiniInstancePlugin):
                 prefix=default_prefix, suffix=label
             )
             render_products.append(aov_product)
-            files_by_aov[label] = self.generate_expected_files(
+            files_by_aov[label] = generate_expected_files(
                 instance, aov_product
             )
 
@@ -136,28 +137,3 @@ class CollectArnoldROPRenderProducts(plugin.HoudiniInstancePlugin):
                 product_name = prefix
 
         return product_name
-
-    def generate_expected_files(self, instance, path):
-        """Create expected files in instance data"""
-
-        dir = os.path.dirname(path)
-        file = os.path.basename(path)
-
-        if "#" in file:
-            def replace(match):
-                return "%0{}d".format(len(match.group()))
-
-            file = re.sub("#+", replace, file)
-
-        if "%" not in file:
-            return path
-
-        expected_files = []
-        start = instance.data["frameStartHandle"]
-        end = instance.data["frameEndHandle"]
-
-        for i in range(int(start), (int(end) + 1)):
-            expected_files.append(
-                os.path.join(dir, (file % i)).replace("\\", "/"))
-
-        return expected_files
@@ -1,83 +1,129 @@
 from collections import deque
+from typing import Dict, FrozenSet, List, Tuple
 
+import hou
 import pyblish.api
 from ayon_core.pipeline import registered_host
 from ayon_houdini.api import plugin
 
 
-def get_container_members(container):
-    node = container["node"]
-    # Usually the loaded containers don't have any complex references
-    # and the contained children should be all we need. So we disregard
-    # checking for .references() on the nodes.
-    members = set(node.allSubChildren())
-    members.add(node)  # include the node itself
-    return members
+class ContainerIndex(object):
+    """Look up the loaded containers a node is a member of.
 
+    A node is a member of a container when it is the container node itself
+    or any node inside of it. Instead of collecting the member nodes of all
+    containers, membership is resolved from the node path by looking up
+    its parent paths. Resolved paths are remembered, so the cost scales
+    with the amount of distinct paths looked up.
 
-def collect_input_containers(containers, nodes):
-    """Collect containers that contain any of the node in `nodes`.
+    Args:
+        containers (List[dict]): The scene's containers, as returned by
+            `host.ls()`.
 
-    This will return any loaded AYON container that contains at least one of
-    the nodes. As such, the AYON container is an input for it. Or in short,
-    there are member nodes of that container.
+    """
 
-    Returns:
-        list: Loaded containers that contain the `nodes`
+    def __init__(self, containers: List[dict]):
+        self._containers_by_node_path: Dict[str, List[dict]] = {}
+        for container in containers:
+            self._containers_by_node_path.setdefault(
+                container["objectName"], []).append(container)
 
-    """
-    # Assume the containers have collected their cached '_members' data
-    # in the collector.
-    return [container for container in containers
-            if any(node in container["_members"] for node in nodes)]
+        # Containers per resolved path, including those of its parents
+        self._resolved: Dict[str, Tuple[dict, ...]] = {"": tuple()}
 
+    def get_containers(self, node_path: str) -> Tuple[dict, ...]:
+        """Return the containers the node at the path is a member of."""
+        unresolved = []
+        path = node_path
+        while path not in self._resolved:
+            unresolved.append(path)
+            path = path.rsplit("/", 1)[0]
 
-def iter_upstream(node):
-    """Yields all upstream inputs for the current node.
+        containers = self._resolved[path]
+        for path in reversed(unresolved):
+            direct_containers = self._containers_by_node_path.get(path)
+            if direct_containers:
+                containers = containers + tuple(direct_containers)
+            self._resolved[path] = containers
+        return containers
 
-    This includes all `node.inputAncestors()` but also traverses through all
-    `node.references()` for the node itself and for any of the upstream nodes.
-    This method has no max-depth and will collect all upstream inputs.
 
-    Yields:
-        hou.Node: The upstream nodes, including references.
+class UpstreamCache(object):
+    """Memoized upstream traversal shared by all instances of a publish.
+
+    The upstream of a node are its `node.inputAncestors()` and the
+    `node.references()` of all those nodes, including their ancestors and
+    references again. The upstream of referenced nodes is memoized too, so
+    instances sharing parts of their network only traverse them once.
 
     """
 
-    upstream = node.inputAncestors(
-        include_ref_inputs=True, follow_subnets=True
-    )
+    # Amount of nested referenced nodes whose upstream is memoized before
+    # traversing further references without memoizing them
+    max_depth = 100
 
-    # Initialize process queue with the node's ancestors itself
-    queue = deque(upstream)
-    collected = set(upstream)
+    def __init__(self):
+        self._upstream: Dict[hou.Node, FrozenSet[hou.Node]] = {}
+        self._in_progress = set()
 
-    # Traverse upstream references for all nodes and yield them as we
-    # process the queue.
-    while queue:
-        upstream_node = queue.pop()
-        yield upstream_node
+    def get_upstream(self, node: hou.Node) -> FrozenSet[hou.Node]:
+        """Return all upstream inputs and references for the node."""
+        upstream = self._upstream.get(node)
+        if upstream is not None:
+            return upstream
+
+        self._in_progress.add(node)
+        try:
+            collected = set(node.inputAncestors(
+                include_ref_inputs=True, follow_subnets=True
+            ))
+            queue = deque(collected)
+            while queue:
+                upstream_node = queue.pop()
+                for reference in upstream_node.references():
+                    if reference in collected:
+                        continue
+
+                    collected.add(reference)
+                    # Process the references of the referenced node too
+                    queue.append(reference)
+                    if (
+                        reference not in self._in_progress
+                        and len(self._in_progress) < self.max_depth
+                    ):
+                        # Memoized upstream already includes everything
+                        # upstream of its nodes, so it needs no processing
+                        collected.update(self.get_upstream(reference))
+                        continue
+
+                    ancestors = [
+                        ancestor for ancestor in reference.inputAncestors(
+                            include_ref_inputs=True, follow_subnets=True
+                        )
+                        if ancestor not in collected
+                    ]
+                    collected.update(ancestors)
+                    queue.extend(ancestors)
+        finally:
+            self._in_progress.discard(node)
+
+        upstream = frozenset(collected)
+        self._upstream[node] = upstream
+        return upstream
 
-        # Find its references that are not collected yet.
-        references = upstream_node.references()
-        references = [n for n in references if n not in collected]
 
-        queue.extend(references)
-        collected.update(references)
+def iter_upstream(node):
+    """Yields all upstream inputs for the current node.
 
-        # Include the references' ancestors that have not been collected yet.
-        for reference in references:
-            if reference in collected:
-                # Might have been collected in previous iteration
-                continue
+    This includes all `node.inputAncestors()` but also traverses through all
+    `node.references()` for any of the upstream nodes. This method has no
+    max-depth and will collect all upstream inputs.
 
-            ancestors = reference.inputAncestors(
-                include_ref_inputs=True, follow_subnets=True
-            )
-            ancestors = [n for n in ancestors if n not in collected]
+    Yields:
+        hou.Node: The upstream nodes, including references.
 
-            queue.extend(ancestors)
-            collected.update(ancestors)
+    """
+    yield from UpstreamCache().get_upstream(node)
 
 
 class CollectUpstreamInputs(plugin.HoudiniInstancePlugin):
@@ -108,30 +154,39 @@ class CollectUpstreamInputs(plugin.HoudiniInstancePlugin):
 
         # For large scenes the querying of "host.ls()" can be relatively slow
         # e.g. up to a second. Many instances calling it easily slows this
-        # down. As such, we cache it so we trigger it only once.
+        # down. As such, we cache it so we trigger it only once. The same
+        # goes for the container lookup and the upstream traversal which are
+        # shared by all instances.
         # todo: Instead of hidden cache make "CollectContainers" plug-in
-        cache_key = "__cache_containers"
-        scene_containers = instance.context.data.get(cache_key, None)
-        if scene_containers is None:
+        context = instance.context
+        container_index = context.data.get("__cache_container_index")
+        if container_index is None:
             # Query the scenes' containers if there's no cache yet
             host = registered_host()
             scene_containers = list(host.ls())
-            for container in scene_containers:
-                # Embed the members into the container dictionary
-                container_members = set(get_container_members(container))
-                container["_members"] = container_members
-            instance.context.data[cache_key] = scene_containers
+            context.data["__cache_containers"] = scene_containers
+            container_index = ContainerIndex(scene_containers)
+            context.data["__cache_container_index"] = container_index
 
         inputs = []
-        if scene_containers:
+        if context.data["__cache_containers"]:
+            upstream_cache = context.data.setdefault(
+                "__cache_upstream", UpstreamCache())
+
             # Collect all upstream parents
-            nodes = list(iter_upstream(output))
-            nodes.append(output)
+            nodes = set(upstream_cache.get_upstream(output))
+            nodes.add(output)
 
             # Collect containers for the given set of nodes
-            containers = collect_input_containers(scene_containers, nodes)
-
-            inputs = [c["representation"] for c in containers]
+            containers = {}
+            for node in nodes:
+                for container in container_index.get_containers(node.path()):
+                    containers[container["objectName"]] = container
+
+            inputs = [
+                containers[path]["representation"]
+                for path in sorted(containers)
+            ]
 
         instance.data["inputRepresentations"] = inputs
         self.log.debug("Collected inputs: %s" % inputs)
@@ -1,4 +1,3 @@
-import re
 import os
 
 import hou
@@ -6,6 +5,7 @@ import pyblish.api
 
 from ayon_houdini.api.lib import evalParmNoFrame
 from ayon_houdini.api import plugin
+from ayon_houdini.api.file_sequence import generate_expected_files
 
 
 class CollectMantraROPRenderProducts(plugin.HoudiniInstancePlugin):
@@ -54,8 +54,7 @@ class CollectMantraROPRenderProducts(plugin.HoudiniInstancePlugin):
         render_products.append(beauty_product)
 
         files_by_aov = {
-            "beauty": self.generate_expected_files(instance,
-                                                   beauty_product)
+            "beauty": generate_expected_files(instance, beauty_product)
         }
 
         # Assume it's a multipartExr Render.
@@ -80,7 +79,7 @@ class CollectMantraROPRenderProducts(plugin.HoudiniInstancePlugin):
                         )
                         render_products.append(aov_product)
 
-                        files_by_aov[var] = self.generate_expected_files(instance, aov_product)     # noqa
+                        files_by_aov[var] = generate_expected_files(instance, aov_product)     # noqa
 
                         # Set to False as soon as we have a separated aov.
                         multipartExr = False
@@ -112,28 +111,3 @@ class CollectMantraROPRenderProducts(plugin.HoudiniInstancePlugin):
             product_name = prefix_base + "." + suffix + ext
 
         return product_name
-
-    def generate_expected_files(self, instance, path):
-        """Create expected files in instance data"""
-
-        dir = os.path.dirname(path)
-        file = os.path.basename(path)
-
-        if "#" in file:
-            def replace(match):
-                return "%0{}d".format(len(match.group()))
-
-            file = re.sub("#+", replace, file)
-
-        if "%" not in file:
-            return path
-
-        expected_files = []
-        start = instance.data["frameStartHandle"]
-        end = instance.data["frameEndHandle"]
-
-        for i in range(int(start), (int(end) + 1)):
-            expected_files.append(
-                os.path.join(dir, (file % i)).replace("\\", "/"))
-
-        return expected_files
@@ -6,6 +6,7 @@ import pyblish.api
 
 from ayon_houdini.api.lib import evalParmNoFrame
 from ayon_houdini.api import plugin
+from ayon_houdini.api.file_sequence import generate_expected_files
 
 
 class CollectRedshiftROPRenderProducts(plugin.HoudiniInstancePlugin):
@@ -60,7 +61,7 @@ class CollectRedshiftROPRenderProducts(plugin.HoudiniInstancePlugin):
         )
         render_products = [beauty_product]
         files_by_aov = {
-            beauty_suffix: self.generate_expected_files(
+            beauty_suffix: generate_expected_files(
                 instance,
                 beauty_product
             )
@@ -94,7 +95,7 @@ class CollectRedshiftROPRenderProducts(plugin.HoudiniInstancePlugin):
                 )
                 render_products.append(aov_product)
 
-                files_by_aov[aov_suffix] = self.generate_expected_files(
+                files_by_aov[aov_suffix] = generate_expected_files(
                     instance,
                     aov_product
                 )
@@ -144,28 +145,3 @@ class CollectRedshiftROPRenderProducts(plugin.HoudiniInstancePlugin):
                 product_name = prefix
 
         return product_name
-
-    def generate_expected_files(self, instance, path):
-        """Create expected files in instance data"""
-
-        dir = os.path.dirname(path)
-        file = os.path.basename(path)
-
-        if "#" in file:
-            def replace(match):
-                return "%0{}d".format(len(match.group()))
-
-            file = re.sub("#+", replace, file)
-
-        if "%" not in file:
-            return path
-
-        expected_files = []
-        start = instance.data["frameStartHandle"]
-        end = instance.data["frameEndHandle"]
-
-        for i in range(int(start), (int(end) + 1)):
-            expected_files.append(
-                os.path.join(dir, (file % i)).replace("\\", "/"))
-
-        return expected_files
@@ -9,6 +9,7 @@ import pyblish.api
 
 from ayon_core.pipeline import PublishError
 from ayon_houdini.api import plugin
+from ayon_houdini.api.file_sequence import generate_expected_files
 from ayon_houdini.api.usd import (
     get_usd_render_rop_rendersettings
 )
@@ -30,6 +31,7 @@ class CollectRenderProducts(plugin.HoudiniInstancePlugin):
     # This plugin should run after CollectUsdRender
     #   and, before CollectLocalRenderInstances
     order = pyblish.api.CollectorOrder + 0.04
+    uses_collected_stage = True
     families = ["usdrender"]
 
     def process(self, instance):
@@ -127,7 +129,7 @@ class CollectRenderProducts(plugin.HoudiniInstancePlugin):
                 )
                 self.log.warning("Skipping Render Product: %s", render_product)
 
-            files_by_product[aov_identifier] = self.generate_expected_files(
+            files_by_product[aov_identifier] = generate_expected_files(
                 instance,
                 filename
             )
@@ -219,42 +221,3 @@ class CollectRenderProducts(plugin.HoudiniInstancePlugin):
             return []
 
         return render_settings.GetProductsRel().GetTargets()
-
-    def generate_expected_files(self, instance, path):
-        """Generate full sequence of expected files from a filepath.
-
-        The filepath should have '#' token as placeholder for frame numbers or
-        should have %04d or %d placeholders. The `#` characters indicate frame
-        number and padding, e.g. #### becomes 0001 for frame 1.
-
-        Args:
-            instance (pyblish.api.Instance): The publish instance.
-            path (str): The filepath to generate the list of output files for.
-
-        Returns:
-            list: Filepath per frame.
-
-        """
-
-        folder = os.path.dirname(path)
-        filename = os.path.basename(path)
-
-        if "#" in filename:
-            def replace(match):
-                return "%0{}d".format(len(match.group()))
-
-            filename = re.sub("#+", replace, filename)
-
-        if "%" not in filename:
-            # Not a sequence, single file
-            return path
-
-        expected_files = []
-        start = instance.data["frameStartHandle"]
-        end = instance.data["frameEndHandle"]
-
-        for frame in range(int(start), (int(end) + 1)):
-            expected_files.append(
-                os.path.join(folder, (filename % frame)).replace("\\", "/"))
-
-        return expected_files
@@ -56,6 +56,7 @@ class CollectUsdLayers(plugin.HoudiniInstancePlugin):
     """Collect the USD Layers that have configured save paths."""
 
     order = pyblish.api.CollectorOrder + 0.25
+    uses_collected_stage = True
     label = "Collect USD Layers"
     families = ["usdrop"]
 
@@ -65,6 +65,7 @@ class CollectUsdLookAssets(plugin.HoudiniInstancePlugin):
 
     label = "Collect USD Look Assets"
     order = pyblish.api.CollectorOrder
+    uses_collected_stage = True
     hosts = ["houdini"]
     families = ["look"]
 
@@ -10,7 +10,8 @@ from ayon_houdini.api import plugin
 from ayon_houdini.api.lib import (
     get_lops_rop_context_options,
     context_options,
-    update_mode_context
+    update_mode_context,
+    log_memory_usage,
 )
 
 
@@ -87,6 +88,9 @@ class CollectUsdRenderLayerAndStage(plugin.HoudiniInstancePlugin):
     with the context options set on the ROP node. This ensures the graph is
     evaluated similar to how the ROP node would process it on export.
 
+    The collected stage and layers are released by "Release Collected USD
+    Stage" after the last plug-in that declares `uses_collected_stage` ran.
+
     """
 
     label = "Collect ROP Sdf Layers and USD Stage"
@@ -164,6 +168,7 @@ class CollectUsdRenderLayerAndStage(plugin.HoudiniInstancePlugin):
             # Get a copy of the stage and layers so that any in houdini edit
             # or another recook from another instance of the same LOP layers
             # does not influence this collected stage and layers.
+            log_memory_usage(f"{instance} before stage copy", self.log)
             copied_layer_mapping = copy_stage_layers(stage)
             copied_stage = Usd.Stage.Open(
                 copied_layer_mapping[stage.GetRootLayer()])
@@ -176,3 +181,4 @@ class CollectUsdRenderLayerAndStage(plugin.HoudiniInstancePlugin):
 
             instance.data["layers"] = copied_layers
             instance.data["stage"] = copied_stage
+            log_memory_usage(f"{instance} after stage copy", self.log)
@@ -81,6 +81,7 @@ class CollectUSDValueClips(plugin.HoudiniInstancePlugin):
     label = "Collect USD Value Clips"
     # Run after core plugin `CollectResourcesPath`
     order = pyblish.api.CollectorOrder + 0.496
+    uses_collected_stage = True
     families = ["usd"]
 
     def process(self, instance):
@@ -1,11 +1,9 @@
-import re
-import os
-
 import hou
 import pyblish.api
 
 from ayon_houdini.api.lib import evalParmNoFrame
 from ayon_houdini.api import plugin
+from ayon_houdini.api.file_sequence import generate_expected_files
 
 
 class CollectVrayROPRenderProducts(plugin.HoudiniInstancePlugin):
@@ -51,8 +49,7 @@ class CollectVrayROPRenderProducts(plugin.HoudiniInstancePlugin):
         beauty_product = self.get_render_product_name(default_prefix)
         render_products.append(beauty_product)
         files_by_aov = {
-            "": self.generate_expected_files(instance,
-                                                      beauty_product)}
+            "": generate_expected_files(instance, beauty_product)}
 
         # Assume it's a multipartExr Render.
         multipartExr = True
@@ -62,7 +59,7 @@ class CollectVrayROPRenderProducts(plugin.HoudiniInstancePlugin):
             if render_element:
                 for aov, renderpass in render_element.items():
                     render_products.append(renderpass)
-                    files_by_aov[aov] = self.generate_expected_files(
+                    files_by_aov[aov] = generate_expected_files(
                         instance, renderpass)
                     # Set to False as soon as we have a separated aov.
                     multipartExr = False
@@ -107,28 +104,3 @@ class CollectVrayROPRenderProducts(plugin.HoudiniInstancePlugin):
                     render_product = prefix.replace(suffix, aov)
                     render_element_dict[aov] = render_product
         return render_element_dict
-
-    def generate_expected_files(self, instance, path):
-        """Create expected files in instance data"""
-
-        dir = os.path.dirname(path)
-        file = os.path.basename(path)
-
-        if "#" in file:
-            def replace(match):
-                return "%0{}d".format(len(match.group()))
-
-            file = re.sub("#+", replace, file)
-
-        if "%" not in file:
-            return path
-
-        expected_files = []
-        start = instance.data["frameStartHandle"]
-        end = instance.data["frameEndHandle"]
-
-        for i in range(int(start), (int(end) + 1)):
-            expected_files.append(
-                os.path.join(dir, (file % i)).replace("\\", "/"))
-
-        return expected_files
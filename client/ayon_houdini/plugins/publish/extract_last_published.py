@@ -1,5 +1,9 @@
 import os
+import re
 import shutil
+import platform
+import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import clique
 import pyblish.api
@@ -8,6 +12,35 @@ from ayon_core.lib import collect_frames
 from ayon_houdini.api import plugin
 
 
+# Linux `ioctl` request to clone a file's extents (copy-on-write)
+FICLONE = 0x40049409
+
+
+def _reflink(source, destination):
+    """Clone file with a copy-on-write reflink if supported.
+
+    Only supported on Linux filesystems like Btrfs and XFS.
+
+    Returns:
+        bool: Whether the file was cloned.
+
+    """
+    if platform.system() != "Linux":
+        return False
+
+    import fcntl
+
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        if os.path.exists(destination):
+            os.remove(destination)
+        return False
+    shutil.copystat(source, destination)
+    return True
+
+
 class ExtractLastPublished(plugin.HoudiniExtractorPlugin):
     """Extractor copying files from last published to staging directory.
 
@@ -32,6 +65,13 @@ class ExtractLastPublished(plugin.HoudiniExtractorPlugin):
     targets = ["local"]  # Same target as `CollectFramesFixDef`
     families = ["*"]
 
+    # Maximum amount of threads copying files concurrently
+    max_workers = 8
+    # Hardlink instead of copy when reflinks are not supported. Note that
+    # a hardlinked file shares its content with the published file, so any
+    # in-place overwrite of the staging file also changes the published one.
+    use_hardlinks = False
+
     def process(self, instance):
         frames_to_fix = instance.data.get("frames_to_fix")
         if not frames_to_fix:
@@ -54,7 +94,12 @@ class ExtractLastPublished(plugin.HoudiniExtractorPlugin):
                            "last version published files.")
             return
 
-        expected_filepaths = self.get_expected_files_and_staging_dir(instance)
+        expected_by_aov = self.get_expected_files_and_staging_dir(instance)
+        expected_filepaths = [
+            filepath
+            for filepaths in expected_by_aov.values()
+            for filepath in filepaths
+        ]
 
         # We assume all outputs of this one instance end up in one folder, and
         # hence there being just one 'staging dir'. We will take the first
@@ -62,37 +107,152 @@ class ExtractLastPublished(plugin.HoudiniExtractorPlugin):
         staging_dir: str = os.path.dirname(expected_filepaths[0])
         os.makedirs(staging_dir, exist_ok=True)
 
-        expected_and_frames = collect_frames(expected_filepaths)
-        frames_and_expected = {v: k for k, v in expected_and_frames.items()}
-        frames_to_fix = clique.parse(frames_to_fix, "{ranges}")
+        frames_to_fix = clique.parse(frames_to_fix, "{ranges}").indexes
+
+        # Group the last published files per sequence so each AOV only
+        # receives frames of its own sequence. Frames are collected as
+        # padded strings, compare them as integers.
+        published_sequences = collections.defaultdict(dict)
+        for file_path, frame in last_published_and_frames.items():
+            key = _get_sequence_key(file_path, frame)
+            published_sequences[key][int(frame)] = file_path
 
         anatomy = instance.context.data["anatomy"]
 
-        # TODO: This currently copies ALL frames from the last version instead
-        #  of only those within the frame range we're currently looking to
-        #  publish. It should instead, iterate over all expected frames for
-        #  current instance, exclude all "to fix" frames and copy the
-        #  other existing ones.
-        for file_path, frame in last_published_and_frames.items():
-            if frame is None:
+        # Copy only the frames within the instance's frame range that we
+        # won't render.
+        copy_pairs = []
+        for aov, filepaths in expected_by_aov.items():
+            expected_and_frames = collect_frames(filepaths)
+            published_by_frame = self.get_published_sequence(
+                aov, expected_and_frames, expected_by_aov, published_sequences
+            )
+            if published_by_frame is None:
+                self.log.warning(
+                    f"No last published sequence matches AOV '{aov}', "
+                    "its frames are not copied.")
                 continue
 
-            # Last published filepath
-            file_path = anatomy.fill_root(file_path)
-            if not os.path.exists(file_path):
-                continue
+            for target_filepath, frame in expected_and_frames.items():
+                if frame is None or int(frame) in frames_to_fix:
+                    continue
 
-            # Expected filepath for this render for that frame
-            target_filepath: str = frames_and_expected.get(frame)
-            if not target_filepath:
-                continue
+                # Last published filepath
+                file_path = published_by_frame.get(int(frame))
+                if not file_path:
+                    continue
+                copy_pairs.append(
+                    (anatomy.fill_root(file_path), target_filepath))
 
-            # Copy only the frames that we won't render.
-            if frame in frames_to_fix:
-                continue
+        self.copy_files(copy_pairs, staging_dir)
+
+    def get_published_sequence(
+        self, aov, expected_and_frames, expected_by_aov, published_sequences
+    ):
+        """Return the last published sequence matching an expected AOV.
+
+        A published sequence matches when it has the same file name as the
+        expected sequence, otherwise when its file name contains the AOV
+        name as a token. With a single expected and a single published
+        sequence they are matched directly.
+
+        Args:
+            aov (str): AOV name of the expected sequence.
+            expected_and_frames (dict[str, str]): Expected filepaths and
+                their frames.
+            expected_by_aov (dict[str, list[str]]): All expected filepaths
+                per AOV name.
+            published_sequences (dict[tuple[str, str], dict[int, str]]):
+                Last published filepaths by frame per sequence key.
 
-            self.log.debug(f"Copying '{file_path}' -> '{target_filepath}'")
-            shutil.copy(file_path, target_filepath)
+        Returns:
+            Optional[dict[int, str]]: Last published filepaths by frame.
+
+        """
+        if len(expected_by_aov) == 1 and len(published_sequences) == 1:
+            return next(iter(published_sequences.values()))
+
+        expected_keys = {
+            _get_sequence_key(filepath, frame)
+            for filepath, frame in expected_and_frames.items()
+            if frame is not None
+        }
+        for key in expected_keys:
+            if key in published_sequences:
+                return published_sequences[key]
+
+        # Match by AOV name, the beauty is the sequence without any of
+        # the other AOV names in its file name.
+        aov_names = {name.lower() for name in expected_by_aov if name}
+        matches = []
+        for key, published_by_frame in published_sequences.items():
+            tokens = _get_name_tokens(key)
+            if aov:
+                if aov.lower() in tokens:
+                    matches.append(published_by_frame)
+            elif not tokens & aov_names:
+                matches.append(published_by_frame)
+
+        if len(matches) == 1:
+            return matches[0]
+        return None
+
+    def copy_files(self, copy_pairs, staging_dir):
+        """Copy files on a thread pool, reporting progress.
+
+        When the source and the staging dir are on the same filesystem the
+        files are cloned with a reflink (copy-on-write) where supported or
+        hardlinked if `use_hardlinks` is enabled, otherwise copied.
+
+        Args:
+            copy_pairs (list[tuple[str, str]]): Source and destination paths.
+            staging_dir (str): The staging directory files are copied to.
+
+        """
+        total = len(copy_pairs)
+        if not total:
+            self.log.debug("No files to copy from last published version.")
+            return
+
+        staging_device = os.stat(staging_dir).st_dev
+        methods = collections.Counter()
+        report_every = max(1, total // 10)
+
+        def _copy(source, destination):
+            if not os.path.exists(source):
+                return None
+            self.log.debug(f"Copying '{source}' -> '{destination}'")
+            if os.stat(source).st_dev == staging_device:
+                if os.path.lexists(destination):
+                    os.remove(destination)
+                if _reflink(source, destination):
+                    return "reflink"
+                if self.use_hardlinks:
+                    os.link(source, destination)
+                    return "hardlink"
+            shutil.copy(source, destination)
+            return "copy"
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(_copy, source, destination)
+                for source, destination in copy_pairs
+            ]
+            for done, future in enumerate(as_completed(futures), 1):
+                methods[future.result()] += 1
+                if done % report_every == 0 or done == total:
+                    self.log.info(
+                        f"Copied {done}/{total} files from last published "
+                        "version.")
+
+        missing = methods.pop(None, 0)
+        if missing:
+            self.log.debug(f"Skipped {missing} files missing on disk.")
+        self.log.debug(
+            "Copy methods used: "
+            + ", ".join(f"{method}: {count}"
+                        for method, count in methods.items())
+        )
 
     def get_expected_files_and_staging_dir(self, instance):
         """Get expected file names or frames.
@@ -103,10 +263,11 @@ class ExtractLastPublished(plugin.HoudiniExtractorPlugin):
             instance (pyblish.api.Instance): The instance to publish.
 
         Returns:
-            list[str]: Full paths to the expected filepaths for this publish
-                instance.
+            dict[str, list[str]]: Full paths to the expected filepaths for
+                this publish instance per AOV name. Files without an AOV
+                are stored under an empty name.
         """
-        expected_filepaths: list[str] = []
+        expected_filepaths = collections.defaultdict(list)
         expected_files = instance.data.get("expectedFiles", [])
 
         # 'expectedFiles' are preferred over 'frames'
@@ -114,19 +275,40 @@ class ExtractLastPublished(plugin.HoudiniExtractorPlugin):
             # Products with expected files
             # This can be Render products or submitted cache to farm.
             for expected in expected_files:
-                # expected.values() is a list of lists
-                expected_filepaths.extend(sum(expected.values(), []))
+                # expected.values() are file sequences, lists or single files
+                for aov, filepaths in expected.items():
+                    if isinstance(filepaths, str):
+                        expected_filepaths[aov].append(filepaths)
+                    else:
+                        expected_filepaths[aov].extend(filepaths)
         else:
             # Products with frames or single file.
             frames = instance.data.get("frames", "")
             staging_dir: str = instance.data.get("stagingDir")
             if isinstance(frames, str):
                 # single file.
-                expected_filepaths.append("{}/{}".format(staging_dir, frames))
+                expected_filepaths[""].append(
+                    "{}/{}".format(staging_dir, frames))
             else:
                 # list of frame.
-                expected_filepaths.extend(
+                expected_filepaths[""].extend(
                     ["{}/{}".format(staging_dir, f) for f in frames]
                 )
 
-        return expected_filepaths
+        return dict(expected_filepaths)
+
+
+def _get_sequence_key(filepath, frame):
+    """Return the file name head and tail around the frame number."""
+    filename = os.path.basename(filepath)
+    head, _, tail = filename.rpartition(frame)
+    return head, tail
+
+
+def _get_name_tokens(sequence_key):
+    """Return the lowercase name tokens of a sequence key."""
+    head, tail = sequence_key
+    return {
+        token for token in re.split(r"[._\-]", f"{head}{tail}".lower())
+        if token
+    }
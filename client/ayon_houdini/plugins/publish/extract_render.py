@@ -1,12 +1,15 @@
 import os
 import pyblish.api
 
+from ayon_core.lib import BoolDef
 from ayon_core.pipeline import PublishError
+from ayon_core.pipeline.publish import AYONPyblishPluginMixin
 from ayon_houdini.api import plugin
-from ayon_houdini.api.lib import format_as_collections
+from ayon_houdini.api.file_sequence import FileSequence
+from ayon_houdini.api.lib import format_as_collections, get_missing_frames
 
 
-class ExtractRender(plugin.HoudiniExtractorPlugin):
+class ExtractRender(plugin.HoudiniExtractorPlugin, AYONPyblishPluginMixin):
 
     order = pyblish.api.ExtractorOrder
     label = "Extract Render"
@@ -32,13 +35,29 @@ class ExtractRender(plugin.HoudiniExtractorPlugin):
             return
 
         if do_local_render:
-            # FIXME Render the entire frame range if any of the AOVs does
-            #   not have a previously rendered version. This situation breaks
-            #   the publishing.
-            # because There will be missing frames as ROP nodes typically
-            #   cannot render different frame ranges for each AOV; they always
-            #   use the same frame range for all AOVs.
-            self.render_rop(instance)
+            attribute_values = self.get_attr_values_from_data(instance.data)
+            if (
+                attribute_values.get("render_missing_frames_only")
+                and not instance.data.get("frames_to_fix")
+            ):
+                # ROP nodes render all AOVs for a frame together, so a frame
+                # is rendered again if any of its AOVs is missing.
+                missing_frames = get_missing_frames(
+                    instance.data["expectedFiles"][0],
+                    list(range(int(instance.data["frameStartHandle"]),
+                               int(instance.data["frameEndHandle"]) + 1))
+                )
+                self.log.info(
+                    f"Rendering {len(missing_frames)} missing frames.")
+                self.render_rop(instance, frames=missing_frames)
+            else:
+                # FIXME Render the entire frame range if any of the AOVs does
+                #   not have a previously rendered version. This situation
+                #   breaks the publishing.
+                # because There will be missing frames as ROP nodes typically
+                #   cannot render different frame ranges for each AOV; they
+                #   always use the same frame range for all AOVs.
+                self.render_rop(instance)
 
         if (
             creator_attribute.get("render_target")
@@ -48,21 +67,25 @@ class ExtractRender(plugin.HoudiniExtractorPlugin):
 
         # `ExpectedFiles` is a list that includes one dict.
         expected_files = instance.data["expectedFiles"][0]
-        # Each key in that dict is a list of files.
-        # Combine lists of files into one big list.
-        all_frames = []
-        for value in  expected_files.values():
-            if isinstance(value, str):
-                all_frames.append(value)
-            elif isinstance(value, list):
-                all_frames.extend(value)
+
+        # Each key in that dict is a file sequence, list of files or a
+        # single file.
         # Check missing frames.
         # Frames won't exist if user cancels the render.
-        missing_frames = [
-            frame
-            for frame in all_frames
-            if not os.path.exists(frame)
-        ]
+        missing_frames = []
+        for value in expected_files.values():
+            if isinstance(value, FileSequence):
+                missing_frames.extend(
+                    value.path(frame) for frame in value.missing_frames()
+                )
+                continue
+
+            if isinstance(value, str):
+                value = [value]
+            missing_frames.extend(
+                filepath for filepath in value
+                if not os.path.exists(filepath)
+            )
 
         if missing_frames:
             # Combine collections for simpler logs of missing files
@@ -75,3 +98,19 @@ class ExtractRender(plugin.HoudiniExtractorPlugin):
                 "Please render any missing output files.",
                 detail=f"Missing output files: \n {missing_frames}"
             )
+
+    @classmethod
+    def get_attribute_defs(cls):
+        return [
+            BoolDef(
+                "render_missing_frames_only",
+                label="Render missing frames only",
+                default=False,
+                tooltip=(
+                    "When enabled, a local render only renders the frames "
+                    "for which any AOV output file does not exist yet.\n"
+                    "This allows resuming an interrupted local render "
+                    "without rendering the already finished frames again."
+                )
+            )
+        ]
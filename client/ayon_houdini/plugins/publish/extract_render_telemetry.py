@@ -0,0 +1,49 @@
+import hou
+import pyblish.api
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.lib import get_render_telemetry_path
+
+
+class ExtractRenderTelemetry(plugin.HoudiniInstancePlugin):
+    """Store the render telemetry of extracted ROPs for later analysis.
+
+    The extractors record the render time per frame range and per frame,
+    the bytes written and the peak memory usage in
+    `instance.data["renderTelemetry"]`. This writes it to a JSON sidecar
+    next to the ROP's output files and optionally adds a summary to the
+    version data so it can be compared across versions of a product.
+
+    """
+
+    label = "Extract Render Telemetry"
+    # Run after all extractors that render ROP nodes
+    order = pyblish.api.ExtractorOrder + 0.45
+
+    enabled = False
+    write_sidecar = True
+    add_to_version_data = False
+
+    def process(self, instance):
+        telemetry = instance.data.get("renderTelemetry")
+        if telemetry is None or not telemetry.ranges:
+            return
+
+        data = telemetry.to_dict()
+        self.log.debug(
+            f"Rendered {data['frame_count']} frames of {data['rop']} in "
+            f"{data['duration']:.1f}s, writing "
+            f"{data['output_bytes'] / 1024 ** 2:.1f} MB.")
+
+        if self.write_sidecar:
+            rop_node = hou.node(telemetry.rop_path)
+            path = rop_node and get_render_telemetry_path(rop_node)
+            if path:
+                telemetry.write(path)
+                self.log.debug(f"Wrote render telemetry to: {path}")
+
+        if self.add_to_version_data:
+            # Per frame timings are left out to keep the version data small
+            data.pop("ranges")
+            version_data = instance.data.setdefault("versionData", {})
+            version_data["renderTelemetry"] = data
@@ -1,9 +1,16 @@
 import os
+import time
+import hou
 import pyblish.api
 
 from ayon_core.pipeline import publish, PublishError
 from ayon_houdini.api import plugin
 from ayon_houdini.api.lib import splitext, format_as_collections
+from ayon_houdini.api.render_workers import (
+    get_default_worker_count,
+    get_parallel_render_blockers,
+    render_rop_in_workers,
+)
 
 
 class ExtractROP(plugin.HoudiniExtractorPlugin):
@@ -16,6 +23,10 @@ class ExtractROP(plugin.HoudiniExtractorPlugin):
                 "image_rop"]
     targets = ["local", "remote"]
 
+    # Amount of hython workers for the `local_parallel` render target.
+    # Zero means half the CPU cores of the local machine.
+    local_parallel_workers = 0
+
     def process(self, instance: pyblish.api.Instance):
         if instance.data.get("farm"):
             self.log.debug("Should be processed on farm, skipping.")
@@ -35,8 +46,30 @@ class ExtractROP(plugin.HoudiniExtractorPlugin):
         #   key is missing.
         # This key might be absent because render targets are not
         #   yet implemented for all product types that use this plugin.
-        if creator_attribute.get("render_target", "local") == "local":
+        render_target = creator_attribute.get("render_target", "local")
+        concurrent_render = instance.data.get("concurrentRender")
+        if concurrent_render is not None:
+            # Already rendered by "Extract ROPs Concurrently"
+            if not concurrent_render["success"]:
+                raise PublishError(
+                    "Failed to render ROP in background hython worker.",
+                    detail=concurrent_render.get("output", "")
+                )
+            self.log.debug(
+                "ROP was rendered concurrently in "
+                f"{concurrent_render['duration']:.1f}s")
+            telemetry = self.get_render_telemetry(instance)
+            if telemetry is not None:
+                telemetry.add_range(
+                    self.get_frame_range(instance),
+                    duration=concurrent_render["duration"],
+                    output_bytes=self.get_output_bytes(instance),
+                    method="hython_worker",
+                )
+        elif render_target == "local":
             self.render_rop(instance)
+        elif render_target == "local_parallel":
+            self.render_rop_parallel(instance)
         self.validate_expected_frames(instance)
 
         # In some cases representation name is not the the extension
@@ -59,10 +92,91 @@ class ExtractROP(plugin.HoudiniExtractorPlugin):
         self.update_representation_data(instance, representation)
         instance.data.setdefault("representations", []).append(representation)
 
+    def render_rop_parallel(self, instance: pyblish.api.Instance):
+        """Render the ROP split across background `hython` workers.
+
+        Falls back to rendering in the current session when the output is
+        a single file, when only frames to fix are rendered, when the frame
+        step is not a positive integer or when the ROP depends on simulation
+        or feedback nodes that require all frames to be cooked in sequence.
+        """
+        rop_node = hou.node(instance.data["instance_node"])
+
+        reasons = []
+        if isinstance(instance.data["frames"], str):
+            reasons.append("output is a single file")
+        if instance.data.get("frames_to_fix"):
+            reasons.append("only frames to fix are rendered")
+        step = instance.data.get("byFrameStep", 1)
+        if step < 1 or int(step) != step:
+            reasons.append(f"frame step {step} is not a positive integer")
+        if hou.hipFile.hasUnsavedChanges():
+            reasons.append("workfile has unsaved changes")
+        reasons.extend(get_parallel_render_blockers(rop_node))
+        if reasons:
+            self.log.warning(
+                "Local parallel rendering is not possible for "
+                f"{rop_node.path()}, rendering in current session instead:\n"
+                + "\n".join(f"- {reason}" for reason in reasons)
+            )
+            self.render_rop(instance)
+            return
+
+        workers = (
+            self.local_parallel_workers or get_default_worker_count()
+        )
+        frame_range = self.get_frame_range(instance)
+        self.log.debug(
+            f"Rendering {rop_node.path()} in {workers} hython workers")
+        start = time.time()
+        render_rop_in_workers(
+            rop_node,
+            frame_range,
+            workers=workers,
+            hip_path=instance.context.data["currentFile"],
+            logger=self.log,
+        )
+        telemetry = self.get_render_telemetry(instance)
+        if telemetry is not None:
+            telemetry.add_range(
+                frame_range,
+                duration=time.time() - start,
+                output_bytes=self.get_output_bytes(instance),
+                method="hython_workers",
+            )
+
+    @staticmethod
+    def get_frame_range(instance: pyblish.api.Instance):
+        """Return start, end and step of the instance as integers."""
+        return (
+            int(instance.data["frameStartHandle"]),
+            int(instance.data["frameEndHandle"]),
+            int(instance.data.get("byFrameStep", 1)),
+        )
+
+    @staticmethod
+    def get_output_bytes(instance: pyblish.api.Instance) -> int:
+        """Return total size of the output files that exist on disk."""
+        filenames = instance.data["frames"]
+        if isinstance(filenames, str):
+            filenames = [filenames]
+        staging_dir = instance.data["stagingDir"]
+        output_bytes = 0
+        for filename in filenames:
+            try:
+                output_bytes += os.path.getsize(
+                    os.path.join(staging_dir, filename))
+            except OSError:
+                continue
+        return output_bytes
+
     def validate_expected_frames(self, instance: pyblish.api.Instance):
         """
         Validate all expected files in `instance.data["frames"]` exist in
         the staging directory.
+
+        Files recorded as completed in the render manifest of this render
+        are not checked on disk again.
         """
         filenames = instance.data["frames"]
         staging_dir = instance.data["stagingDir"]
@@ -70,9 +184,12 @@ class ExtractROP(plugin.HoudiniExtractorPlugin):
             # Single frame
             filenames = [filenames]
 
+        manifest = instance.data.get("renderManifest")
         missing_frames = []
         for filename in filenames:
             filename = os.path.join(staging_dir, filename)
+            if manifest is not None and manifest.has_file(filename):
+                continue
             if not os.path.isfile(filename):
                 missing_frames.append(filename)
 
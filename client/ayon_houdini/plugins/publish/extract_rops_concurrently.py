@@ -0,0 +1,156 @@
+import hou
+import pyblish.api
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.lib import find_rop_input_dependencies
+from ayon_houdini.api.render_workers import (
+    get_default_worker_count,
+    render_rops_in_workers,
+)
+
+
+def _flatten(items):
+    """Yield all strings from arbitrarily nested lists."""
+    if isinstance(items, str):
+        yield items
+        return
+    for item in items:
+        yield from _flatten(item)
+
+
+class ExtractROPsConcurrently(plugin.HoudiniContextPlugin):
+    """Render independent cache ROPs concurrently in hython workers.
+
+    Instead of rendering each instance's ROP one after another in the current
+    session, all eligible ROPs are dispatched to a bounded pool of background
+    `hython` processes that load the saved workfile. ROPs that depend on
+    other instances' ROPs through their ROP network inputs only start once
+    those have rendered.
+
+    The result per instance is stored in `instance.data["concurrentRender"]`
+    so that "Extract ROP" skips rendering it again and reports failures.
+
+    The ROPs are rendered in other processes, so unlike
+    `HoudiniExtractorPlugin.render_rop` no render manifest is written to
+    resume a cancelled render and the render telemetry only records the
+    duration and output size per ROP, added by "Extract ROP".
+
+    """
+
+    label = "Extract ROPs Concurrently"
+    # Run after Save Scene and Extract Last Published, before Extract ROP
+    order = pyblish.api.ExtractorOrder - 0.05
+    targets = ["local"]
+
+    # Cache families rendered by Extract ROP
+    families = ["abc", "camera", "bgeo", "pointcache", "fbx",
+                "vdbcache", "ass", "redshiftproxy", "mantraifd"]
+
+    enabled = False
+    # Zero means half the CPU cores of the local machine
+    max_workers = 0
+
+    def process(self, context):
+        if hou.hipFile.hasUnsavedChanges():
+            self.log.warning(
+                "Workfile has unsaved changes, skipping concurrent "
+                "extraction.")
+            return
+
+        instances = {}
+        for instance in context:
+            if not self.is_eligible(instance):
+                continue
+            instances[instance.data["instance_node"]] = instance
+
+        if len(instances) < 2:
+            self.log.debug("Less than two eligible instances, skipping.")
+            return
+
+        instance_rops = {
+            rop.data["instance_node"] for rop in context
+            if rop.data.get("instance_node")
+        }
+        frame_ranges = {}
+        dependencies = {}
+        for rop_path, instance in instances.items():
+            rop_node = hou.node(rop_path)
+            input_dependencies = rop_node.inputDependencies()
+            rop_dependencies = set()
+            if input_dependencies:
+                rop_dependencies = set(_flatten(
+                    find_rop_input_dependencies(input_dependencies)
+                )) & instance_rops
+            rop_dependencies.discard(rop_path)
+
+            if not rop_dependencies.issubset(instances):
+                # Depends on an instance that is rendered later in the
+                # current session, so it can't be rendered ahead of it
+                self.log.debug(
+                    f"Skipping {rop_path} because it depends on instances "
+                    "that are not rendered concurrently.")
+                continue
+
+            dependencies[rop_path] = rop_dependencies
+            frame_ranges[rop_path] = (
+                int(instance.data["frameStartHandle"]),
+                int(instance.data["frameEndHandle"]),
+                int(instance.data.get("byFrameStep", 1)),
+            )
+
+        # Drop ROPs depending on ROPs that were skipped above
+        skipped = set(instances) - set(frame_ranges)
+        while skipped:
+            skipped = {
+                rop_path for rop_path, rop_dependencies
+                in dependencies.items()
+                if rop_dependencies & skipped
+            }
+            for rop_path in skipped:
+                del dependencies[rop_path]
+                del frame_ranges[rop_path]
+
+        if not frame_ranges:
+            return
+
+        max_workers = self.max_workers or get_default_worker_count()
+        self.log.info(
+            f"Rendering {len(frame_ranges)} ROPs concurrently in up to "
+            f"{max_workers} hython workers.")
+        results = render_rops_in_workers(
+            frame_ranges,
+            dependencies,
+            max_workers=max_workers,
+            hip_path=context.data["currentFile"],
+            logger=self.log,
+        )
+        for rop_path, result in results.items():
+            instances[rop_path].data["concurrentRender"] = result
+
+    def is_eligible(self, instance):
+        """Return whether the instance can be rendered in a hython worker."""
+        if not instance.data.get("publish", True):
+            return False
+        if not instance.data.get("active", True):
+            return False
+        if instance.data.get("farm"):
+            return False
+        if instance.data.get("frames_to_fix"):
+            return False
+
+        # Workers render whole frame steps only
+        step = instance.data.get("byFrameStep", 1)
+        if step < 1 or int(step) != step:
+            return False
+
+        families = set(instance.data.get("families", []))
+        families.add(instance.data.get("productBaseType"))
+        if not families.intersection(self.families):
+            return False
+
+        creator_attributes = instance.data.get("creator_attributes", {})
+        if creator_attributes.get("render_target", "local") != "local":
+            return False
+
+        rop_path = instance.data.get("instance_node")
+        return bool(rop_path and hou.node(rop_path))
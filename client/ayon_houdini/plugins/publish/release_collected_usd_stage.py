@@ -0,0 +1,45 @@
+import pyblish.api
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.lib import log_memory_usage
+from ayon_houdini.api.usd import (
+    get_collected_stage_consumers,
+    release_collected_stage,
+)
+
+
+class ReleaseCollectedUsdStage(plugin.HoudiniInstancePlugin):
+    """Release the in-memory USD stage and layers collected for USD ROPs.
+
+    The copied stage and anonymous layers collected by "Collect ROP Sdf Layers
+    and USD Stage" are only required by collectors and validators. Keeping
+    them alive through extraction and integration makes Houdini's memory
+    usage climb with each USD instance, so they are released after
+    validation.
+
+    The release is skipped if any plug-in that runs later declares it still
+    uses the collected stage with `uses_collected_stage = True`.
+
+    """
+
+    label = "Release Collected USD Stage"
+    # Run after all validators
+    order = pyblish.api.ValidatorOrder + 0.49
+    families = ["usdrender", "usdrop"]
+
+    def process(self, instance):
+        if "stage" not in instance.data and "layers" not in instance.data:
+            return
+
+        later_consumers = get_collected_stage_consumers(
+            instance, after_order=self.order)
+        if later_consumers:
+            names = ", ".join(sorted(
+                consumer.__name__ for consumer in later_consumers))
+            self.log.debug(
+                f"Keeping collected USD stage for later plug-ins: {names}")
+            return
+
+        log_memory_usage(f"{instance} before stage release", self.log)
+        if release_collected_stage(instance, logger=self.log):
+            log_memory_usage(f"{instance} after stage release", self.log)
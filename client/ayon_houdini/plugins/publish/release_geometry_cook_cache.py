@@ -0,0 +1,26 @@
+import pyblish.api
+
+from ayon_houdini.api import plugin
+
+
+class ReleaseGeometryCookCache(plugin.HoudiniContextPlugin):
+    """Release the SOP geometry cooked and shared by the validators.
+
+    The geometry is only needed while validating, so it is released before
+    extraction to not hold on to copies of heavy geometry while rendering.
+
+    """
+
+    label = "Release Geometry Cook Cache"
+    # Run after all validators
+    order = pyblish.api.ValidatorOrder + 0.49
+
+    def process(self, context):
+        cache = context.data.pop("houdiniGeometryCookCache", None)
+        if cache is None:
+            return
+
+        self.log.debug(
+            f"Geometry cook cache had {cache.cooks} cooks and "
+            f"{cache.hits} hits.")
+        cache.clear()
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-from collections import defaultdict
 
 import pyblish.api
 from ayon_core.pipeline import (
@@ -8,9 +7,16 @@ from ayon_core.pipeline import (
 )
 
 from ayon_houdini.api import plugin
+from ayon_houdini.api.lib import get_geometry_cook_cache
+from ayon_houdini.api.geometry import (
+    factorize_prim_attrib,
+    find_inconsistent_values,
+    get_prim_count,
+)
 
 
 class ValidateAbcPrimitiveToDetail(plugin.HoudiniInstancePlugin,
+                                   plugin.HoudiniCachedValidatorMixin,
                                    OptionalPyblishPluginMixin):
     """Validate Alembic ROP Primitive to Detail attribute is consistent.
 
@@ -30,6 +36,9 @@ class ValidateAbcPrimitiveToDetail(plugin.HoudiniInstancePlugin,
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         invalid = self.get_invalid(instance)
         if invalid:
             raise PublishValidationError(
@@ -41,6 +50,8 @@ class ValidateAbcPrimitiveToDetail(plugin.HoudiniInstancePlugin,
                 )
             )
 
+        self.set_validation_passed(instance)
+
     @classmethod
     def get_invalid(cls, instance):
         import hou  # noqa
@@ -94,13 +105,13 @@ class ValidateAbcPrimitiveToDetail(plugin.HoudiniInstancePlugin,
 
         # Check if the primitive attribute exists
         frame = instance.data.get("frameStart", 0)
-        geo = output_node.geometryAtFrame(frame)
+        geo = get_geometry_cook_cache(instance.context).get(output_node, frame)
 
         # If there are no primitives on the start frame then it might be
         # something that is emitted over time. As such we can't actually
         # validate whether the attributes exist, because they won't exist
         # yet. In that case, just warn the user and allow it.
-        if len(geo.iterPrims()) == 0:
+        if get_prim_count(geo) == 0:
             cls.log.warning(
                 "No primitives found on current frame. Validation"
                 " for Primitive to Detail will be skipped."
@@ -123,7 +134,8 @@ class ValidateAbcPrimitiveToDetail(plugin.HoudiniInstancePlugin,
             )
             return [output_node]
 
-        paths = None
+        # Only read the path attribute once for all attributes
+        path_codes = None
         for attr in pattern.split(" "):
             if not attr.strip():
                 # Ignore empty values
@@ -140,21 +152,16 @@ class ValidateAbcPrimitiveToDetail(plugin.HoudiniInstancePlugin,
             if not attrib.strings():
                 continue
 
-            check = defaultdict(set)
-            values = geo.primStringAttribValues(attr)
-            if paths is None:
-                paths = geo.primStringAttribValues(path_attr)
-
-            for path, value in zip(paths, values):
-                check[path].add(value)
-
-            for path, values in check.items():
-                # Whenever a single path has multiple values for the
-                # Primitive to Detail attribute then we consider it
-                # inconsistent and invalidate the ROP node's content.
-                if len(values) > 1:
-                    cls.log.warning(
-                        "Path has multiple values: %s (path: %s)"
-                        % (list(values), path)
-                    )
-                    return [output_node]
+            # Whenever a single path has multiple values for the
+            # Primitive to Detail attribute then we consider it
+            # inconsistent and invalidate the ROP node's content.
+            if path_codes is None:
+                path_codes = factorize_prim_attrib(geo, path_attr)
+            inconsistent = find_inconsistent_values(
+                geo, path_attr, attr, key_codes=path_codes)
+            for path, values in inconsistent.items():
+                cls.log.warning(
+                    "Path has multiple values: %s (path: %s)"
+                    % (values, path)
+                )
+                return [output_node]
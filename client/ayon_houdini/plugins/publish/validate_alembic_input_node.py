@@ -7,9 +7,11 @@ from ayon_core.pipeline import (
 )
 
 from ayon_houdini.api import plugin
+from ayon_houdini.api.lib import get_geometry_cook_cache
 
 
 class ValidateAlembicInputNode(plugin.HoudiniInstancePlugin,
+                               plugin.HoudiniCachedValidatorMixin,
                                OptionalPyblishPluginMixin):
     """Validate that the node connected to the output is correct.
 
@@ -27,6 +29,9 @@ class ValidateAlembicInputNode(plugin.HoudiniInstancePlugin,
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         invalid = self.get_invalid(instance)
         if invalid:
             raise PublishValidationError(
@@ -35,6 +40,8 @@ class ValidateAlembicInputNode(plugin.HoudiniInstancePlugin,
                 title=self.label
             )
 
+        self.set_validation_passed(instance)
+
     @classmethod
     def get_invalid(cls, instance):
 
@@ -59,7 +66,7 @@ class ValidateAlembicInputNode(plugin.HoudiniInstancePlugin,
             return
 
         frame = instance.data.get("frameStart", 0)
-        geo = output_node.geometryAtFrame(frame)
+        geo = get_geometry_cook_cache(instance.context).get(output_node, frame)
 
         invalid = False
         for prim_type in invalid_prim_types:
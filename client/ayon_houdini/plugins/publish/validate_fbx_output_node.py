@@ -9,11 +9,15 @@ from ayon_houdini.api.action import (
     SelectROPAction,
 )
 from ayon_houdini.api import plugin
-from ayon_houdini.api.lib import get_obj_node_output
+from ayon_houdini.api.lib import (
+    get_obj_node_output,
+    get_geometry_cook_cache,
+)
 import hou
 
 
 class ValidateFBXOutputNode(plugin.HoudiniInstancePlugin,
+                            plugin.HoudiniCachedValidatorMixin,
                             OptionalPyblishPluginMixin):
     """Validate the instance Output Node.
 
@@ -34,6 +38,9 @@ class ValidateFBXOutputNode(plugin.HoudiniInstancePlugin,
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         invalid = self.get_invalid(instance)
         if invalid:
             nodes = [n.path() for n in invalid]
@@ -43,6 +50,8 @@ class ValidateFBXOutputNode(plugin.HoudiniInstancePlugin,
                 title="Invalid output node(s)"
             )
 
+        self.set_validation_passed(instance)
+
     @classmethod
     def get_invalid(cls, instance):
         output_node = instance.data.get("output_node")
@@ -124,7 +133,8 @@ class ValidateFBXOutputNode(plugin.HoudiniInstancePlugin,
                 continue
 
             frame = instance.data.get("frameStart", 0)
-            geo = sop_node.geometryAtFrame(frame)
+            geo = get_geometry_cook_cache(instance.context).get(
+                sop_node, frame)
             if len(geo.iterPrims()) == 0:
                 invalid.append(sop_node)  # empty_geometry
                 cls.log.error(
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import time
+
 import hou
 
 import pyblish.api
@@ -10,13 +12,67 @@ from ayon_core.pipeline import (
 from ayon_houdini.api import plugin
 
 
-def cook_in_range(node, start, end):
-    current = hou.intFrame()
-    if start >= current >= end:
-        # Allow cooking current frame since we're in frame range
-        node.cook(force=False)
-    else:
-        node.cook(force=False, frame_range=(start, start))
+def iter_recook_frames(start, end, current, strategy="sample"):
+    """Yield the frames to recook a node at to revalidate its errors.
+
+    The current frame is yielded first if it is within the frame range.
+
+    Args:
+        start (int): First frame of the frame range.
+        end (int): Last frame of the frame range.
+        current (int): The current frame.
+        strategy (str): Which frames to yield after the current frame:
+            - `current`: Only the current frame, or the start frame if the
+                current frame is outside the frame range.
+            - `sample`: The start, middle and end frame.
+            - `bisect`: The start and end frame, followed by the middle
+                frames of each half of the frame range recursively until
+                all frames are yielded.
+
+    Yields:
+        int: The frame to recook at.
+
+    """
+    start = int(start)
+    end = int(end)
+    yielded = set()
+
+    def _unique(frame):
+        if frame in yielded:
+            return False
+        yielded.add(frame)
+        return True
+
+    if start <= current <= end and _unique(current):
+        yield current
+
+    if strategy == "current":
+        if not yielded:
+            yield start
+        return
+
+    for frame in (start, end):
+        if _unique(frame):
+            yield frame
+
+    if strategy == "sample":
+        middle = (start + end) // 2
+        if _unique(middle):
+            yield middle
+        return
+
+    # Bisect breadth-first so the range is sampled evenly early on
+    ranges = [(start, end)]
+    while ranges:
+        next_ranges = []
+        for first, last in ranges:
+            if last - first < 2:
+                continue
+            middle = (first + last) // 2
+            if _unique(middle):
+                yield middle
+            next_ranges.extend([(first, middle), (middle, last)])
+        ranges = next_ranges
 
 
 def get_errors(node):
@@ -33,16 +89,27 @@ def get_errors(node):
 
 
 class ValidateNoErrors(plugin.HoudiniInstancePlugin,
+                       plugin.HoudiniCachedValidatorMixin,
                        OptionalPyblishPluginMixin):
     """Validate the Instance has no current cooking errors."""
 
     order = pyblish.api.ValidatorOrder
     label = "Validate no errors"
 
+    # Frames to recook at when a node has errors: current, sample or bisect
+    recook_strategy = "current"
+    # Maximum seconds to spend recooking per node, zero means no limit
+    max_cook_time = 30.0
+    # Maximum amount of frames to recook per node
+    max_recook_frames = 8
+
     def process(self, instance):
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         if not instance.data.get("instance_node"):
             self.log.debug(
                 "Skipping 'Validate no errors' because instance "
@@ -63,21 +130,75 @@ class ValidateNoErrors(plugin.HoudiniInstancePlugin,
             errors = get_errors(node)
 
             if errors:
-                # If there are current errors, then try an unforced cook
+                # If there are current errors, then try unforced cooks
                 # to see whether the error will disappear.
                 self.log.debug(
                     "Recooking to revalidate error "
                     "is up to date for: %s" % node.path()
                 )
-                current_frame = hou.intFrame()
-                start = instance.data.get("frameStart", current_frame)
-                end = instance.data.get("frameEnd", current_frame)
-                cook_in_range(node, start=start, end=end)
+                errors = self.recook(node, instance)
 
-            # Check for errors again after the forced recook
-            errors = get_errors(node)
             if errors:
                 self.log.error(errors)
                 raise PublishValidationError(
                     "Node has errors: {}".format(node.path()),
                     title=self.label)
+
+        self.set_validation_passed(instance)
+
+    def recook(self, node, instance):
+        """Recook the node at frames of the instance until errors clear.
+
+        Frames are cooked in the order of `recook_strategy` and cooking
+        stops at the first frame without errors, after `max_recook_frames`
+        frames or when `max_cook_time` is exceeded.
+
+        The cooked frames and seconds spent are logged and stored per node
+        path in `instance.data["recookTimes"]`.
+
+        Returns:
+            tuple: The errors after the last cook.
+
+        """
+        current_frame = hou.intFrame()
+        start = instance.data.get("frameStart", current_frame)
+        end = instance.data.get("frameEnd", current_frame)
+
+        errors = node.errors()
+        cooked_frames = []
+        start_time = time.time()
+        for frame in iter_recook_frames(
+                start, end, current_frame, self.recook_strategy):
+            node.cook(force=False, frame_range=(frame, frame))
+            cooked_frames.append(frame)
+            errors = node.errors()
+            if not errors:
+                break
+
+            if len(cooked_frames) >= self.max_recook_frames:
+                self.log.warning(
+                    "Stopped recooking %s after %d frames with errors." % (
+                        node.path(), len(cooked_frames))
+                )
+                break
+
+            elapsed = time.time() - start_time
+            if self.max_cook_time and elapsed > self.max_cook_time:
+                self.log.warning(
+                    "Stopped recooking %s after %.1fs, exceeding maximum "
+                    "cook time of %.1fs." % (
+                        node.path(), elapsed, self.max_cook_time)
+                )
+                break
+
+        elapsed = time.time() - start_time
+        self.log.info(
+            "Recooked %s at %d frame(s) %s in %.1fs" % (
+                node.path(), len(cooked_frames), cooked_frames, elapsed)
+        )
+        # Keep the recook cost with the instance for publish reports
+        instance.data.setdefault("recookTimes", {})[node.path()] = {
+            "frames": cooked_frames,
+            "seconds": elapsed,
+        }
+        return errors
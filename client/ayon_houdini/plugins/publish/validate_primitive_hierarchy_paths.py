@@ -2,6 +2,11 @@
 import hou
 
 from ayon_houdini.api import plugin
+from ayon_houdini.api.lib import get_geometry_cook_cache
+from ayon_houdini.api.geometry import (
+    find_empty_string_prims,
+    get_prim_count,
+)
 from ayon_core.pipeline import (
     PublishValidationError,
     OptionalPyblishPluginMixin
@@ -18,6 +23,7 @@ class AddDefaultPathAction(RepairAction):
 
 
 class ValidatePrimitiveHierarchyPaths(plugin.HoudiniInstancePlugin,
+                                      plugin.HoudiniCachedValidatorMixin,
                                       OptionalPyblishPluginMixin):
     """Validate all primitives build hierarchy from attribute when enabled.
 
@@ -36,6 +42,9 @@ class ValidatePrimitiveHierarchyPaths(plugin.HoudiniInstancePlugin,
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         invalid = self.get_invalid(instance)
         if invalid:
             nodes = [n.path() for n in invalid]
@@ -44,6 +53,8 @@ class ValidatePrimitiveHierarchyPaths(plugin.HoudiniInstancePlugin,
                 title=self.label
             )
 
+        self.set_validation_passed(instance)
+
     @classmethod
     def get_invalid(cls, instance):
 
@@ -87,13 +98,13 @@ class ValidatePrimitiveHierarchyPaths(plugin.HoudiniInstancePlugin,
 
         # Check if the primitive attribute exists
         frame = instance.data.get("frameStart", 0)
-        geo = output_node.geometryAtFrame(frame)
+        geo = get_geometry_cook_cache(instance.context).get(output_node, frame)
 
         # If there are no primitives on the current frame then we can't
         # check whether the path names are correct. So we'll just issue a
         # warning that the check can't be done consistently and skip
         # validation.
-        if len(geo.iterPrims()) == 0:
+        if get_prim_count(geo) == 0:
             cls.log.warning(
                 "No primitives found on current frame. Validation"
                 " for primitive hierarchy paths will be skipped,"
@@ -118,12 +129,11 @@ class ValidatePrimitiveHierarchyPaths(plugin.HoudiniInstancePlugin,
             )
             return [output_node]
 
-        paths = geo.primStringAttribValues(path_attr)
         # Ensure all primitives are set to a valid path
         # Collect all invalid primitive numbers
-        invalid_prims = [i for i, path in enumerate(paths) if not path]
-        if invalid_prims:
-            num_prims = len(geo.iterPrims())  # faster than len(geo.prims())
+        invalid_prims = find_empty_string_prims(geo, path_attr)
+        if len(invalid_prims):
+            num_prims = get_prim_count(geo)
             cls.log.info(
                 "Prims have no value for attribute `%s` "
                 "(%s of %s prims)", path_attr, len(invalid_prims), num_prims
@@ -1,6 +1,6 @@
 import inspect
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 import pyblish.api
 import clique
@@ -13,22 +13,28 @@ from ayon_core.pipeline import (
 
 from ayon_houdini.api import plugin
 from ayon_houdini.api.action import SelectInvalidAction
+from ayon_houdini.api.file_sequence import FileSequence
 
 
-def get_instance_expected_files(instance: pyblish.api.Instance) -> List[str]:
-    """Get the expected source render files for the instance."""
+def get_instance_expected_sequences(
+    instance: pyblish.api.Instance
+) -> List[Union[FileSequence, str]]:
+    """Get the expected source render file sequences for the instance.
+
+    Lists of files are assembled into file sequences, files that are not
+    part of a sequence are returned as single filepaths.
+    """
     # Prefer 'expectedFiles' over 'frames' because it usually contains more
     # output files than just a single file or single sequence of files.
-    expected_files: List[Dict[str, List[str]]] = (
+    expected_files: List[Dict[str, Union[FileSequence, List[str], str]]] = (
         instance.data.get("expectedFiles", [])
     )
-    filepaths: List[str] = []
+    file_lists: List[Union[FileSequence, List[str], str]] = []
     if expected_files:
         # Products with expected files
         # This can be Render products or submitted cache to farm.
         for expected in expected_files:
-            for sequence_files in expected.values():
-                filepaths.extend(sequence_files)
+            file_lists.extend(expected.values())
     else:
         # Products with frames or single file.
         staging_dir = instance.data.get("stagingDir")
@@ -38,12 +44,38 @@ def get_instance_expected_files(instance: pyblish.api.Instance) -> List[str]:
 
         if isinstance(frames, str):
             # single file.
-            filepaths.append(f"{staging_dir}/{frames}")
+            file_lists.append(f"{staging_dir}/{frames}")
         else:
             # list of frames
-            filepaths.extend(f"{staging_dir}/{frame}" for frame in frames)
+            file_lists.append([f"{staging_dir}/{frame}" for frame in frames])
+
+    sequences: List[Union[FileSequence, str]] = []
+    for files in file_lists:
+        if isinstance(files, FileSequence):
+            sequences.append(files)
+        elif isinstance(files, str):
+            sequences.append(files.replace("\\", "/"))
+        else:
+            collections, remainder = clique.assemble(files)
+            sequences.extend(
+                FileSequence.from_collection(collection)
+                for collection in collections
+            )
+            sequences.extend(path.replace("\\", "/") for path in remainder)
+    return sequences
+
 
-    return filepaths
+def get_overlapping_paths(
+        sequence_a: FileSequence,
+        sequence_b: FileSequence) -> List[str]:
+    """Return the filepaths two file sequences have in common."""
+    if sequence_a.padding == sequence_b.padding:
+        frames = sequence_a.frame_set.intersection(sequence_b.frame_set)
+        return [sequence_a.path(frame) for frame in sorted(frames)]
+
+    # Differently padded frame numbers can still result in the same path
+    # e.g. `%d` and `%04d` for frame 1000, so compare the actual paths
+    return sorted(set(sequence_a).intersection(sequence_b))
 
 
 class ValidateRenderProductPathsUnique(plugin.HoudiniContextPlugin,
@@ -97,7 +129,10 @@ class ValidateRenderProductPathsUnique(plugin.HoudiniContextPlugin,
         if not instances:
             return
 
-        # Get expected rendered filepaths
+        # Get expected rendered file sequences grouped by their path without
+        # the frame number, so that only sequences which can write the same
+        # files are compared frame by frame.
+        sequences_by_pattern = defaultdict(list)
         paths_to_instance_id = defaultdict(list)
         for instance in instances:
             # Skip the original instance when local rendering and those have
@@ -106,16 +141,37 @@ class ValidateRenderProductPathsUnique(plugin.HoudiniContextPlugin,
             if not instance.data.get("integrate", True):
                 continue
 
-            for filepath in get_instance_expected_files(instance):
-                paths_to_instance_id[filepath].append(instance.id)
+            for sequence in get_instance_expected_sequences(instance):
+                if isinstance(sequence, FileSequence):
+                    key = (sequence.head, sequence.tail)
+                    sequences_by_pattern[key].append((instance.id, sequence))
+                else:
+                    paths_to_instance_id[sequence].append(instance.id)
 
         # Get invalid instances by instance.id
         invalid_instance_ids = set()
         invalid_paths = []
+        for entries in sequences_by_pattern.values():
+            for index, (instance_id_a, sequence_a) in enumerate(entries):
+                for instance_id_b, sequence_b in entries[index + 1:]:
+                    overlap = get_overlapping_paths(sequence_a, sequence_b)
+                    if overlap:
+                        invalid_instance_ids.update(
+                            {instance_id_a, instance_id_b})
+                        invalid_paths.extend(overlap)
+
         for path, path_instance_ids in paths_to_instance_id.items():
+            # Single files may also be a frame of a file sequence
+            for (head, tail), entries in sequences_by_pattern.items():
+                if not (path.startswith(head) and path.endswith(tail)):
+                    continue
+                path_instance_ids = path_instance_ids + [
+                    instance_id for instance_id, sequence in entries
+                    if path in sequence
+                ]
+
             if len(path_instance_ids) > 1:
-                for path_instance_d in path_instance_ids:
-                    invalid_instance_ids.add(path_instance_d)
+                invalid_instance_ids.update(path_instance_ids)
                 invalid_paths.append(path)
 
         if not invalid_instance_ids:
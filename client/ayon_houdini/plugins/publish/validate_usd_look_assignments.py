@@ -40,6 +40,7 @@ def has_material(prim: Usd.Prim,
 
 
 class ValidateUsdLookAssignments(plugin.HoudiniInstancePlugin,
+                                 plugin.HoudiniCachedValidatorMixin,
                                  OptionalPyblishPluginMixin):
     """Validate all geometry prims have a material binding.
 
@@ -49,6 +50,7 @@ class ValidateUsdLookAssignments(plugin.HoudiniInstancePlugin,
     """
 
     order = pyblish.api.ValidatorOrder
+    uses_collected_stage = True
     families = ["look"]
     hosts = ["houdini"]
     label = "Validate All Geometry Has Material Assignment"
@@ -68,6 +70,9 @@ class ValidateUsdLookAssignments(plugin.HoudiniInstancePlugin,
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         # Get Usd.Stage from "Collect ROP Sdf Layers and USD Stage" plug-in
         stage = instance.data.get("stage")
         if not stage:
@@ -98,6 +103,8 @@ class ValidateUsdLookAssignments(plugin.HoudiniInstancePlugin,
                 description=self.get_description()
             )
 
+        self.set_validation_passed(instance)
+
     @staticmethod
     def get_description():
         return inspect.cleandoc(
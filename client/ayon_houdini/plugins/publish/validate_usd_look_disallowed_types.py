@@ -19,6 +19,7 @@ def get_applied_items(list_proxy) -> List[Union[Sdf.Reference, Sdf.Payload]]:
 
 
 class ValidateUsdLookDisallowedTypes(plugin.HoudiniInstancePlugin,
+                                     plugin.HoudiniCachedValidatorMixin,
                                      OptionalPyblishPluginMixin):
     """Validate no meshes are defined in the look.
 
@@ -31,6 +32,7 @@ class ValidateUsdLookDisallowedTypes(plugin.HoudiniInstancePlugin,
     """
 
     order = pyblish.api.ValidatorOrder
+    uses_collected_stage = True
     families = ["look"]
     hosts = ["houdini"]
     label = "Validate Look No Disallowed Types"
@@ -47,6 +49,9 @@ class ValidateUsdLookDisallowedTypes(plugin.HoudiniInstancePlugin,
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         # Get Sdf.Layers from "Collect ROP Sdf Layers and USD Stage" plug-in
         layers = instance.data.get("layers")
         if not layers:
@@ -109,6 +114,8 @@ class ValidateUsdLookDisallowedTypes(plugin.HoudiniInstancePlugin,
                 description=self.get_description()
             )
 
+        self.set_validation_passed(instance)
+
     @staticmethod
     def get_description():
         return inspect.cleandoc(
@@ -15,10 +15,12 @@ from ayon_houdini.api import plugin
 
 
 class ValidateLookShaderDefs(plugin.HoudiniInstancePlugin,
+                             plugin.HoudiniCachedValidatorMixin,
                              OptionalPyblishPluginMixin):
     """Validate Material primitives are defined types instead of overs"""
 
     order = pyblish.api.ValidatorOrder
+    uses_collected_stage = True
     families = ["look"]
     hosts = ["houdini"]
     label = "Validate Look Shaders Are Defined"
@@ -35,6 +37,9 @@ class ValidateLookShaderDefs(plugin.HoudiniInstancePlugin,
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         # Get Sdf.Layers from "Collect ROP Sdf Layers and USD Stage" plug-in
         layers = instance.data.get("layers")
         if not layers:
@@ -96,6 +101,8 @@ class ValidateLookShaderDefs(plugin.HoudiniInstancePlugin,
                 description=self.get_description()
             )
 
+        self.set_validation_passed(instance)
+
     @staticmethod
     def get_description():
         return inspect.cleandoc(
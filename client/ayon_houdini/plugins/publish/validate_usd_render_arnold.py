@@ -140,6 +140,7 @@ class ValidateUSDRenderArnoldSettings(plugin.HoudiniInstancePlugin):
     """Validate USD Render Product names are correctly set absolute paths."""
 
     order = pyblish.api.ValidatorOrder
+    uses_collected_stage = True
     families = ["usdrender"]
     hosts = ["houdini"]
     label = "Validate USD Render Arnold Settings"
@@ -209,6 +210,7 @@ class ValidateUSDRenderCamera(plugin.HoudiniInstancePlugin):
     """
 
     order = pyblish.api.ValidatorOrder
+    uses_collected_stage = True
     families = ["usdrender"]
     hosts = ["houdini"]
     label = "Validate USD Render Camera"
@@ -16,6 +16,7 @@ class ValidateUSDRopDefaultPrim(plugin.HoudiniInstancePlugin):
     """Validate the default prim exists if default prim value is set on ROP"""
 
     order = pyblish.api.ValidatorOrder
+    uses_collected_stage = True
     families = ["usdrop"]
     hosts = ["houdini"]
     label = "Validate USD ROP Default Prim"
@@ -8,7 +8,11 @@ from ayon_core.pipeline import (
 )
 
 from ayon_houdini.api import plugin
-from ayon_houdini.api.lib import update_mode_context
+from ayon_houdini.api.geometry import find_prims_not_of_type
+from ayon_houdini.api.lib import (
+    get_geometry_cook_cache,
+    get_sample_frames,
+)
 from ayon_houdini.api.action import SelectInvalidAction
 
 
@@ -45,16 +49,8 @@ def group_consecutive_numbers(nums):
         yield _result(start, end)
 
 
-def get_geometry_at_frame(sop_node, frame, force=True):
-    """Return geometry at frame but force a cooked value."""
-    if not hasattr(sop_node, "geometry"):
-        return
-    with update_mode_context(hou.updateMode.AutoUpdate):
-        sop_node.cook(force=force, frame_range=(frame, frame))
-        return sop_node.geometryAtFrame(frame)
-
-
 class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin,
+                            plugin.HoudiniCachedValidatorMixin,
                             OptionalPyblishPluginMixin):
     """Validate that the node connected to the output node is of type VDB.
 
@@ -64,7 +60,8 @@ class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin,
     vertices since each VDB primitive is one point, one vertex and one VDB.
 
     This validation only checks the geometry on the first frame of the export
-    frame range for optimization purposes.
+    frame range for optimization purposes, unless more `sample_frames` are
+    set to be checked.
 
     A VDB is an inherited type of Prim, holds the following data:
         - Primitives: 1
@@ -79,10 +76,16 @@ class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin,
     label = "Validate Output Node (VDB)"
     actions = [SelectInvalidAction]
 
+    # Frames of the export frame range to check: first, middle and/or last
+    sample_frames = ["first"]
+
     def process(self, instance):
         if not self.is_active(instance.data):
             return
 
+        if self.is_validation_cached(instance):
+            return
+
         invalid_nodes, message = self.get_invalid_with_message(instance)
         if invalid_nodes:
 
@@ -100,6 +103,8 @@ class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin,
                 }
             )
 
+        self.set_validation_passed(instance)
+
     @classmethod
     def get_invalid_with_message(cls, instance):
 
@@ -112,8 +117,19 @@ class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin,
             )
             return [hou.node(instance_node), error]
 
-        frame = instance.data.get("frameStart", 0)
-        geometry = get_geometry_at_frame(node, frame)
+        cache = get_geometry_cook_cache(instance.context)
+        frames = get_sample_frames(instance, cls.sample_frames or ["first"])
+        for frame in frames:
+            geometry = cache.get(node, frame, force=True)
+            invalid_node, error = cls.validate_geometry(node, geometry, frame)
+            if error:
+                return [invalid_node, error]
+
+        return [None, None]
+
+    @classmethod
+    def validate_geometry(cls, node, geometry, frame):
+        """Return invalid node and error message for geometry at a frame."""
         if geometry is None:
             # No geometry data on this node, maybe the node hasn't cooked?
             error = (
@@ -125,11 +141,11 @@ class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin,
         num_prims = geometry.intrinsicValue("primitivecount")
         num_points = geometry.intrinsicValue("pointcount")
         if num_prims == 0 and num_points == 0:
-            # Since we are only checking the first frame it doesn't mean there
+            # Since we are only checking sampled frames it doesn't mean there
             # won't be VDB prims in a few frames. As such we'll assume for now
             # the user knows what he or she is doing
             cls.log.warning(
-                "SOP node `{}` has no primitives on start frame {}. "
+                "SOP node `{}` has no primitives on frame {}. "
                 "Validation is skipped and it is assumed elsewhere in the "
                 "frame range VDB prims and only VDB prims will exist."
                 "".format(node.path(), int(frame))
@@ -141,10 +157,9 @@ class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin,
         if num_prims != num_vdb_prims:
             # There's at least one primitive that is not a VDB.
             # Search them and report them to the artist.
-            prims = geometry.prims()
-            invalid_prims = [prim for prim in prims
-                             if not isinstance(prim, hou.VDB)]
-            if invalid_prims:
+            invalid_prims = find_prims_not_of_type(
+                geometry, hou.primType.VDB)
+            if len(invalid_prims):
                 # Log prim numbers as consecutive ranges so logging isn't very
                 # slow for large number of primitives
                 error = (
@@ -152,7 +167,7 @@ class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin,
                     "Primitive indices {} are not VDB primitives.".format(
                         node.path(),
                         ", ".join(group_consecutive_numbers(
-                            prim.number() for prim in invalid_prims
+                            invalid_prims.tolist()
                         ))
                     )
                 )
@@ -27,7 +27,7 @@ class ValidateWorkfilePaths(
     def process(self, instance):
         if not self.is_active(instance.data):
             return
-        invalid = self.get_invalid()
+        invalid = self.get_invalid(instance)
         self.log.debug(
             "Checking node types: {}".format(", ".join(self.node_types)))
         self.log.debug(
@@ -61,16 +61,14 @@ class ValidateWorkfilePaths(
             raise PublishValidationError(message, title=self.label)
 
     @classmethod
-    def get_invalid(cls):
-        invalid = []
-        for param, _ in hou.fileReferences():
-            # it might return None for some reason
-            if not param:
-                continue
-            # skip nodes we are not interested in
-            if param.node().type().name() not in cls.node_types:
-                continue
+    def get_invalid(cls, instance=None):
+        """Return file parms with prohibited vars of nodes of `node_types`.
 
+        The result is cached on the instance so that repair does not need
+        to scan the scene again.
+        """
+        invalid = []
+        for param in cls.iter_file_parms():
             if param.keyframes():
                 # Calling `.unexpandedString()` below fails if param has
                 # keyframes - so for now we will skip those params. These are
@@ -82,14 +80,57 @@ class ValidateWorkfilePaths(
                     if v in param.unexpandedString()):
                 invalid.append(param)
 
+        if instance is not None:
+            instance.data["invalidWorkfilePathParms"] = invalid
+        return invalid
+
+    @classmethod
+    def iter_file_parms(cls):
+        """Yield file reference parms of nodes of the configured types.
+
+        Only instances of the configured node types are visited, instead of
+        evaluating all file references in the scene.
+        """
+        for category in hou.nodeTypeCategories().values():
+            for type_name in set(cls.node_types):
+                node_type = category.nodeType(type_name)
+                if node_type is None:
+                    continue
+                for node in node_type.instances():
+                    for param in node.parms():
+                        template = param.parmTemplate()
+                        if (
+                            template.type() == hou.parmTemplateType.String
+                            and template.stringType()
+                            == hou.stringParmType.FileReference
+                        ):
+                            yield param
+
+    @classmethod
+    def get_cached_invalid(cls, instance):
+        """Return invalid parms found on last validation if still invalid."""
+        cached = instance.data.get("invalidWorkfilePathParms")
+        if cached is None:
+            return cls.get_invalid(instance)
+
+        invalid = []
+        for param in cached:
+            try:
+                value = param.unexpandedString()
+            except hou.Error:
+                # Node was deleted or param got keyframes since validation
+                continue
+            if any(v for v in cls.prohibited_vars if v in value):
+                invalid.append(param)
         return invalid
 
     @classmethod
     def repair(cls, instance):
-        invalid = cls.get_invalid()
+        invalid = cls.get_cached_invalid(instance)
         for param in invalid:
             cls.log.info("Processing: {}".format(param.path()))
             cls.log.info("Replacing {} for {}".format(
                 param.unexpandedString(),
                 hou.text.expandString(param.unexpandedString())))
             param.set(hou.text.expandString(param.unexpandedString()))
+        instance.data.pop("invalidWorkfilePathParms", None)
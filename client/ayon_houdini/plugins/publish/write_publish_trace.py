@@ -0,0 +1,38 @@
+import pyblish.api
+
+from ayon_houdini.api.profiling import get_publish_profile
+
+
+class WritePublishTrace(pyblish.api.ContextPlugin):
+    """Write the publish profile as Chrome trace file.
+
+    Runs last so the trace includes all profiled plug-ins of the publish.
+    Only does anything when "Publish Profiling" is enabled.
+
+    """
+
+    label = "Write Publish Trace"
+    order = pyblish.api.IntegratorOrder + 10.0
+    hosts = ["houdini"]
+
+    def process(self, context):
+        profile = get_publish_profile(context)
+        if profile is None or not profile.trace_path:
+            return
+
+        profile.write()
+        self.log.debug(f"Wrote publish trace to: {profile.trace_path}")
+
+
+class WriteValidationTrace(WritePublishTrace):
+    """Write the publish profile as Chrome trace file after validation.
+
+    Clicking Validate in the publisher stops after the validators, so the
+    trace written after integration is never reached when validation
+    passes. The trace written here is overwritten by the complete trace
+    when the publish continues.
+
+    """
+
+    label = "Write Validation Trace"
+    order = pyblish.api.ValidatorOrder + 0.5
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 """AYON startup script."""
-from ayon_core.pipeline import install_host
-from ayon_houdini.api import HoudiniHost
+from ayon_houdini.api.import_report import report_imports
 
 
 def main():
+    from ayon_core.pipeline import install_host
+    from ayon_houdini.api import HoudiniHost
+
     print("Installing AYON ...")
     install_host(HoudiniHost())
 
 
-main()
+with report_imports():
+    main()
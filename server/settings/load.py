@@ -43,6 +43,17 @@ class LayoutLoaderModel(BaseSettingsModel):
             "loader if they were added as members of the container."
         )
     )
+    instance_elements: bool = SettingsField(
+        False,
+        title="Instance Repeated Elements",
+        description=(
+            "Load each unique representation in the layout only once and "
+            "place it on all of its elements as packed instances through "
+            "copy to points, instead of loading a container per element. "
+            "Memory and load time then scale with the unique assets instead "
+            "of the amount of elements."
+        )
+    )
 
 
 # Load Plugins
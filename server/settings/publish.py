@@ -4,6 +4,31 @@ from ayon_server.settings import (
 )
 
 
+class PublishProfilingModel(BaseSettingsModel):
+    """Record wall, CPU and Houdini cook time per publish plug-in.
+
+    The trace file is written next to the workfile and can be opened in
+    `chrome://tracing` or https://ui.perfetto.dev.
+    """
+    enabled: bool = SettingsField(False, title="Enabled")
+    write_trace: bool = SettingsField(
+        True,
+        title="Write Chrome Trace File",
+        description=(
+            "Write '<workfile>.publish_trace.<timestamp>.json' next to the "
+            "workfile."
+        )
+    )
+    record_cook_time: bool = SettingsField(
+        False,
+        title="Record Houdini Cook Time",
+        description=(
+            "Record time spent cooking nodes per plug-in using the Houdini "
+            "Performance Monitor. This adds some overhead to the publish."
+        )
+    )
+
+
 # Publish Plugins
 class CollectAssetHandlesModel(BaseSettingsModel):
     """Collect Frame Range
@@ -106,6 +131,18 @@ class BasicEnabledStatesModel(BaseSettingsModel):
     active: bool = SettingsField(title="Active")
 
 
+class ValidationResultCacheModel(BaseSettingsModel):
+    enabled: bool = SettingsField(
+        False,
+        title="Enabled",
+        description=(
+            "Skip expensive validators on re-validation when the instance's "
+            "ROP, output node and all nodes they depend on are unchanged "
+            "since the validator last passed."
+        )
+    )
+
+
 class ValidateUsdLookDisallowedTypesModel(BasicEnabledStatesModel):
     disallowed_types: list[str] = SettingsField(
         default_factory=list,
@@ -121,6 +158,136 @@ class ValidateUsdLookDisallowedTypesModel(BasicEnabledStatesModel):
     )
 
 
+def sample_frames_enum():
+    return [
+        {"label": "First Frame", "value": "first"},
+        {"label": "Middle Frame", "value": "middle"},
+        {"label": "Last Frame", "value": "last"}
+    ]
+
+
+class ValidateVDBOutputNodeModel(BasicEnabledStatesModel):
+    sample_frames: list[str] = SettingsField(
+        default_factory=lambda: ["first"],
+        title="Sample Frames",
+        enum_resolver=sample_frames_enum,
+        description=(
+            "Frames of the export frame range to validate the output "
+            "geometry at. The geometry is cooked once per frame and shared "
+            "with other validators."
+        )
+    )
+
+
+def recook_strategy_enum():
+    return [
+        {"label": "Current Frame", "value": "current"},
+        {"label": "Sample Start, Middle and End", "value": "sample"},
+        {"label": "Bisect Frame Range", "value": "bisect"}
+    ]
+
+
+class ValidateNoErrorsModel(BasicEnabledStatesModel):
+    recook_strategy: str = SettingsField(
+        "current",
+        title="Recook Strategy",
+        enum_resolver=recook_strategy_enum,
+        description=(
+            "Frames to recook a node with errors at to check whether the "
+            "errors are up to date. The current frame is cooked first and "
+            "cooking stops at the first frame without errors."
+        )
+    )
+    max_cook_time: float = SettingsField(
+        30.0,
+        ge=0.0,
+        title="Max Cook Time",
+        description=(
+            "Maximum seconds to spend recooking a node with errors. "
+            "Zero means no limit."
+        )
+    )
+    max_recook_frames: int = SettingsField(
+        8,
+        ge=1,
+        title="Max Recook Frames",
+        description=(
+            "Maximum amount of frames to recook a node with errors at, "
+            "e.g. to bound bisecting a frame range with persistent errors."
+        )
+    )
+
+
+class ExtractLastPublishedModel(BaseSettingsModel):
+    max_workers: int = SettingsField(
+        8,
+        ge=1,
+        title="Max Copy Threads",
+        description=(
+            "Maximum amount of files copied concurrently from the last "
+            "published version when rendering frames to fix."
+        )
+    )
+    use_hardlinks: bool = SettingsField(
+        False,
+        title="Use Hardlinks",
+        description=(
+            "Hardlink files from the last published version when the "
+            "staging directory is on the same filesystem and reflinks are "
+            "not supported. A hardlinked staging file shares its content "
+            "with the published file, so overwriting it in-place also "
+            "changes the published file."
+        )
+    )
+
+
+class ExtractROPModel(BaseSettingsModel):
+    local_parallel_workers: int = SettingsField(
+        0,
+        ge=0,
+        title="Local Parallel Workers",
+        description=(
+            "Amount of background hython processes used by the "
+            "'Local parallel rendering' render target. Each worker uses a "
+            "Houdini batch license. Zero uses half of the CPU cores."
+        )
+    )
+
+
+class ExtractROPsConcurrentlyModel(BaseSettingsModel):
+    enabled: bool = SettingsField(title="Enabled")
+    max_workers: int = SettingsField(
+        0,
+        ge=0,
+        title="Max Workers",
+        description=(
+            "Maximum amount of concurrent background hython processes. Each "
+            "worker uses a Houdini batch license. Zero uses half of the CPU "
+            "cores."
+        )
+    )
+
+
+class ExtractRenderTelemetryModel(BaseSettingsModel):
+    enabled: bool = SettingsField(title="Enabled")
+    write_sidecar: bool = SettingsField(
+        True,
+        title="Write JSON Sidecar",
+        description=(
+            "Write the render telemetry to a JSON file next to the "
+            "ROP's output files."
+        )
+    )
+    add_to_version_data: bool = SettingsField(
+        False,
+        title="Add To Version Data",
+        description=(
+            "Store a summary of the render telemetry in the published "
+            "version's data."
+        )
+    )
+
+
 class ExtractUsdModel(BaseSettingsModel):
     use_ayon_entity_uri: bool = SettingsField(
         False,
@@ -133,6 +300,11 @@ class ExtractUsdModel(BaseSettingsModel):
 
 
 class PublishPluginsModel(BaseSettingsModel):
+    PublishProfiling: PublishProfilingModel = SettingsField(
+        default_factory=PublishProfilingModel,
+        title="Publish Profiling",
+        section="Profiling"
+    )
     CollectAssetHandles: CollectAssetHandlesModel = SettingsField(
         default_factory=CollectAssetHandlesModel,
         title="Collect Asset Handles",
@@ -150,12 +322,15 @@ class PublishPluginsModel(BaseSettingsModel):
         default_factory=CollectLocalRenderInstancesModel,
         title="Collect Local Render Instances"
     )
+    ValidationResultCache: ValidationResultCacheModel = SettingsField(
+        default_factory=ValidationResultCacheModel,
+        title="Validation Result Cache",
+        section="Validators")
     ValidateAbcPrimitiveToDetail: BasicEnabledStatesModel = SettingsField(
         default_factory=BasicEnabledStatesModel,
         title="Validate Abc Primitive To Detail",
         description="Validate Alembic ROP Primitive to Detail "
-                    "attribute is consistent.",
-        section="Validators")
+                    "attribute is consistent.")
     ValidateAlembicInputNode: BasicEnabledStatesModel = SettingsField(
         default_factory=BasicEnabledStatesModel,
         title="Validate Alembic Input Node",
@@ -179,8 +354,8 @@ class PublishPluginsModel(BaseSettingsModel):
     ValidateMeshIsStatic: BasicEnabledStatesModel = SettingsField(
         default_factory=BasicEnabledStatesModel,
         title="Validate Mesh is Static")
-    ValidateNoErrors: BasicEnabledStatesModel = SettingsField(
-        default_factory=BasicEnabledStatesModel,
+    ValidateNoErrors: ValidateNoErrorsModel = SettingsField(
+        default_factory=ValidateNoErrorsModel,
         title="Validate No Errors",
         description="Validate the Instance has no current cooking errors."
     )
@@ -201,8 +376,8 @@ class PublishPluginsModel(BaseSettingsModel):
     ValidateUnrealStaticMeshName: BasicEnabledStatesModel = SettingsField(
         default_factory=BasicEnabledStatesModel,
         title="Validate Unreal Static Mesh Name")
-    ValidateVDBOutputNode: BasicEnabledStatesModel = SettingsField(
-        default_factory=BasicEnabledStatesModel,
+    ValidateVDBOutputNode: ValidateVDBOutputNodeModel = SettingsField(
+        default_factory=ValidateVDBOutputNodeModel,
         title="Validate VDB Output Node",
         description="Validate that the node connected to "
                     "the output node is of type VDB."
@@ -234,6 +409,30 @@ class PublishPluginsModel(BaseSettingsModel):
         title="Extract Active View Thumbnail",
         section="Extractors"
     )
+    ExtractLastPublished: ExtractLastPublishedModel = SettingsField(
+        default_factory=ExtractLastPublishedModel,
+        title="Extract Last Published"
+    )
+    ExtractROP: ExtractROPModel = SettingsField(
+        default_factory=ExtractROPModel,
+        title="Extract ROP"
+    )
+    ExtractROPsConcurrently: ExtractROPsConcurrentlyModel = SettingsField(
+        default_factory=ExtractROPsConcurrentlyModel,
+        title="Extract ROPs Concurrently",
+        description=(
+            "Render independent local cache instances concurrently in "
+            "background hython processes."
+        )
+    )
+    ExtractRenderTelemetry: ExtractRenderTelemetryModel = SettingsField(
+        default_factory=ExtractRenderTelemetryModel,
+        title="Extract Render Telemetry",
+        description=(
+            "Record render time per frame, output size and peak memory "
+            "usage of rendered ROPs."
+        )
+    )
     ExtractUSD: ExtractUsdModel = SettingsField(
         default_factory=ExtractUsdModel,
         title="Extract USD"
@@ -241,6 +440,11 @@ class PublishPluginsModel(BaseSettingsModel):
 
 
 DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
+    "PublishProfiling": {
+        "enabled": False,
+        "write_trace": True,
+        "record_cook_time": False
+    },
     "CollectAssetHandles": {
         "use_asset_handles": True
     },
@@ -266,6 +470,9 @@ DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
             ]
         }
     },
+    "ValidationResultCache": {
+        "enabled": False
+    },
     "ValidateAbcPrimitiveToDetail": {
         "enabled": True,
         "optional": False,
@@ -299,7 +506,10 @@ DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
     "ValidateNoErrors": {
         "enabled": True,
         "optional": False,
-        "active": True
+        "active": True,
+        "recook_strategy": "current",
+        "max_cook_time": 30.0,
+        "max_recook_frames": 8
     },
     "ValidateSingleFrame": {
         "enabled": True,
@@ -329,7 +539,8 @@ DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
     "ValidateVDBOutputNode": {
         "enabled": True,
         "optional": False,
-        "active": True
+        "active": True,
+        "sample_frames": ["first"]
     },
     "ValidateWorkfilePaths": {
         "enabled": True,
@@ -374,6 +585,22 @@ DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
         "optional": False,
         "active": True
     },
+    "ExtractLastPublished": {
+        "max_workers": 8,
+        "use_hardlinks": False
+    },
+    "ExtractROP": {
+        "local_parallel_workers": 0
+    },
+    "ExtractROPsConcurrently": {
+        "enabled": False,
+        "max_workers": 0
+    },
+    "ExtractRenderTelemetry": {
+        "enabled": False,
+        "write_sidecar": True,
+        "add_to_version_data": False
+    },
     "ExtractUSD": {
         "use_ayon_entity_uri": False
     }